@@ -70,23 +70,32 @@ from biokit1.tools import (
     get_reverse_complement,
     complement_sequence,
     calculate_codon_frequency,
-    plot_codon_histogram,
     gc_content_sliding_window,
-    plot_gc_distribution,
     transcribe_dna,
     translate_dna,
-    display_translation_view,
+    translate_six_frames,
     count_nucleotides,
     find_palindromes,
     calculate_tm,
     calculate_molecular_weight,
 )
 
-from biokit1.components import display_sequence, dna_input_box, plot_nucleotide_composition
-from biokit2.tools import (render_motif_finder,render_orf_finder,render_splice_site_predictor,
-                           render_codon_optimizer,render_microsatellite_finder,render_restriction_mapper,
-                           render_palindrome_inverted,render_sequence_complexity_tool,
-                           render_mutation_hotspot_tool,render_optimal_primer_designer_tool)
+from biokit.encoded_sequence import EncodedSequence
+from biokit2.data.genetic_code import NCBI_GENETIC_CODES
+from biokit1.components import (display_sequence, display_translation_view, dna_input_box, fasta_upload_box,
+                                indexed_region_box, plot_nucleotide_composition, plot_codon_histogram,
+                                plot_gc_distribution, render_batch_runner)
+from biokit2.tools.motif_finder.motif_component import render_motif_finder
+from biokit2.tools.orf_finder.orf_component import render_orf_finder
+from biokit2.tools.splice_side_predictor.splice_component import render_splice_site_predictor
+from biokit2.tools.codon_optimization.codon_optimizer_component import render_codon_optimizer
+from biokit2.tools.microsatellite_finder.microsatellite_component import render_microsatellite_finder
+from biokit2.tools.restriction_site.restriction_component import render_restriction_mapper
+from biokit2.tools.palindrome_inverted.palindrome_inverted_component import render_palindrome_inverted
+from biokit2.tools.sequence_complexity.seq_complexity_component import render_sequence_complexity_tool
+from biokit2.tools.mutation_hotspot.mutation_hotspot_component import render_mutation_hotspot_tool
+from biokit2.tools.primer_design.primer_design_component import render_optimal_primer_designer_tool
+from biokit2.tools.pwm_scanner.pwm_component import render_pwm_scanner
 
 # Header
 st.markdown("""
@@ -98,47 +107,20 @@ st.markdown("""
 
 
 # Tabs
-tab1, tab2 = st.tabs(["🧬 BioKit 1", "🔥 BioKit 2"])
+tab1, tab2, tab3 = st.tabs(["🧬 BioKit 1", "🔥 BioKit 2", "📦 Batch Mode"])
 
 # ----------------- BioKit 1 -----------------
 with tab1:
     st.subheader("BioKit 1: Basic Tools")
-    input_mode = st.radio("Choose Input Mode:", ["Upload FASTA File", "Write Your Own", "Use Sample Sequence"], horizontal=True, key="radio_bio1")
+    input_mode = st.radio("Choose Input Mode:", ["Upload FASTA File", "Indexed FASTA Region", "Write Your Own", "Use Sample Sequence"], horizontal=True, key="radio_bio1")
 
     seq = ""
 
     if input_mode == "Upload FASTA File":
-        fasta_file = st.file_uploader(
-            "Upload a FASTA file",
-            type=["fasta", "fa", "txt"],
-            key="fasta_bio1"
-        )
-
-        if fasta_file:
-            content = fasta_file.read().decode("utf-8", errors="ignore").strip().splitlines()
-
-            sequences = {}
-            current_header = None
-            for line in content:
-                line = line.strip()
-                if not line:
-                    continue
-                if line.startswith(">"):
-                    current_header = line[1:].strip()
-                    sequences[current_header] = ""
-                else:
-                    sequences[current_header] += line.replace(" ", "").upper()
-
-            if sequences:
-                if len(sequences) == 1:
-                    seq_name = list(sequences.keys())[0]
-                else:
-                    seq_name = st.selectbox("Select a sequence", list(sequences.keys()))
-                seq = sequences[seq_name]
-                st.success(f"Selected: {seq_name}")
-                st.code(seq, language="text")
-        else:
-            st.info("Please upload a valid FASTA file.")
+        seq = fasta_upload_box(key="fasta_bio1")
+
+    elif input_mode == "Indexed FASTA Region":
+        seq = indexed_region_box(key="region_bio1")
 
     elif input_mode == "Write Your Own":
          seq = dna_input_box(key="biokit1")
@@ -216,10 +198,11 @@ with tab1:
 
     if seq:
         display_sequence("Original Sequence", seq)
+        encoded_seq = EncodedSequence(seq)  # encoded once, shared by every tool below
 
     if tool == "Reverse Complement":
         if seq:
-            rev_comp = get_reverse_complement(seq)
+            rev_comp = get_reverse_complement(encoded_seq)
             display_sequence("Reverse Complement", rev_comp)
             st.info("""
             **Use case:**  
@@ -229,7 +212,7 @@ with tab1:
 
     elif tool == "Complement Sequence":
         if seq:
-            comp = complement_sequence(seq)
+            comp = complement_sequence(encoded_seq)
             display_sequence("Complement Sequence", comp)
             st.info("""
             **Use case:**  
@@ -256,7 +239,7 @@ with tab1:
             This graph shows the percentage of guanine (G) and cytosine (C) bases 
             across the DNA sequence, calculated over sliding windows of a chosen size.
             """)
-            plot_gc_distribution(seq)
+            plot_gc_distribution(encoded_seq)
             st.info("""
             **Use case:**  
             GC-rich regions tend to be more thermally stable and often mark functional regions like promoters and CpG islands.
@@ -274,10 +257,19 @@ with tab1:
 
     elif tool == "Translation (DNA → Protein)":
         if seq:
-            protein = translate_dna(seq)
+            col1, col2 = st.columns(2)
+            with col1:
+                table = st.selectbox("Genetic code", list(NCBI_GENETIC_CODES),
+                                     format_func=lambda t: f"{t}. {NCBI_GENETIC_CODES[t][0]}", key="translation_table")
+            with col2:
+                through_stops = st.checkbox("Translate through stop codons (*)", value=False)
+            protein = translate_dna(seq, table=table, to_stop=not through_stops)
             rna = transcribe_dna(seq)
             display_sequence("Protein Sequence", protein)
             display_translation_view(seq, rna, protein)
+            with st.expander("Six-frame translation"):
+                for row in translate_six_frames(seq, table=table, to_stop=not through_stops):
+                    display_sequence(f"Frame {row['frame']}", row["protein"])
             st.info("""
             **Use case:**  
             Translation is the process where mRNA is decoded to synthesize proteins.  
@@ -286,10 +278,10 @@ with tab1:
 
     elif tool == "Nucleotide Count":
         if seq:
-            counts = count_nucleotides(seq)
+            counts = count_nucleotides(encoded_seq)
             st.subheader("Nucleotide Counts")
             st.write(counts)
-            plot_nucleotide_composition(seq)
+            plot_nucleotide_composition(encoded_seq)
             st.info("""
             **Use case:**  
             Nucleotide composition gives insights into DNA sequence characteristics, mutation biases, and genomic signatures.  
@@ -299,7 +291,7 @@ with tab1:
     elif tool == "Find Palindromes":
         if seq:
             length = st.number_input("Palindrome Length", min_value=2, max_value=12, value=4, step=1)
-            pals = find_palindromes(seq, length)
+            pals = find_palindromes(encoded_seq, length)
             st.subheader(f"Palindromes of length {length}")
             if pals:
                 for p in pals:
@@ -314,7 +306,14 @@ with tab1:
 
     elif tool == "Melting Temperature":
         if seq:
-            tm = calculate_tm(seq)
+            method = st.radio("Method", ["nearest_neighbor", "empirical"],
+                              format_func=lambda m: "Nearest-neighbor (SantaLucia)" if m == "nearest_neighbor" else "Wallace / GC formula",
+                              horizontal=True, key="tm_method")
+            na_col, mg_col, conc_col = st.columns(3)
+            na = na_col.number_input("Na⁺ (mM)", min_value=1.0, max_value=1000.0, value=50.0, key="tm_na")
+            mg = mg_col.number_input("Mg²⁺ (mM)", min_value=0.0, max_value=20.0, value=0.0, step=0.5, key="tm_mg")
+            dna_conc = conc_col.number_input("Oligo (nM)", min_value=1.0, max_value=10000.0, value=250.0, key="tm_dna_conc")
+            tm = calculate_tm(encoded_seq, method, na=na, mg=mg, dna_conc=dna_conc)
             st.subheader("Melting Temperature (Tm)")
             st.write(f"{tm} °C")
             st.info("""
@@ -324,7 +323,7 @@ with tab1:
 
     elif tool == "Molecular Weight":
         if seq:
-            mw = calculate_molecular_weight(seq)
+            mw = calculate_molecular_weight(encoded_seq)
             st.subheader("Molecular Weight")
             st.write(f"{mw} Daltons")
             st.info("""
@@ -336,42 +335,15 @@ with tab1:
 with tab2:
     st.subheader("BioKit 2: Advanced Tools")
 
-    input_mode = st.radio("Choose Input Mode:", ["Upload FASTA File", "Write Your Own", "Use Sample Sequence"], horizontal=True, key="radio_bio2")
+    input_mode = st.radio("Choose Input Mode:", ["Upload FASTA File", "Indexed FASTA Region", "Write Your Own", "Use Sample Sequence"], horizontal=True, key="radio_bio2")
 
     user_seq = ""
 
     if input_mode == "Upload FASTA File":
-        fasta_file = st.file_uploader(
-            "Upload a FASTA file",
-            type=["fasta", "fa", "txt"],
-            key="fasta_bio2"
-        )
-
-        if fasta_file:
-            content = fasta_file.read().decode("utf-8", errors="ignore").strip().splitlines()
-
-            sequences = {}
-            current_header = None
-            for line in content:
-                line = line.strip()
-                if not line:
-                    continue
-                if line.startswith(">"):
-                    current_header = line[1:].strip()
-                    sequences[current_header] = ""
-                else:
-                    sequences[current_header] += line.replace(" ", "").upper()
-
-            if sequences:
-                if len(sequences) == 1:
-                    seq_name = list(sequences.keys())[0]
-                else:
-                    seq_name = st.selectbox("Select a sequence", list(sequences.keys()))
-                user_seq = sequences[seq_name]
-                st.success(f"Selected: {seq_name}")
-                st.code(user_seq, language="text")
-        else:
-            st.info("Please upload a valid FASTA file.")
+        user_seq = fasta_upload_box(key="fasta_bio2")
+
+    elif input_mode == "Indexed FASTA Region":
+        user_seq = indexed_region_box(key="region_bio2")
 
     elif input_mode == "Write Your Own":
         user_seq = dna_input_box(key="biokit2")
@@ -443,6 +415,7 @@ with tab2:
 
     tool2 = st.selectbox("Choose a BioKit 2 Tool", [
         "Motif Finder",
+        "PWM Scanner",
         "ORF Finder",
         "Splice Site Predictor",
         "Codon Optimization",
@@ -457,6 +430,8 @@ with tab2:
     if user_seq:
         if tool2 == "Motif Finder":
             render_motif_finder(user_seq)
+        elif tool2 == "PWM Scanner":
+            render_pwm_scanner(user_seq)
         elif tool2 == "ORF Finder":
             render_orf_finder(user_seq)
         elif tool2 == "Splice Site Predictor":
@@ -472,7 +447,8 @@ with tab2:
         elif tool2 == "Sequence Complexity Estimator":
             render_sequence_complexity_tool(user_seq)
         elif tool2 == "Mutation Hotspot Detector":
-            render_mutation_hotspot_tool(user_seq)
+            location = st.session_state.get("region_bio2_location") if input_mode == "Indexed FASTA Region" else None
+            render_mutation_hotspot_tool(user_seq, location)
         elif tool2 == "Optimal Primer Designer":
             render_optimal_primer_designer_tool(user_seq)
         else:
@@ -480,6 +456,9 @@ with tab2:
     else:
         st.warning("Please provide a DNA sequence to proceed.")
 
+# ----------------- Batch Mode -----------------
+with tab3:
+    render_batch_runner(key="batch")
 
 
 # Contact
@@ -0,0 +1,10 @@
+# biokit/__init__.py
+# Shared, UI-independent infrastructure used by both BioKit tiers.
+from .fasta_reader import SequenceRecord, iter_records, read_headers, read_record, open_sequence_file
+from .variant_reader import read_contig_lengths, read_variant_positions
+from .faidx import IndexedFasta, FaiEntry, build_fai_index, read_fai, write_fai, parse_region, resolve_reference_path
+from .encoded_sequence import EncodedSequence, as_encoded, encode, decode
+from .kmers import KmerCounter, count_kmers, count_kmers_streaming, kmer_codes, kmer_counts_to_dict, decode_kmer
+from .melting import tm_nn, tm_nn_batch, window_tm, NN_PARAMS
+from .suffix_array import SuffixArrayIndex, build_suffix_array
+from .iupac import IUPAC_BASES, DegenerateMotifSet, find_iupac_motifs, reverse_complement_iupac
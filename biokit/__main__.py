@@ -0,0 +1,5 @@
+import sys
+
+from biokit.cli import main
+
+sys.exit(main())
@@ -0,0 +1,126 @@
+"""
+Sequence Annotation Intervals
+
+Helpers for drawing annotations (motif hits, ORFs, splice sites, ...) over a
+sequence without touching more of it than is shown. An annotation track is a
+list of half-open [start, end) intervals; it is sorted and merged once into
+two monotonic NumPy arrays, after which the intervals overlapping any window
+are found by binary search. Marking a window then costs time proportional to
+the window and the intervals inside it, never to the whole sequence.
+
+Bracket highlighting (mark_intervals) builds its output in a single pass over
+the sorted interval boundaries instead of re-slicing the string per interval.
+"""
+from typing import Iterable, Sequence
+
+import numpy as np
+
+Intervals = Iterable[tuple[int, int]]
+
+
+def merge_intervals(intervals: Intervals) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Sorts and merges overlapping or touching intervals.
+
+    Args:
+        intervals (iterable of (start, end)): Half-open intervals, in any order.
+
+    Returns:
+        tuple: (starts, ends) int64 arrays of disjoint intervals, both increasing.
+    """
+    pairs = np.asarray(list(intervals) if not isinstance(intervals, np.ndarray) else intervals, dtype=np.int64)
+    if not pairs.size:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    pairs = pairs[np.argsort(pairs[:, 0], kind="stable")]
+    starts, ends = pairs[:, 0], np.maximum.accumulate(pairs[:, 1])
+    # A new merged interval begins wherever a start lies past every earlier end.
+    first = np.concatenate(([True], starts[1:] > ends[:-1]))
+    last = np.concatenate((first[1:], [True]))
+    return starts[first], ends[last]
+
+
+def sites_to_intervals(positions: Iterable[int], length: int) -> tuple[np.ndarray, np.ndarray]:
+    """Merged intervals covering `length` bases from each 0-based site position."""
+    starts = np.asarray(list(positions) if not isinstance(positions, np.ndarray) else positions, dtype=np.int64)
+    return merge_intervals(np.column_stack((starts, starts + length)))
+
+
+def intervals_in_window(starts: np.ndarray, ends: np.ndarray, window_start: int,
+                        window_end: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Merged intervals overlapping [window_start, window_end), clipped to it.
+
+    Args:
+        starts, ends (np.ndarray): Output of merge_intervals.
+        window_start, window_end (int): Window in sequence coordinates.
+
+    Returns:
+        tuple: (starts, ends) relative to window_start.
+    """
+    first = np.searchsorted(ends, window_start, side="right")
+    last = np.searchsorted(starts, window_end, side="left")
+    clipped_starts = np.maximum(starts[first:last], window_start) - window_start
+    clipped_ends = np.minimum(ends[first:last], window_end) - window_start
+    return clipped_starts, clipped_ends
+
+
+def window_labels(tracks: Sequence[tuple[np.ndarray, np.ndarray]], window_start: int, window_end: int) -> np.ndarray:
+    """
+    Track label of every base of a window, later tracks drawn over earlier ones.
+
+    Args:
+        tracks (sequence of (starts, ends)): Merged interval arrays, one per track.
+        window_start, window_end (int): Window in sequence coordinates.
+
+    Returns:
+        np.ndarray: uint8 array of window length; 0 = unannotated, i + 1 = tracks[i].
+    """
+    size = max(window_end - window_start, 0)
+    labels = np.zeros(size, dtype=np.uint8)
+    for label, (starts, ends) in enumerate(tracks, 1):
+        local_starts, local_ends = intervals_in_window(starts, ends, window_start, window_end)
+        if not local_starts.size:
+            continue
+        edges = np.zeros(size + 1, dtype=np.int32)
+        np.add.at(edges, local_starts, 1)
+        np.add.at(edges, local_ends, -1)
+        labels[np.cumsum(edges[:-1]) > 0] = label
+    return labels
+
+
+def label_runs(labels: np.ndarray) -> list[tuple[int, int, int]]:
+    """Run-length encodes a label array into (start, end, label) triples."""
+    if not labels.size:
+        return []
+    bounds = np.concatenate(([0], np.flatnonzero(labels[1:] != labels[:-1]) + 1, [labels.size]))
+    return [(start, end, int(labels[start])) for start, end in zip(bounds[:-1].tolist(), bounds[1:].tolist())]
+
+
+def mark_intervals(sequence: str, intervals: Intervals, open_mark: str = "[", close_mark: str = "]") -> str:
+    """
+    Wraps every interval of a sequence in open_mark ... close_mark in a single pass.
+
+    Overlapping intervals keep one pair of marks each (nested or interleaved);
+    at a position where one interval ends and another starts, the close mark
+    comes first.
+
+    Args:
+        sequence (str): Sequence to mark.
+        intervals (iterable of (start, end)): Half-open intervals, in any order.
+        open_mark, close_mark (str): Marks inserted before and after each interval.
+
+    Returns:
+        str: The marked sequence.
+    """
+    boundaries = {}
+    for start, end in intervals:
+        boundaries.setdefault(end, [0, 0])[0] += 1
+        boundaries.setdefault(start, [0, 0])[1] += 1
+    pieces, last = [], 0
+    for position in sorted(boundaries):
+        closes, opens = boundaries[position]
+        pieces.append(sequence[last:position])
+        pieces.append(close_mark * closes + open_mark * opens)
+        last = position
+    pieces.append(sequence[last:])
+    return "".join(pieces)
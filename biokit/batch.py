@@ -0,0 +1,160 @@
+"""
+Batch Runner
+
+Applies one tool function to every record of a multi-record input with a
+process pool. Records are read lazily and grouped into chunks; only a bounded
+number of chunks is in flight at once, so thousands of records (or a file
+larger than memory) never have to be materialised. Each worker runs the tool
+on every record of its chunk and returns plain row dicts, which the parent
+yields as soon as a chunk completes.
+
+Tool functions are sent to the workers by reference, so they must be
+module-level functions (every `find_*` / `calculate_*` function of the tool
+packages qualifies). Whatever a tool returns is flattened into rows by
+`result_rows`, and every row is tagged with the record's index and header.
+
+A run is cancelled by closing the generator (or by `should_cancel` returning
+True): queued chunks are dropped and the pool is shut down without waiting
+for the chunks that are still running. With a single worker the chunks are
+run in-process, which avoids paying for a worker start-up that cannot be
+amortised.
+"""
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+from multiprocessing import get_context
+from typing import Callable, Iterable, Iterator, Optional, Sequence
+
+import numpy as np
+
+from biokit.fasta_reader import SequenceRecord
+
+DEFAULT_CHUNK_SIZE = 64
+
+
+def _cell(value):
+    """Converts NumPy scalars and arrays to plain Python values for tables."""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    return value
+
+
+def _item_row(item) -> dict:
+    return {key: _cell(value) for key, value in item.items()} if isinstance(item, dict) else {"value": _cell(item)}
+
+
+def result_rows(result, labels: Optional[Sequence[str]] = None) -> list[dict]:
+    """
+    Flattens a tool result into table rows.
+
+    Args:
+        result: A tool's return value: None, a scalar or string (one 'result'
+            row), a dict of scalars (one row), a dict of lists ({group: items}),
+            a tuple of lists (grouped by `labels`) or any other iterable of
+            dicts or scalars (one row per item, scalars in a 'value' column).
+        labels (sequence of str, optional): Group names for tuple results.
+
+    Returns:
+        list[dict]: One dict per row.
+    """
+    if result is None:
+        return []
+    if isinstance(result, (str, bytes, int, float, np.generic)):
+        return [{"result": _cell(result)}]
+    if isinstance(result, dict):
+        if result and all(isinstance(value, (list, tuple)) for value in result.values()):
+            return [{"group": group, **_item_row(item)} for group, items in result.items() for item in items]
+        return [_item_row(result)]
+    if isinstance(result, tuple) and labels is not None:
+        return [{"group": label, **_item_row(item)} for label, items in zip(labels, result) for item in items]
+    return [_item_row(item) for item in result]
+
+
+def _run_chunk(tool: Callable, chunk: list[tuple[int, str, str]], params: dict, labels) -> list[dict]:
+    """Worker entry point: runs the tool on each (index, header, sequence) of a chunk."""
+    rows = []
+    for index, header, sequence in chunk:
+        try:
+            result = tool(sequence, **params)
+            found = result_rows(result, labels)
+        except Exception as err:  # one bad record must not abort the batch
+            found = [{"error": f"{type(err).__name__}: {err}"}]
+        rows.extend({"record_index": index, "record": header, **row} for row in found)
+    return rows
+
+
+def _chunks(records: Iterable, chunk_size: int) -> Iterator[list[tuple[int, str, str]]]:
+    """Groups records (SequenceRecord or (header, sequence) pairs) into numbered chunks."""
+    numbered = ((index, record[0], record[1]) for index, record in enumerate(records))
+    while True:
+        chunk = list(islice(numbered, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def run_batch(records: Iterable[SequenceRecord], tool: Callable, params: Optional[dict] = None,
+              labels: Optional[Sequence[str]] = None, max_workers: Optional[int] = None,
+              chunk_size: int = DEFAULT_CHUNK_SIZE, total: Optional[int] = None,
+              progress: Optional[Callable[[int, Optional[int]], None]] = None,
+              should_cancel: Optional[Callable[[], bool]] = None, poll_interval: float = 0.2) -> Iterator[dict]:
+    """
+    Runs a tool on every record in a process pool and yields the result rows.
+
+    Args:
+        records (iterable): SequenceRecord objects or (header, sequence) pairs,
+            consumed lazily (e.g. iter_records(path)).
+        tool (callable): Module-level function called as tool(sequence, **params).
+        params (dict, optional): Keyword arguments for the tool; must be picklable.
+        labels (sequence of str, optional): Group names for tools returning a tuple of lists.
+        max_workers (int, optional): Worker processes (default: CPU count); 1 runs in-process.
+        chunk_size (int): Records per task.
+        total (int, optional): Number of records, passed through to `progress`.
+        progress (callable, optional): Called as progress(records_done, total) after each chunk.
+        should_cancel (callable, optional): Polled while waiting; returning True stops the run.
+        poll_interval (float): Seconds between cancellation checks.
+
+    Yields:
+        dict: Result rows in chunk completion order, each starting with
+              'record_index' (0-based input order) and 'record' (header). A record
+              whose tool call raised yields a single row with an 'error' column.
+    """
+    params = params or {}
+    workers = max_workers or os.cpu_count() or 1
+    done = 0
+    chunks = _chunks(records, chunk_size)
+    if workers == 1:
+        for chunk in chunks:
+            if should_cancel is not None and should_cancel():
+                return
+            done += len(chunk)
+            yield from _run_chunk(tool, chunk, params, labels)
+            if progress is not None:
+                progress(done, total)
+        return
+
+    pool = ProcessPoolExecutor(workers, mp_context=get_context("spawn"))
+    pending = {}
+    try:
+        for chunk in islice(chunks, 2 * workers):
+            pending[pool.submit(_run_chunk, tool, chunk, params, labels)] = len(chunk)
+        while pending:
+            if should_cancel is not None and should_cancel():
+                return
+            finished, _ = wait(pending, timeout=poll_interval, return_when=FIRST_COMPLETED)
+            for future in finished:
+                done += pending.pop(future)
+                yield from future.result()
+                if progress is not None:
+                    progress(done, total)
+            for chunk in islice(chunks, len(finished)):
+                pending[pool.submit(_run_chunk, tool, chunk, params, labels)] = len(chunk)
+    finally:
+        pool.shutdown(wait=not pending, cancel_futures=True)
+
+
+def run_batch_table(records: Iterable[SequenceRecord], tool: Callable, **options) -> list[dict]:
+    """Runs a batch to completion and returns its rows in input order."""
+    return sorted(run_batch(records, tool, **options), key=lambda row: row["record_index"])
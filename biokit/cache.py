@@ -0,0 +1,316 @@
+"""
+Result Cache
+
+Memoises tool results across Streamlit reruns (and across calls in a
+pipeline) so that moving one slider only recomputes what depends on it.
+
+Entries are keyed by a digest of the sequence plus the tool's qualified name,
+a digest of the source code it may run (so the on-disk tier never serves a
+result computed by an older version of the tools) and its normalised arguments: arguments are bound to the function signature
+with defaults applied, so f(seq, 20) and f(seq, primer_length=20) share an
+entry, and lists and tuples compare equal. NumPy arrays are keyed by a digest
+of their contents, other objects (e.g. PWMs) by their public attributes.
+
+The in-memory tier is an LRU bounded by the estimated size of the stored
+results, not by their number. An optional on-disk tier (pickle files under a
+directory, itself pruned oldest-first past a size limit) lets expensive
+results survive a restart of the app; set BIOKIT_CACHE_DIR to enable it for
+the shared cache, and BIOKIT_CACHE_MB to change the memory budget.
+
+Cached values are shared between callers and must be treated as read-only.
+Expensive intermediate arrays (prefix sums, per-window Tm) are cached on their
+own, so changing a window size or a threshold reuses them instead of
+rebuilding them from the sequence.
+"""
+import hashlib
+import inspect
+import os
+import pickle
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+import numpy as np
+
+from biokit.encoded_sequence import EncodedSequence
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_MAX_DISK_BYTES = 1024 * 1024 * 1024
+
+_MISSING = object()
+_PACKAGES = ("biokit", "biokit1", "biokit2")
+_ROOT = Path(__file__).resolve().parent.parent
+
+
+def sequence_digest(sequence: Union[str, bytes, EncodedSequence]) -> str:
+    """
+    Returns a hex digest identifying a sequence's exact content.
+
+    Strings are hashed as written (case matters to some tools); an
+    EncodedSequence is hashed by its codes.
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    if isinstance(sequence, EncodedSequence):
+        hasher.update(b"codes:")
+        hasher.update(np.ascontiguousarray(sequence.codes).data)
+    elif isinstance(sequence, bytes):
+        hasher.update(b"bytes:" + sequence)
+    else:
+        hasher.update(b"str:" + str(sequence).encode("utf-8", errors="surrogatepass"))
+    return hasher.hexdigest()
+
+
+def _normalize(value):
+    """Turns an argument into a hashable, repr-stable key component."""
+    if value is None or isinstance(value, (bool, int, str)):
+        return value
+    if isinstance(value, float):
+        return ("float", repr(value))
+    if isinstance(value, np.generic):
+        return _normalize(value.item())
+    if isinstance(value, (bytes, EncodedSequence)):
+        return ("sequence", sequence_digest(value))
+    if isinstance(value, (list, tuple)):
+        return tuple(_normalize(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return ("set",) + tuple(sorted((_normalize(item) for item in value), key=repr))
+    if isinstance(value, dict):
+        return ("dict",) + tuple(sorted(((str(k), _normalize(v)) for k, v in value.items()), key=repr))
+    if isinstance(value, np.ndarray):
+        hasher = hashlib.blake2b(np.ascontiguousarray(value).data, digest_size=16)
+        return ("ndarray", str(value.dtype), value.shape, hasher.hexdigest())
+    if hasattr(value, "__dict__") and not callable(value):
+        # Objects are keyed by their public state; underscore attributes hold lazily filled caches.
+        state = {name: item for name, item in vars(value).items() if not name.startswith("_")}
+        return (type(value).__qualname__, _normalize(state))
+    try:
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception as err:
+        raise TypeError(f"Cannot build a cache key from {type(value).__name__}: {err}") from err
+    return (type(value).__qualname__, hashlib.blake2b(payload, digest_size=16).hexdigest())
+
+
+@lru_cache(maxsize=None)
+def _source_digest(module_file: Optional[str] = None) -> str:
+    """Digest of the BioKit packages' source files (plus a module outside them), read once per process."""
+    files = sorted(path for package in _PACKAGES for path in (_ROOT / package).rglob("*.py"))
+    if module_file and Path(module_file).resolve() not in files:
+        files.append(Path(module_file).resolve())
+    hasher = hashlib.blake2b(digest_size=16)
+    for path in files:
+        hasher.update(str(path.relative_to(_ROOT) if path.is_relative_to(_ROOT) else path).encode("utf-8"))
+        try:
+            hasher.update(path.read_bytes())
+        except OSError:
+            pass
+    return hasher.hexdigest()
+
+
+def code_version(function: Callable) -> str:
+    """Version salt of a cached function: changes whenever the tool code (or its module) changes."""
+    module = sys.modules.get(getattr(function, "__module__", None) or "")
+    return _source_digest(getattr(module, "__file__", None))
+
+
+def make_key(function: Callable, sequence, *args, **kwargs) -> str:
+    """
+    Builds the cache key of function(sequence, *args, **kwargs).
+
+    Returns:
+        str: Hex digest of the function's qualified name, its code_version, the
+             sequence digest and the arguments bound to the signature (defaults applied).
+    """
+    try:
+        bound = inspect.signature(function).bind(sequence, *args, **kwargs)
+        bound.apply_defaults()
+        arguments = list(bound.arguments.items())[1:]
+    except (TypeError, ValueError):  # builtins without a signature
+        arguments = [(str(i), arg) for i, arg in enumerate(args)] + sorted(kwargs.items())
+    name = f"{function.__module__}.{function.__qualname__}"
+    parts = (name, code_version(function), sequence_digest(sequence), tuple((k, _normalize(v)) for k, v in arguments))
+    return hashlib.blake2b(repr(parts).encode("utf-8"), digest_size=20).hexdigest()
+
+
+def estimate_size(value, _depth: int = 0) -> int:
+    """Approximate memory footprint of a result in bytes (arrays by nbytes, containers recursively)."""
+    if isinstance(value, np.ndarray):
+        return value.nbytes + 112
+    if isinstance(value, EncodedSequence):
+        return value.codes.nbytes + 112
+    if isinstance(getattr(value, "nbytes", None), int):  # indexes and other array-backed objects
+        return value.nbytes + 112
+    if _depth < 4:
+        if isinstance(value, dict):
+            return sys.getsizeof(value) + sum(estimate_size(k, _depth + 1) + estimate_size(v, _depth + 1) for k, v in value.items())
+        if isinstance(value, (list, tuple, set, frozenset)):
+            return sys.getsizeof(value) + sum(estimate_size(item, _depth + 1) for item in value)
+    return sys.getsizeof(value)
+
+
+class ResultCache:
+    """
+    Two-tier LRU cache of tool results.
+
+    Args:
+        max_bytes (int): Memory budget; least recently used entries are evicted
+            past it, and a single result larger than the budget is not kept in memory.
+        directory (str, optional): Directory of the on-disk tier (None: memory only).
+        max_disk_bytes (int): Size limit of the on-disk tier.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, directory: Optional[str] = None,
+                 max_disk_bytes: int = DEFAULT_MAX_DISK_BYTES):
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.max_disk_bytes = max_disk_bytes
+        self._entries = OrderedDict()  # key -> (value, size)
+        self._size = 0
+        self._lock = threading.RLock()
+        self.hits = self.disk_hits = self.misses = 0
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries or (self.directory is not None and os.path.exists(self._path(key)))
+
+    @property
+    def size(self) -> int:
+        """Estimated bytes held in memory."""
+        return self._size
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key + ".pkl")
+
+    def _remember(self, key: str, value) -> None:
+        size = estimate_size(value)
+        with self._lock:
+            if key in self._entries:
+                self._size -= self._entries.pop(key)[1]
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (value, size)
+            self._size += size
+            while self._size > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._size -= evicted
+
+    def get(self, key: str, default=None):
+        """Returns the cached value (promoting disk hits to memory), or default."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+        if self.directory is not None:
+            try:
+                with open(self._path(key), "rb") as handle:
+                    value = pickle.load(handle)
+                os.utime(self._path(key))  # pruning removes the least recently used files first
+            except FileNotFoundError:
+                pass
+            except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+                self._discard_file(key)  # truncated or stale entry
+            else:
+                self.disk_hits += 1
+                self._remember(key, value)
+                return value
+        self.misses += 1
+        return default
+
+    def put(self, key: str, value) -> None:
+        """Stores a value in memory and, if enabled, on disk."""
+        self._remember(key, value)
+        if self.directory is None:
+            return
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        handle = tempfile.NamedTemporaryFile("wb", dir=os.path.dirname(path), suffix=".tmp", delete=False)
+        try:
+            with handle:
+                pickle.dump(value, handle, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(handle.name, path)  # atomic: readers never see a partial file
+        except (OSError, pickle.PicklingError, TypeError, AttributeError):
+            self._discard_file(None, handle.name)  # unpicklable results stay memory-only
+            return
+        self._prune_disk()
+
+    def get_or_compute(self, key: str, compute: Callable[[], Any]):
+        """Returns the cached value for key, computing and storing it on a miss."""
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def call(self, function: Callable, sequence, *args, **kwargs):
+        """
+        Returns function(sequence, *args, **kwargs), from the cache when possible.
+
+        Generators and other one-shot iterators are materialised into lists
+        before they are stored.
+        """
+        def compute():
+            result = function(sequence, *args, **kwargs)
+            return list(result) if inspect.isgenerator(result) or isinstance(result, (map, filter, zip)) else result
+        return self.get_or_compute(make_key(function, sequence, *args, **kwargs), compute)
+
+    def clear(self, disk: bool = False) -> None:
+        """Drops the in-memory entries (and the on-disk tier when disk=True)."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+        if disk and self.directory is not None:
+            for path, _ in self._disk_files():
+                self._discard_file(None, path)
+
+    def _disk_files(self) -> list[tuple[str, os.stat_result]]:
+        files = []
+        for root, _, names in os.walk(self.directory):
+            for name in names:
+                if name.endswith(".pkl"):
+                    path = os.path.join(root, name)
+                    try:
+                        files.append((path, os.stat(path)))
+                    except FileNotFoundError:
+                        pass
+        return files
+
+    def _prune_disk(self) -> None:
+        files = self._disk_files()
+        total = sum(stat.st_size for _, stat in files)
+        for path, stat in sorted(files, key=lambda item: item[1].st_mtime):
+            if total <= self.max_disk_bytes:
+                break
+            self._discard_file(None, path)
+            total -= stat.st_size
+
+    def _discard_file(self, key: Optional[str], path: Optional[str] = None) -> None:
+        try:
+            os.remove(path or self._path(key))
+        except OSError:
+            pass
+
+
+_shared_cache = None
+
+
+def get_result_cache() -> ResultCache:
+    """Returns the process-wide cache, configured from BIOKIT_CACHE_MB and BIOKIT_CACHE_DIR."""
+    global _shared_cache
+    if _shared_cache is None:
+        megabytes = float(os.environ.get("BIOKIT_CACHE_MB", DEFAULT_MAX_BYTES / 2 ** 20))
+        _shared_cache = ResultCache(int(megabytes * 2 ** 20), os.environ.get("BIOKIT_CACHE_DIR") or None)
+    return _shared_cache
+
+
+def cached_call(function: Callable, sequence, *args, **kwargs):
+    """Calls function(sequence, *args, **kwargs) through the shared result cache."""
+    return get_result_cache().call(function, sequence, *args, **kwargs)
@@ -0,0 +1,258 @@
+"""
+Command-Line Interface
+
+Runs any registered tool (see biokit.registry) headlessly over FASTA/FASTQ
+input without importing Streamlit:
+
+    python -m biokit list
+    python -m biokit orfs genome.fa.gz --min-length 300 -o orfs.tsv
+    cat reads.fq | python -m biokit gc - -f jsonl
+    python -m biokit scan gc genome.fa.gz --window-size 1000 -o gc.tsv
+
+Input files are streamed record by record into the batch runner. JSON Lines
+output is written row by row as results arrive (in completion order); TSV,
+JSON and Parquet output is sorted into input order and written at the end.
+
+`scan` runs a sliding-window scan from biokit.streaming over whole
+chromosomes block by block; its rows already arrive in order and are written
+incrementally in every format.
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+from itertools import islice
+from typing import Iterable, Iterator, Optional
+
+import numpy as np
+
+from biokit.batch import DEFAULT_CHUNK_SIZE
+from biokit.fasta_reader import iter_records, read_headers
+from biokit.registry import SCANS, TOOLS, get_tool, run_tool
+
+FORMATS = ("tsv", "jsonl", "json", "parquet")
+PARQUET_BATCH_ROWS = 100_000
+_EXTENSIONS = {".tsv": "tsv", ".txt": "tsv", ".jsonl": "jsonl", ".json": "json", ".parquet": "parquet"}
+
+
+def _json_default(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, tuple):
+        return list(value)
+    return str(value)
+
+
+def _tsv_cell(value) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, (list, tuple, dict)):
+        return json.dumps(value, default=_json_default)
+    return str(value)
+
+
+def _columns(rows: list[dict]) -> list[str]:
+    """Union of the row keys in first-seen order (tools with dict results vary per record)."""
+    return list(dict.fromkeys(key for row in rows for key in row))
+
+
+def _write_parquet_stream(rows: Iterable[dict], output: str) -> int:
+    """Writes rows with a fixed set of columns to Parquet in row groups, never holding more than one batch."""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as err:
+        raise ValueError(f"Parquet output requires pyarrow: {err}") from err
+    writer = None
+    count = 0
+    try:
+        while True:
+            batch = list(islice(rows, PARQUET_BATCH_ROWS))
+            if not batch:
+                break
+            table = pa.Table.from_pylist(batch, schema=writer.schema if writer else None)
+            if writer is None:
+                writer = pq.ParquetWriter(output, table.schema)
+            writer.write_table(table)
+            count += len(batch)
+    finally:
+        if writer is not None:
+            writer.close()
+    return count
+
+
+def write_rows(rows: Iterable[dict], output: Optional[str], fmt: str, ordered: bool = False) -> int:
+    """
+    Writes result rows to a file (or stdout when output is None or "-").
+
+    Args:
+        rows: Result rows; batch rows carry 'record_index' and are sorted on it.
+        output (str, optional): Output path.
+        fmt (str): One of FORMATS.
+        ordered (bool): Rows are already in order and share one set of columns
+            (scan output); every format is then written incrementally.
+
+    Returns:
+        int: Number of rows written.
+    """
+    rows = iter(rows)
+    if fmt == "parquet":
+        if output in (None, "-"):
+            raise ValueError("Parquet output needs an output file (-o).")
+        if ordered:
+            return _write_parquet_stream(rows, output)
+        import pandas as pd  # only needed for Parquet
+        table = sorted(rows, key=lambda row: row["record_index"])
+        try:
+            pd.DataFrame(table, columns=_columns(table)).to_parquet(output, index=False)
+        except ImportError as err:
+            raise ValueError(f"Parquet output requires pyarrow: {err}") from err
+        return len(table)
+
+    handle = sys.stdout if output in (None, "-") else open(output, "w", encoding="utf-8", newline="")
+    try:
+        if fmt == "jsonl":
+            count = 0
+            for row in rows:
+                handle.write(json.dumps(row, default=_json_default) + "\n")
+                count += 1
+            return count
+        if ordered:
+            return _write_ordered(rows, handle, fmt)
+        table = sorted(rows, key=lambda row: row["record_index"])
+        if fmt == "json":
+            json.dump(table, handle, default=_json_default, indent=1)
+            handle.write("\n")
+        else:
+            columns = _columns(table)
+            writer = csv.writer(handle, delimiter="\t", lineterminator="\n")
+            writer.writerow(columns)
+            for row in table:
+                writer.writerow([_tsv_cell(row.get(column)) for column in columns])
+        return len(table)
+    finally:
+        if handle is not sys.stdout:
+            handle.close()
+
+
+def _write_ordered(rows: Iterator[dict], handle, fmt: str) -> int:
+    count = 0
+    if fmt == "json":
+        handle.write("[")
+        for row in rows:
+            handle.write(("," if count else "") + "\n" + json.dumps(row, default=_json_default))
+            count += 1
+        handle.write("\n]\n")
+        return count
+    writer = csv.writer(handle, delimiter="\t", lineterminator="\n")
+    columns = None
+    for row in rows:
+        if columns is None:
+            columns = list(row)
+            writer.writerow(columns)
+        writer.writerow([_tsv_cell(row.get(column)) for column in columns])
+        count += 1
+    return count
+
+
+def _add_param(parser: argparse.ArgumentParser, param) -> None:
+    flag = "--" + param.name.replace("_", "-")
+    if param.type is bool:
+        parser.add_argument(flag, dest=param.name, action=argparse.BooleanOptionalAction, default=param.default, help=param.help)
+    elif param.multiple:
+        # default stays None: argparse would extend the registry's default list in place
+        parser.add_argument(flag, dest=param.name, type=param.type, action="extend", nargs="+", choices=param.choices,
+                            help=f"{param.help} (default: {' '.join(map(str, param.default))})")
+    else:
+        default_text = "" if param.default is None or not isinstance(param.default, (int, float, str)) else f" (default: {param.default})"
+        parser.add_argument(flag, dest=param.name, type=param.type, default=param.default, choices=param.choices,
+                            help=param.help + default_text)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="biokit", description="Run BioKit tools on FASTA/FASTQ files without the web interface.")
+    commands = parser.add_subparsers(dest="command", required=True, metavar="command")
+    commands.add_parser("list", help="list the available tools")
+    scan = commands.add_parser("scan", help="genome-scale sliding-window scans in constant memory",
+                               description="Scan whole chromosomes block by block; rows are written as they are found.")
+    scans = scan.add_subparsers(dest="scan", required=True, metavar="scan")
+    for name, spec in SCANS.items():
+        sub = scans.add_parser(name, help=spec.title, description=f"{spec.title}, streamed block by block.")
+        kind = "VCF or BED" if name == "hotspots" else "FASTA/FASTQ"
+        sub.add_argument("input", nargs="?", default="-", help=f"{kind} file, plain or gzipped ('-' or none: standard input)")
+        sub.add_argument("-o", "--output", help="output file (default: standard output)")
+        sub.add_argument("-f", "--format", choices=FORMATS, help="output format (default: from the output extension, else tsv)")
+        for param in spec.params:
+            _add_param(sub, param)
+    for command, spec in TOOLS.items():
+        sub = commands.add_parser(command, help=spec.title, description=f"{spec.title} on every record of the input.")
+        sub.add_argument("inputs", nargs="*", default=["-"], metavar="INPUT",
+                         help="FASTA/FASTQ files, plain or gzipped ('-' or none: standard input)")
+        sub.add_argument("-o", "--output", help="output file (default: standard output)")
+        sub.add_argument("-f", "--format", choices=FORMATS, help="output format (default: from the output extension, else tsv)")
+        sub.add_argument("-j", "--workers", type=int, default=1, help="worker processes (default: 1, in-process)")
+        sub.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="records per task")
+        sub.add_argument("--progress", action="store_true", help="report progress on standard error")
+        for param in spec.params:
+            _add_param(sub, param)
+    return parser
+
+
+def _records(inputs: list[str]):
+    for source in inputs:
+        yield from iter_records(sys.stdin.buffer if source == "-" else source)
+
+
+def _run_scan(args, spec, params: dict, fmt: str) -> int:
+    try:
+        rows = spec.function(sys.stdin.buffer if args.input == "-" else args.input, **params)
+        write_rows(rows, args.output, fmt, ordered=True)
+    except BrokenPipeError:
+        sys.stdout = open(os.devnull, "w")
+    except (OSError, ValueError) as err:
+        print(f"biokit scan {args.scan}: error: {err}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command == "list":
+        names = {**{command: spec for command, spec in TOOLS.items()}, **{f"scan {command}": spec for command, spec in SCANS.items()}}
+        width = max(map(len, names))
+        for command, spec in names.items():
+            print(f"{command:<{width}}  {spec.title}")
+        return 0
+
+    spec = SCANS[args.scan] if args.command == "scan" else get_tool(args.command)
+    params = {param.name: getattr(args, param.name) for param in spec.params if getattr(args, param.name) is not None}
+    fmt = args.format or next((f for ext, f in _EXTENSIONS.items() if (args.output or "").endswith(ext)), "tsv")
+    if args.command == "scan":
+        return _run_scan(args, spec, params, fmt)
+
+    total = None
+    progress = None
+    if args.progress:
+        if "-" not in args.inputs:
+            total = sum(len(read_headers(path)) for path in args.inputs)
+        progress = lambda done, total: print(f"\r{done}/{total or '?'} records", end="", file=sys.stderr, flush=True)
+
+    try:
+        rows = run_tool(args.command, _records(args.inputs), params, max_workers=args.workers,
+                        chunk_size=args.chunk_size, total=total, progress=progress)
+        count = write_rows(rows, args.output, fmt)
+    except BrokenPipeError:  # output piped into e.g. head, which exited early
+        sys.stdout = open(os.devnull, "w")
+        return 0
+    except (OSError, ValueError) as err:
+        if args.progress:
+            print(file=sys.stderr)
+        print(f"biokit {args.command}: error: {err}", file=sys.stderr)
+        return 1
+    if args.progress:
+        print(f"\n{count} rows written", file=sys.stderr)
+    return 0
@@ -0,0 +1,117 @@
+"""
+Encoded DNA Sequence
+
+A compact sequence type shared by the BioKit tools. Bases are stored as one
+uint8 code each (A=0, C=1, G=2, T=3, anything else=4), so a sequence is
+encoded once and then sliced, complemented and counted with NumPy instead of
+being re-uppercased and re-scanned as a Python string by every tool.
+
+Slices are zero-copy views of the parent buffer. The decoded string, the
+reverse complement and the base counts are computed on first use and cached
+on the instance.
+"""
+from typing import Union
+
+import numpy as np
+
+BASES = "ACGT"
+N_CODE = 4
+
+ENCODE_TABLE = np.full(256, N_CODE, dtype=np.uint8)
+for _code, _base in enumerate(BASES):
+    ENCODE_TABLE[ord(_base)] = _code
+    ENCODE_TABLE[ord(_base.lower())] = _code
+
+DECODE_TABLE = np.frombuffer(b"ACGTN", dtype=np.uint8)
+COMPLEMENT_CODES = np.array([3, 2, 1, 0, N_CODE], dtype=np.uint8)
+
+
+def encode(sequence: Union[str, bytes]) -> np.ndarray:
+    """Encodes a nucleotide string into a uint8 code array (non-ACGT -> 4)."""
+    if isinstance(sequence, str):
+        sequence = sequence.encode("ascii", errors="replace")
+    return ENCODE_TABLE[np.frombuffer(sequence, dtype=np.uint8)]
+
+
+def decode(codes: np.ndarray) -> str:
+    """Decodes a uint8 code array back into an uppercase string (code 4 -> 'N')."""
+    return DECODE_TABLE[codes].tobytes().decode("ascii")
+
+
+class EncodedSequence:
+    """
+    DNA sequence backed by a NumPy uint8 code array.
+
+    Construct it from a string (or bytes) once and pass it to any tool that
+    accepts `str | EncodedSequence`; `as_encoded` returns an existing instance
+    unchanged, so nothing is encoded twice.
+    """
+
+    def __init__(self, sequence: Union[str, bytes, "EncodedSequence"] = ""):
+        if isinstance(sequence, EncodedSequence):
+            self.codes = sequence.codes
+        else:
+            self.codes = encode(sequence)
+        self._text = None
+        self._reverse_complement = None
+        self._counts = None
+
+    @classmethod
+    def from_codes(cls, codes: np.ndarray) -> "EncodedSequence":
+        """Wraps an existing code array without copying it."""
+        instance = cls()
+        instance.codes = codes
+        return instance
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return EncodedSequence.from_codes(self.codes[key])
+        return "ACGTN"[self.codes[key]]
+
+    def __str__(self) -> str:
+        if self._text is None:
+            self._text = decode(self.codes)
+        return self._text
+
+    def __repr__(self) -> str:
+        preview = str(self[:20]) + ("..." if len(self) > 20 else "")
+        return f"EncodedSequence('{preview}', length={len(self)})"
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, str):
+            other = EncodedSequence(other)
+        if not isinstance(other, EncodedSequence):
+            return NotImplemented
+        return np.array_equal(self.codes, other.codes)
+
+    __hash__ = None
+
+    def complement(self) -> "EncodedSequence":
+        return EncodedSequence.from_codes(COMPLEMENT_CODES[self.codes])
+
+    def reverse_complement(self) -> "EncodedSequence":
+        """Returns the (cached) reverse complement; its own reverse complement is self."""
+        if self._reverse_complement is None:
+            rc = EncodedSequence.from_codes(COMPLEMENT_CODES[self.codes[::-1]])
+            rc._reverse_complement = self
+            self._reverse_complement = rc
+        return self._reverse_complement
+
+    def base_counts(self) -> dict:
+        """Returns (cached) counts for 'A', 'C', 'G', 'T' and 'N' (any other character)."""
+        if self._counts is None:
+            counts = np.bincount(self.codes, minlength=5)
+            self._counts = {base: int(count) for base, count in zip("ACGTN", counts)}
+        return self._counts
+
+    def gc_fraction(self) -> float:
+        counts = self.base_counts()
+        return (counts["G"] + counts["C"]) / len(self) if len(self) else 0.0
+
+
+def as_encoded(sequence: Union[str, bytes, EncodedSequence]) -> EncodedSequence:
+    """Returns sequence as an EncodedSequence, encoding only if it is not one already."""
+    return sequence if isinstance(sequence, EncodedSequence) else EncodedSequence(sequence)
@@ -0,0 +1,265 @@
+"""
+Indexed FASTA Access
+
+Builds and reads samtools-compatible `.fai` indexes and serves arbitrary
+regions of large FASTA files from a memory map, so a 50 kb window of a
+chromosome can be pulled without reading the rest of the file.
+
+Region strings follow the samtools convention: `name:start-end`, 1-based and
+inclusive, with optional thousands separators (e.g. `chr1:1,000,000-1,050,000`).
+A string that is exactly the name of an indexed sequence is taken as the whole
+sequence, so names containing ':' (e.g. `HLA-A*01:01:01:01`) still work.
+Internally all coordinates are 0-based and half-open.
+"""
+import mmap
+import os
+import re
+from typing import NamedTuple, Optional, Union
+
+import numpy as np
+
+_NEWLINE = ord("\n")
+_REGION_PATTERN = re.compile(r"^(?P<name>.+?)(?::(?P<start>[\d,]+)(?:-(?P<end>[\d,]+))?)?$")
+
+
+class FaiEntry(NamedTuple):
+    name: str
+    length: int
+    offset: int
+    line_bases: int
+    line_width: int
+
+
+def resolve_reference_path(path: Union[str, os.PathLike], root: Union[str, os.PathLike]) -> str:
+    """
+    Resolves a FASTA path given relative to (or inside) a reference directory.
+
+    Raises:
+        ValueError: If the resolved path, after following symlinks, lies outside root.
+    """
+    root = os.path.realpath(root)
+    resolved = os.path.realpath(os.path.join(root, path))
+    if os.path.commonpath([root, resolved]) != root:
+        raise ValueError(f"'{path}' is outside the reference directory.")
+    return resolved
+
+
+def parse_region(region: str, names=None) -> tuple[str, int, Optional[int]]:
+    """
+    Parses a samtools-style region string.
+
+    Args:
+        region (str): e.g. "chr1", "chr1:1000" or "chr1:1,000,000-1,050,000".
+        names (container of str, optional): Indexed sequence names; a region equal
+            to one of them is the whole sequence, even if the name contains ':'.
+
+    Returns:
+        tuple: (name, start, end) as 0-based half-open coordinates; end is None
+               when the region runs to the end of the sequence.
+
+    Raises:
+        ValueError: If the region string is malformed or start > end.
+    """
+    region = region.strip()
+    if names is not None and region in names:
+        return region, 0, None
+    match = _REGION_PATTERN.match(region)
+    if not match:
+        raise ValueError(f"Invalid region '{region}'. Expected name:start-end.")
+
+    name = match.group("name")
+    start = int(match.group("start").replace(",", "")) if match.group("start") else 1
+    end = int(match.group("end").replace(",", "")) if match.group("end") else None
+
+    if start < 1 or (end is not None and end < start):
+        raise ValueError(f"Invalid coordinates in region '{region}'.")
+    return name, start - 1, end
+
+
+def build_fai_index(buffer) -> dict[str, FaiEntry]:
+    """
+    Scans a FASTA buffer and returns its index entries.
+
+    Only the first line of each record is read directly; the remaining line
+    breaks are verified with a single NumPy gather at their expected offsets,
+    so indexing never copies sequence data.
+
+    Args:
+        buffer: bytes or mmap holding uncompressed FASTA text.
+
+    Returns:
+        dict[str, FaiEntry]: Index entries keyed by sequence name, in file order.
+
+    Raises:
+        ValueError: If a record has an empty header, unequal line lengths or a duplicate name.
+    """
+    data = np.frombuffer(buffer, dtype=np.uint8)
+    size = len(buffer)
+    index = {}
+
+    header_start = 0 if buffer[:1] == b">" else buffer.find(b"\n>")
+    if header_start > 0:
+        header_start += 1
+    while header_start != -1:
+        header_end = buffer.find(b"\n", header_start)
+        if header_end == -1:
+            header_end = size
+        fields = buffer[header_start + 1:header_end].decode("utf-8", errors="ignore").split()
+        if not fields:
+            raise ValueError(f"Empty FASTA header line at byte {header_start}; every record needs a name.")
+        name = fields[0]
+        if name in index:
+            raise ValueError(f"Duplicate sequence name '{name}' in FASTA.")
+
+        seq_start = min(header_end + 1, size)
+        next_header = buffer.find(b"\n>", header_end)
+        seq_end = size if next_header == -1 else next_header
+        while seq_end > seq_start and buffer[seq_end - 1:seq_end] in (b"\r", b"\n"):
+            seq_end -= 1  # drop trailing line breaks and blank lines
+
+        first_newline = buffer.find(b"\n", seq_start, seq_end)
+        if first_newline == -1:
+            line_bases = seq_end - seq_start
+            line_width = line_bases + 1
+            length = line_bases
+        else:
+            has_cr = buffer[first_newline - 1:first_newline] == b"\r"
+            line_width = first_newline - seq_start + 1
+            line_bases = line_width - 1 - has_cr
+            full_lines, last_bases = divmod(seq_end - seq_start, line_width)
+            breaks = seq_start + line_bases + has_cr + np.arange(full_lines, dtype=np.int64) * line_width
+            if last_bases > line_bases or np.any(data[breaks] != _NEWLINE):
+                raise ValueError(f"Sequence '{name}' has unequal line lengths and cannot be indexed.")
+            length = full_lines * line_bases + last_bases
+
+        index[name] = FaiEntry(name, length, seq_start, line_bases, line_width)
+        header_start = -1 if next_header == -1 else next_header + 1
+
+    return index
+
+
+def write_fai(index: dict[str, FaiEntry], fai_path: str) -> None:
+    with open(fai_path, "w") as handle:
+        for entry in index.values():
+            handle.write("\t".join(str(field) for field in entry) + "\n")
+
+
+def read_fai(fai_path: str) -> dict[str, FaiEntry]:
+    index = {}
+    with open(fai_path) as handle:
+        for line in handle:
+            fields = line.rstrip("\n").split("\t")
+            if len(fields) < 5:
+                continue
+            name = fields[0]
+            index[name] = FaiEntry(name, *(int(value) for value in fields[1:5]))
+    return index
+
+
+class IndexedFasta:
+    """
+    Random access to the sequences of an uncompressed FASTA file.
+
+    Paths are memory-mapped and their `.fai` index is read from disk (or built
+    and, if write_index is set, written next to the file on first use); an
+    index older than the FASTA file, or pointing past its end, is rebuilt.
+    In-memory bytes, such as a Streamlit upload's `getvalue()`, can be passed
+    instead, in which case the index is built in memory.
+    """
+
+    def __init__(self, source: Union[str, os.PathLike, bytes], index: Optional[dict[str, FaiEntry]] = None,
+                 write_index: bool = True):
+        self._handle = None
+        if isinstance(source, (str, os.PathLike)):
+            if str(source).endswith(".gz"):
+                raise ValueError("Compressed FASTA cannot be memory-mapped; decompress it first.")
+            self._handle = open(source, "rb")
+            self._buffer = mmap.mmap(self._handle.fileno(), 0, access=mmap.ACCESS_READ)
+            if index is None:
+                index = self._load_or_build_index(str(source), write_index)
+        else:
+            self._buffer = source
+            if index is None:
+                index = build_fai_index(source)
+        self.index = index
+
+    def _load_or_build_index(self, fasta_path: str, write_index: bool = True) -> dict[str, FaiEntry]:
+        fai_path = fasta_path + ".fai"
+        if os.path.exists(fai_path) and os.path.getmtime(fai_path) >= os.path.getmtime(fasta_path):
+            index = read_fai(fai_path)
+            if all(entry.offset <= len(self._buffer) and (entry.length == 0 or entry.line_bases > 0 and
+                   self._offset(entry, entry.length - 1) < len(self._buffer)) for entry in index.values()):
+                return index
+        # Missing, older than the FASTA or inconsistent with its size: a stale index would return wrong regions.
+        index = build_fai_index(self._buffer)
+        if write_index:
+            try:
+                write_fai(index, fai_path)
+            except OSError:
+                pass  # read-only location; keep the index in memory only
+        return index
+
+    @property
+    def names(self) -> list[str]:
+        return list(self.index)
+
+    def length(self, name: str) -> int:
+        return self._entry(name).length
+
+    def _entry(self, name: str) -> FaiEntry:
+        entry = self.index.get(name)
+        if entry is None:
+            raise KeyError(f"Sequence '{name}' not found in FASTA index.")
+        return entry
+
+    def _offset(self, entry: FaiEntry, pos: int) -> int:
+        return entry.offset + (pos // entry.line_bases) * entry.line_width + pos % entry.line_bases
+
+    def fetch_raw(self, name: str, start: int = 0, end: Optional[int] = None) -> Union[memoryview, bytes]:
+        """
+        Returns the bases of name[start:end] as raw bytes.
+
+        When the region lies on a single line of the file the result is a
+        zero-copy memoryview into the mapped file; otherwise line breaks have
+        to be removed and a bytes copy of just that region is returned.
+
+        Args:
+            name (str): Sequence name as listed in the index.
+            start (int): 0-based start (inclusive).
+            end (int, optional): 0-based end (exclusive); defaults to sequence end.
+
+        Returns:
+            memoryview | bytes: The region's bases, case preserved.
+        """
+        entry = self._entry(name)
+        end = entry.length if end is None else min(end, entry.length)
+        start = max(0, min(start, end))
+
+        if end <= start:
+            return b""
+        raw = memoryview(self._buffer)[self._offset(entry, start):self._offset(entry, end - 1) + 1]
+        if start // entry.line_bases == (end - 1) // entry.line_bases:
+            return raw
+        return raw.tobytes().translate(None, b"\r\n")
+
+    def fetch(self, name: str, start: int = 0, end: Optional[int] = None) -> str:
+        """Returns name[start:end] as an uppercase string ready for the analysis tools."""
+        raw = self.fetch_raw(name, start, end)
+        return bytes(raw).upper().decode("ascii", errors="ignore")
+
+    def fetch_region(self, region: str) -> str:
+        """Returns the sequence for a samtools-style region such as 'chr1:1,000,000-1,050,000'."""
+        name, start, end = parse_region(region, self.index)
+        return self.fetch(name, start, end)
+
+    def close(self) -> None:
+        if self._handle is not None:
+            self._buffer.close()
+            self._handle.close()
+            self._handle = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,250 @@
+"""
+Streaming FASTA / FASTQ Reader
+
+Reads sequence records lazily from a file path or an open binary file
+(including Streamlit uploads). Gzip input is recognised from its magic bytes,
+so `.fa.gz` and `.fastq.gz` files need no special handling by the caller.
+
+Each record's sequence is accumulated in a single bytearray and decoded once,
+which keeps parsing linear in the file size and avoids holding more than one
+record in memory at a time.
+"""
+import gzip
+import os
+from contextlib import contextmanager
+from itertools import chain
+from typing import IO, Callable, Iterable, Iterator, NamedTuple, Optional, Union
+
+GZIP_MAGIC = b"\x1f\x8b"
+
+# Upper-cases ASCII letters while the whitespace in _WHITESPACE is deleted,
+# so each sequence line is cleaned in a single pass.
+_UPPER_TABLE = bytes.maketrans(b"abcdefghijklmnopqrstuvwxyz", b"ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+_WHITESPACE = b" \t\r\n\v\f"
+
+Source = Union[str, os.PathLike, IO[bytes]]
+
+
+class SequenceRecord(NamedTuple):
+    header: str
+    sequence: str
+    quality: Optional[str] = None
+
+
+@contextmanager
+def open_sequence_file(source: Source) -> Iterator[IO[bytes]]:
+    """
+    Opens a path or rewinds a binary file object for reading, transparently
+    decompressing gzip input.
+
+    Args:
+        source: Path to a FASTA/FASTQ file or a binary file-like object.
+
+    Yields:
+        IO[bytes]: A binary stream positioned at the start of the records.
+    """
+    owned = isinstance(source, (str, os.PathLike))
+    stream = open(source, "rb") if owned else source
+    try:
+        if stream.seekable():
+            stream.seek(0)
+            magic = stream.read(2)
+            stream.seek(0)
+        else:
+            magic = stream.peek(2)[:2]
+
+        if magic == GZIP_MAGIC:
+            with gzip.GzipFile(fileobj=stream, mode="rb") as unzipped:
+                yield unzipped
+        else:
+            yield stream
+    finally:
+        if owned:
+            stream.close()
+
+
+def _clean(line: bytes) -> bytes:
+    return line.translate(_UPPER_TABLE, _WHITESPACE)
+
+
+def _decode_header(line: bytes) -> str:
+    return line[1:].strip().decode("utf-8", errors="ignore")
+
+
+def _parse_fasta(lines: Iterable[bytes], keep: Callable[[int], bool]) -> Iterator[SequenceRecord]:
+    header = None
+    index = -1
+    chunks = None
+
+    for line in lines:
+        if line.startswith(b">"):
+            if header is not None:
+                yield SequenceRecord(header, chunks.decode("ascii", errors="ignore") if chunks is not None else "")
+            header = _decode_header(line)
+            index += 1
+            chunks = bytearray() if keep(index) else None
+        elif chunks is not None:
+            chunks += _clean(line)
+
+    if header is not None:
+        yield SequenceRecord(header, chunks.decode("ascii", errors="ignore") if chunks is not None else "")
+
+
+def _parse_fastq(lines: Iterable[bytes], keep: Callable[[int], bool]) -> Iterator[SequenceRecord]:
+    lines = iter(lines)
+    index = -1
+
+    for line in lines:
+        if not line.strip():
+            continue
+        if not line.startswith(b"@"):
+            raise ValueError(f"Malformed FASTQ record near: {line[:40]!r}")
+
+        header = _decode_header(line)
+        index += 1
+        wanted = keep(index)
+        sequence = bytearray()
+        seq_len = 0
+
+        # Sequence lines run until the '+' separator; quality lines then run
+        # until they cover the sequence length (quality may itself start with '@').
+        for line in lines:
+            if line.startswith(b"+"):
+                break
+            cleaned = _clean(line)
+            seq_len += len(cleaned)
+            if wanted:
+                sequence += cleaned
+        else:
+            raise ValueError(f"FASTQ record '{header}' is missing its '+' separator.")
+
+        quality = bytearray()
+        qual_len = 0
+        while qual_len < seq_len:
+            line = next(lines, None)
+            if line is None:
+                raise ValueError(f"FASTQ record '{header}' has a truncated quality string.")
+            stripped = line.strip()
+            qual_len += len(stripped)
+            if wanted:
+                quality += stripped
+
+        if wanted:
+            yield SequenceRecord(header, sequence.decode("ascii", errors="ignore"), quality.decode("ascii", errors="ignore"))
+        else:
+            yield SequenceRecord(header, "")
+
+
+def _iter_parsed(stream: IO[bytes], keep: Callable[[int], bool]) -> Iterator[SequenceRecord]:
+    lines = iter(stream)
+    for first in lines:
+        if not first.strip():
+            continue
+        if first.startswith(b">"):
+            yield from _parse_fasta(chain([first], lines), keep)
+        elif first.startswith(b"@"):
+            yield from _parse_fastq(chain([first], lines), keep)
+        else:
+            raise ValueError("Input is not in FASTA or FASTQ format (expected a '>' or '@' header line).")
+        return
+
+
+def iter_records(source: Source) -> Iterator[SequenceRecord]:
+    """
+    Lazily yields every record of a FASTA or FASTQ file.
+
+    Multi-line records are joined, whitespace is removed and bases are
+    upper-cased. Only the record currently being yielded is held in memory.
+
+    Args:
+        source: Path or binary file-like object (plain or gzip-compressed).
+
+    Yields:
+        SequenceRecord: (header, sequence, quality); quality is None for FASTA.
+
+    Raises:
+        ValueError: If the input is not FASTA or FASTQ, or a FASTQ record is malformed.
+    """
+    with open_sequence_file(source) as stream:
+        yield from _iter_parsed(stream, lambda index: True)
+
+
+def read_headers(source: Source) -> list[str]:
+    """
+    Returns the header of every record without building any sequence strings.
+
+    Args:
+        source: Path or binary file-like object (plain or gzip-compressed).
+
+    Returns:
+        list[str]: Record headers in file order (without the leading '>' or '@').
+    """
+    with open_sequence_file(source) as stream:
+        return [record.header for record in _iter_parsed(stream, lambda index: False)]
+
+
+def read_record(source: Source, index: int) -> SequenceRecord:
+    """
+    Reads a single record by its position in the file. Records before it are
+    skipped without materialising their sequences, and reading stops as soon
+    as the requested record is complete.
+
+    Args:
+        source: Path or binary file-like object (plain or gzip-compressed).
+        index (int): 0-based position of the record in the file.
+
+    Returns:
+        SequenceRecord: The requested record.
+
+    Raises:
+        IndexError: If the file has fewer than index + 1 records.
+    """
+    with open_sequence_file(source) as stream:
+        for position, record in enumerate(_iter_parsed(stream, lambda i: i == index)):
+            if position == index:
+                return record
+    raise IndexError(f"Record {index} not found in input.")
+
+
+def iter_sequence_chunks(source: Source, chunk_size: int = 1 << 20) -> Iterator[tuple[str, str]]:
+    """
+    Yields the sequence of every record in pieces, so even a chromosome-sized
+    FASTA record is never held in memory as a whole.
+
+    Args:
+        source: Path or binary file-like object (plain or gzip-compressed).
+        chunk_size (int): Approximate number of bases per piece.
+
+    Yields:
+        tuple: (header, chunk) in file order; the chunks of one record are
+               consecutive and concatenate to its cleaned, upper-cased sequence.
+               FASTQ reads are short and are yielded whole.
+
+    Raises:
+        ValueError: If the input is not FASTA or FASTQ.
+    """
+    with open_sequence_file(source) as stream:
+        lines = iter(stream)
+        for first in lines:
+            if not first.strip():
+                continue
+            if first.startswith(b"@"):
+                for record in _parse_fastq(chain([first], lines), lambda index: True):
+                    yield record.header, record.sequence
+                return
+            if not first.startswith(b">"):
+                raise ValueError("Input is not in FASTA or FASTQ format (expected a '>' or '@' header line).")
+
+            header = _decode_header(first)
+            chunk = bytearray()
+            for line in lines:
+                if line.startswith(b">"):
+                    yield header, chunk.decode("ascii", errors="ignore")
+                    header, chunk = _decode_header(line), bytearray()
+                    continue
+                chunk += _clean(line)
+                if len(chunk) >= chunk_size:
+                    yield header, chunk.decode("ascii", errors="ignore")
+                    chunk = bytearray()
+            yield header, chunk.decode("ascii", errors="ignore")
+            return
@@ -0,0 +1,141 @@
+"""
+IUPAC Degenerate Motif Matching
+
+Matches motifs written with IUPAC nucleotide codes (R, Y, S, W, K, M, B, D,
+H, V, N) against an encoded sequence. Each motif position becomes a 4-bit
+mask of the bases it accepts, and each sequence base a single bit (N and
+other symbols match nothing), so a position matches when the two masks
+intersect.
+
+Many motifs are scanned in one pass: every motif (and its reverse
+complement) contributes the most specific window of up to six positions as
+an anchor, all anchors are expanded into one table mapping each 6-mer code to
+a bitmask of the motifs anchored on it, and a single table lookup over the
+sequence's q-mer codes yields the candidate positions of every motif at once.
+Candidates are then verified against the full masks with NumPy gathers.
+"""
+from itertools import product
+from typing import Iterable, Union
+
+import numpy as np
+
+from biokit.encoded_sequence import EncodedSequence, as_encoded
+from biokit.kmers import kmer_codes
+
+IUPAC_BASES = {
+    "A": "A", "C": "C", "G": "G", "T": "T",
+    "R": "AG", "Y": "CT", "S": "CG", "W": "AT", "K": "GT", "M": "AC",
+    "B": "CGT", "D": "AGT", "H": "ACT", "V": "ACG", "N": "ACGT",
+}
+IUPAC_COMPLEMENT = str.maketrans("ACGTRYSWKMBDHVN", "TGCAYRSWMKVHDBN")
+
+_BASE_BITS = {"A": 1, "C": 2, "G": 4, "T": 8}
+IUPAC_MASKS = {code: sum(_BASE_BITS[b] for b in bases) for code, bases in IUPAC_BASES.items()}
+_CODE_BITS = np.array([1, 2, 4, 8, 0], dtype=np.uint8)  # base code -> bit (N matches nothing)
+ANCHOR_LENGTH = 6
+
+
+def reverse_complement_iupac(site: str) -> str:
+    return site.translate(IUPAC_COMPLEMENT)[::-1]
+
+
+def is_degenerate(motif: str) -> bool:
+    """True if the motif uses any IUPAC code other than A, C, G, T."""
+    return any(code not in "ACGT" for code in motif.upper())
+
+
+def _validate(motif: str) -> str:
+    motif = motif.upper()
+    unknown = set(motif) - set(IUPAC_BASES)
+    if not motif or unknown:
+        raise ValueError(f"Invalid IUPAC motif '{motif}'.")
+    return motif
+
+
+def _anchor(motif: str, length: int) -> int:
+    """Offset of the length-window of motif with the fewest expansions."""
+    degeneracy = [len(IUPAC_BASES[code]) for code in motif]
+    return min(range(len(motif) - length + 1), key=lambda i: (np.prod(degeneracy[i:i + length]), i))
+
+
+class DegenerateMotifSet:
+    """
+    A compiled set of IUPAC motifs, scanned together on both strands.
+
+    Args:
+        motifs (iterable of str): IUPAC motifs (case-insensitive).
+        both_strands (bool): Also match each non-palindromic motif's reverse complement.
+    """
+
+    def __init__(self, motifs: Iterable[str], both_strands: bool = True):
+        self.motifs = list(dict.fromkeys(_validate(motif) for motif in motifs))
+        self.patterns = []  # (motif, strand, pattern matched on the top strand)
+        for motif in self.motifs:
+            self.patterns.append((motif, "+", motif))
+            rc_motif = reverse_complement_iupac(motif)
+            if both_strands and rc_motif != motif:
+                self.patterns.append((motif, "-", rc_motif))
+
+        self.anchor_length = min([ANCHOR_LENGTH] + [len(motif) for motif in self.motifs])
+        q = self.anchor_length
+        words = max(1, -(-len(self.patterns) // 64))
+        # Row 4**q is the sentinel for q-mers containing a non-ACGT base.
+        self.table = np.zeros((4 ** q + 1, words), dtype=np.uint64)
+        self.anchors = []
+        self.masks = []
+        for pattern_id, (_, _, pattern) in enumerate(self.patterns):
+            offset = _anchor(pattern, q)
+            self.anchors.append(offset)
+            self.masks.append(np.array([IUPAC_MASKS[code] for code in pattern], dtype=np.uint8))
+            bit = np.uint64(1 << (pattern_id % 64))
+            for kmer in product(*(IUPAC_BASES[code] for code in pattern[offset:offset + q])):
+                code = 0
+                for base in kmer:
+                    code = code * 4 + "ACGT".index(base)
+                self.table[code, pattern_id // 64] |= bit
+
+    def scan(self, sequence: Union[str, EncodedSequence]) -> dict[str, list[dict]]:
+        """
+        Finds every match of every motif.
+
+        Returns:
+            dict: motif -> list of {"start", "end", "strand", "match"}, ordered by
+                  start; start/end are 0-based forward-strand coordinates (end
+                  exclusive) and match is read 5'->3' on the matching strand.
+        """
+        seq = as_encoded(sequence)
+        n = len(seq)
+        results = {motif: [] for motif in self.motifs}
+        if not self.patterns or n < self.anchor_length:
+            return results
+
+        qmers = kmer_codes(seq.codes, self.anchor_length, keep_invalid=True).astype(np.int64)
+        bits = _CODE_BITS[seq.codes]
+        text = str(seq)
+        for word in range(self.table.shape[1]):
+            hits = self.table[:, word][qmers]
+            positions = np.flatnonzero(hits)
+            values = hits[positions]
+            for pattern_id in range(word * 64, min(len(self.patterns), word * 64 + 64)):
+                motif, strand, pattern = self.patterns[pattern_id]
+                starts = positions[(values >> np.uint64(pattern_id % 64)) & np.uint64(1) != 0] - self.anchors[pattern_id]
+                starts = starts[(starts >= 0) & (starts <= n - len(pattern))]
+                masks = self.masks[pattern_id]
+                for j in range(len(pattern)):
+                    if not starts.size:
+                        break
+                    starts = starts[(bits[starts + j] & masks[j]) != 0]
+                for start in starts.tolist():
+                    match = text[start:start + len(pattern)]
+                    if strand == "-":
+                        match = reverse_complement_iupac(match)
+                    results[motif].append({"start": start, "end": start + len(pattern), "strand": strand, "match": match})
+
+        for hits in results.values():
+            hits.sort(key=lambda hit: (hit["start"], hit["strand"]))
+        return results
+
+
+def find_iupac_motifs(sequence: Union[str, EncodedSequence], motifs: Iterable[str], both_strands: bool = True) -> dict[str, list[dict]]:
+    """Compiles the motifs into a DegenerateMotifSet and scans the sequence once."""
+    return DegenerateMotifSet(motifs, both_strands).scan(sequence)
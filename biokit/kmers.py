@@ -0,0 +1,145 @@
+"""
+K-mer Counting Engine
+
+Counts k-mers as 2-bit packed integers instead of string slices: every window
+of the encoded sequence becomes one integer code (A=0, C=1, G=2, T=3, first
+base in the most significant bits), computed for all positions at once with
+NumPy. For k <= 12 the codes are tallied with `np.bincount` into a dense array
+of 4**k counts; larger k (up to 32) fall back to a sorted `np.unique` tally.
+Windows containing a non-ACGT base are skipped.
+
+Canonical counting merges each k-mer with its reverse complement (the smaller
+code is kept), and `KmerCounter` accepts a sequence in chunks, carrying the
+last k-1 bases across chunk boundaries.
+"""
+from typing import Iterable, Union
+
+import numpy as np
+
+from biokit.encoded_sequence import EncodedSequence, N_CODE, as_encoded
+
+DENSE_MAX_K = 12
+MAX_K = 32
+
+
+def kmer_codes(codes: np.ndarray, k: int, step: int = 1, canonical: bool = False, keep_invalid: bool = False) -> np.ndarray:
+    """
+    Returns the 2-bit integer code of every valid k-mer window.
+
+    Args:
+        codes (np.ndarray): uint8 base codes (see EncodedSequence.codes).
+        k (int): K-mer length (1..32).
+        step (int): Distance between window starts (3 for in-frame codons).
+        canonical (bool): Replace each code by min(code, reverse-complement code).
+        keep_invalid (bool): Keep one code per window, giving windows with a
+            non-ACGT base the sentinel code 4**k instead of dropping them
+            (k must then be below 32 for the sentinel to fit in 64 bits).
+
+    Returns:
+        np.ndarray: uint64 codes of the windows that contain only A/C/G/T
+                    (or of every window when keep_invalid is set).
+    """
+    if not 1 <= k <= MAX_K:
+        raise ValueError(f"k must be between 1 and {MAX_K}, got {k}.")
+    if keep_invalid and k == MAX_K:
+        raise ValueError(f"k must be below {MAX_K} with keep_invalid (the sentinel 4**k needs {2 * MAX_K + 1} bits).")
+    count = (len(codes) - k) // step + 1 if len(codes) >= k else 0
+    if count <= 0:
+        return np.zeros(0, dtype=np.uint64)
+
+    forward = np.zeros(count, dtype=np.uint64)
+    reverse = np.zeros(count, dtype=np.uint64) if canonical else None
+    valid = np.ones(count, dtype=bool)
+    for offset in range(k):
+        column = codes[offset:offset + (count - 1) * step + 1:step]
+        valid &= column != N_CODE
+        base = column.astype(np.uint64) & np.uint64(3)
+        forward = (forward << np.uint64(2)) | base
+        if canonical:
+            reverse |= (np.uint64(3) - base) << np.uint64(2 * offset)
+
+    if canonical:
+        forward = np.minimum(forward, reverse)
+    if keep_invalid:
+        forward[~valid] = np.uint64(4 ** k)
+        return forward
+    return forward[valid]
+
+
+def decode_kmer(code: int, k: int) -> str:
+    """Converts a 2-bit k-mer code back to its string."""
+    return "".join("ACGT"[(int(code) >> (2 * (k - 1 - i))) & 3] for i in range(k))
+
+
+def count_kmers(sequence: Union[str, EncodedSequence], k: int, step: int = 1, canonical: bool = False) -> Union[np.ndarray, dict]:
+    """
+    Counts the k-mers of a sequence.
+
+    Args:
+        sequence (str | EncodedSequence): DNA sequence.
+        k (int): K-mer length.
+        step (int): Distance between window starts.
+        canonical (bool): Merge each k-mer with its reverse complement.
+
+    Returns:
+        np.ndarray | dict: For k <= 12 a dense int64 array of length 4**k indexed
+            by k-mer code; for larger k a {code: count} dict of observed k-mers.
+    """
+    codes = kmer_codes(as_encoded(sequence).codes, k, step, canonical)
+    if k <= DENSE_MAX_K:
+        return np.bincount(codes.astype(np.int64), minlength=4 ** k)
+    unique, counts = np.unique(codes, return_counts=True)
+    return dict(zip(unique.tolist(), counts.tolist()))
+
+
+def kmer_counts_to_dict(counts: Union[np.ndarray, dict], k: int) -> dict:
+    """Converts count_kmers output to {kmer string: count} for observed k-mers."""
+    if isinstance(counts, dict):
+        return {decode_kmer(code, k): count for code, count in counts.items()}
+    return {decode_kmer(code, k): int(counts[code]) for code in np.flatnonzero(counts)}
+
+
+class KmerCounter:
+    """
+    Incremental k-mer counter for sequences that arrive in chunks.
+
+    The last k-1 bases of each chunk are kept and prepended to the next one,
+    so windows spanning a boundary are counted exactly once.
+    """
+
+    def __init__(self, k: int, canonical: bool = False):
+        if not 1 <= k <= MAX_K:
+            raise ValueError(f"k must be between 1 and {MAX_K}, got {k}.")
+        self.k = k
+        self.canonical = canonical
+        self.total = 0
+        self._carry = np.zeros(0, dtype=np.uint8)
+        self._dense = np.zeros(4 ** k, dtype=np.int64) if k <= DENSE_MAX_K else None
+        self._sparse = {} if k > DENSE_MAX_K else None
+
+    def update(self, chunk: Union[str, EncodedSequence]) -> None:
+        codes = np.concatenate((self._carry, as_encoded(chunk).codes))
+        kmers = kmer_codes(codes, self.k, canonical=self.canonical)
+        self.total += len(kmers)
+        if self._dense is not None:
+            self._dense += np.bincount(kmers.astype(np.int64), minlength=len(self._dense))
+        else:
+            unique, counts = np.unique(kmers, return_counts=True)
+            for code, count in zip(unique.tolist(), counts.tolist()):
+                self._sparse[code] = self._sparse.get(code, 0) + count
+        self._carry = codes[max(len(codes) - (self.k - 1), 0):] if self.k > 1 else codes[:0]
+
+    @property
+    def counts(self) -> Union[np.ndarray, dict]:
+        return self._dense if self._dense is not None else self._sparse
+
+    def distinct(self) -> int:
+        return int(np.count_nonzero(self._dense)) if self._dense is not None else len(self._sparse)
+
+
+def count_kmers_streaming(chunks: Iterable[Union[str, EncodedSequence]], k: int, canonical: bool = False) -> KmerCounter:
+    """Feeds every chunk to a KmerCounter and returns it."""
+    counter = KmerCounter(k, canonical)
+    for chunk in chunks:
+        counter.update(chunk)
+    return counter
@@ -0,0 +1,176 @@
+"""
+Nearest-Neighbor Melting Temperature
+
+Duplex Tm from the SantaLucia (1998) unified nearest-neighbor parameters:
+
+    Tm = 1000 * dH / (dS + R * ln(C)) - 273.15
+
+where dH and dS sum the ten Watson-Crick dinucleotide stacks plus terminal
+initiation terms, C is the strand concentration term (C_T / 4, or C_T for
+self-complementary oligos), and dS gets the SantaLucia salt correction
+0.368 * (N - 1) * ln[Na+]. Mg2+ is folded into an equivalent Na+
+concentration (von Ahsen et al. 2001): Na_eq = Na + 120 * sqrt(Mg - dNTPs), in mM.
+
+The parameters are kept in tenths of kcal/mol and cal/(K*mol) so window sums
+built from prefix sums are exact integers; the scalar, batch and per-window
+APIs therefore agree bit for bit.
+"""
+import math
+from typing import Iterable, Union
+
+import numpy as np
+
+from biokit.encoded_sequence import COMPLEMENT_CODES, N_CODE, EncodedSequence, as_encoded
+
+GAS_CONSTANT = 1.987  # cal/(K*mol)
+
+# 5'-XY-3' stacks (dH kcal/mol, dS cal/(K*mol)); XY and its reverse complement share values.
+NN_PARAMS = {
+    "AA": (-7.9, -22.2), "TT": (-7.9, -22.2),
+    "AT": (-7.2, -20.4),
+    "TA": (-7.2, -21.3),
+    "CA": (-8.5, -22.7), "TG": (-8.5, -22.7),
+    "GT": (-8.4, -22.4), "AC": (-8.4, -22.4),
+    "CT": (-7.8, -21.0), "AG": (-7.8, -21.0),
+    "GA": (-8.2, -22.2), "TC": (-8.2, -22.2),
+    "CG": (-10.6, -27.2),
+    "GC": (-9.8, -24.4),
+    "GG": (-8.0, -19.9), "CC": (-8.0, -19.9),
+}
+TERMINAL_AT = (2.3, 4.1)
+TERMINAL_GC = (0.1, -2.8)
+SYMMETRY_DS = -1.4
+
+# Lookup tables indexed by dinucleotide code 4*first + second, and by base code.
+_NN_DH = np.zeros(16, dtype=np.int64)
+_NN_DS = np.zeros(16, dtype=np.int64)
+for _pair, (_dh, _ds) in NN_PARAMS.items():
+    _code = "ACGT".index(_pair[0]) * 4 + "ACGT".index(_pair[1])
+    _NN_DH[_code], _NN_DS[_code] = round(_dh * 10), round(_ds * 10)
+_INIT_DH = np.array([round(v * 10) for v in (TERMINAL_AT[0], TERMINAL_GC[0], TERMINAL_GC[0], TERMINAL_AT[0])], dtype=np.int64)
+_INIT_DS = np.array([round(v * 10) for v in (TERMINAL_AT[1], TERMINAL_GC[1], TERMINAL_GC[1], TERMINAL_AT[1])], dtype=np.int64)
+
+
+def _tm_from_sums(dh, ds, length, self_complementary, na, mg, dntps, dna_conc):
+    """Tm (°C) from stack sums in tenths of kcal/mol and cal/(K*mol)."""
+    na_eq = na + 120.0 * math.sqrt(max(mg - dntps, 0.0))
+    ds = ds / 10.0 + 0.368 * (length - 1) * math.log(na_eq / 1000.0)
+    ds = np.where(self_complementary, ds + SYMMETRY_DS, ds)
+    concentration = np.where(self_complementary, dna_conc, dna_conc / 4.0) * 1e-9
+    return 1000.0 * (dh / 10.0) / (ds + GAS_CONSTANT * np.log(concentration)) - 273.15
+
+
+def tm_nn_batch(oligos: Iterable[Union[str, EncodedSequence]], na: float = 50.0, mg: float = 0.0,
+                dntps: float = 0.0, dna_conc: float = 250.0) -> np.ndarray:
+    """
+    Nearest-neighbor Tm of many oligos at once.
+
+    Args:
+        oligos (iterable of str | EncodedSequence): Oligonucleotides, 5'->3'.
+        na (float): Monovalent cation concentration (mM).
+        mg (float): Mg2+ concentration (mM).
+        dntps (float): dNTP concentration (mM); dNTPs chelate Mg2+.
+        dna_conc (float): Total strand concentration (nM).
+
+    Returns:
+        np.ndarray: Tm in °C per oligo; NaN for oligos shorter than 2 bases
+                    or containing a non-ACGT base.
+    """
+    encoded = [as_encoded(oligo).codes for oligo in oligos]
+    tm = np.full(len(encoded), np.nan)
+    usable = [i for i, codes in enumerate(encoded) if len(codes) >= 2]
+    if usable:
+        tm[usable] = _tm_nn_codes([encoded[i] for i in usable], na, mg, dntps, dna_conc)
+    return tm
+
+
+def _tm_nn_codes(encoded: list, na: float, mg: float, dntps: float, dna_conc: float) -> np.ndarray:
+    """tm_nn_batch over base-code arrays of at least 2 bases each, so every oligo owns a stack."""
+    lengths = np.array([len(codes) for codes in encoded], dtype=np.int64)
+    codes = np.concatenate(encoded).astype(np.int64)
+    offsets = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+
+    # Stack sums over the concatenation; stacks straddling two oligos are zeroed.
+    dinucleotides = (codes[:-1] & 3) * 4 + (codes[1:] & 3)
+    stack_dh = _NN_DH[dinucleotides]
+    stack_ds = _NN_DS[dinucleotides]
+    junctions = offsets[1:] - 1
+    stack_dh[junctions] = 0
+    stack_ds[junctions] = 0
+    dh = np.add.reduceat(stack_dh, offsets)
+    ds = np.add.reduceat(stack_ds, offsets)
+
+    first = codes[offsets] & 3
+    last = codes[offsets + lengths - 1] & 3
+    dh = dh + _INIT_DH[first] + _INIT_DH[last]
+    ds = ds + _INIT_DS[first] + _INIT_DS[last]
+
+    invalid = np.add.reduceat((codes == N_CODE).astype(np.int64), offsets) > 0
+    self_complementary = np.array([np.array_equal(c, COMPLEMENT_CODES[c[::-1]]) for c in encoded])
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        tm = _tm_from_sums(dh, ds, lengths, self_complementary, na, mg, dntps, dna_conc)
+    tm[invalid] = np.nan
+    return tm
+
+
+def tm_nn(sequence: Union[str, EncodedSequence], na: float = 50.0, mg: float = 0.0,
+          dntps: float = 0.0, dna_conc: float = 250.0) -> float:
+    """
+    Nearest-neighbor Tm (°C) of a single oligo; see tm_nn_batch for the arguments.
+
+    Raises:
+        ValueError: If the oligo is shorter than 2 bases or contains a non-ACGT base.
+    """
+    tm = float(tm_nn_batch([sequence], na, mg, dntps, dna_conc)[0])
+    if math.isnan(tm):
+        raise ValueError("Nearest-neighbor Tm needs at least 2 bases, all of them A, C, G or T.")
+    return tm
+
+
+def window_tm(sequence: Union[str, EncodedSequence], length: int, na: float = 50.0, mg: float = 0.0,
+              dntps: float = 0.0, dna_conc: float = 250.0) -> np.ndarray:
+    """
+    Nearest-neighbor Tm of every window of a template, from prefix sums of the stack terms.
+
+    Args:
+        sequence (str | EncodedSequence): Template sequence.
+        length (int): Window (oligo) length, at least 2.
+
+    Returns:
+        np.ndarray: Tm per window start (len(sequence) - length + 1 values);
+                    NaN for windows containing a non-ACGT base.
+    """
+    if length < 2:
+        raise ValueError("Window length must be at least 2.")
+    codes = as_encoded(sequence).codes
+    count = len(codes) - length + 1
+    if count <= 0:
+        return np.zeros(0)
+
+    bases = (codes & 3).astype(np.int64)
+    dinucleotides = bases[:-1] * 4 + bases[1:]
+    sums = []
+    for table in (_NN_DH, _NN_DS):
+        prefix = np.zeros(len(dinucleotides) + 1, dtype=np.int64)
+        np.cumsum(table[dinucleotides], out=prefix[1:])
+        sums.append(prefix[length - 1:length - 1 + count] - prefix[:count])
+    first, last = bases[:count], bases[length - 1:]
+    dh = sums[0] + _INIT_DH[first] + _INIT_DH[last]
+    ds = sums[1] + _INIT_DS[first] + _INIT_DS[last]
+
+    # A window is self-complementary when it mirrors its own complement.
+    self_complementary = np.zeros(count, dtype=bool)
+    if length % 2 == 0:
+        self_complementary[:] = True
+        complement = COMPLEMENT_CODES[codes]
+        for offset in range(length // 2):
+            self_complementary &= codes[offset:offset + count] == complement[length - 1 - offset:length - 1 - offset + count]
+
+    n_prefix = np.zeros(len(codes) + 1, dtype=np.int32)
+    np.cumsum(codes == N_CODE, out=n_prefix[1:])
+    invalid = n_prefix[length:] - n_prefix[:count] > 0
+
+    tm = _tm_from_sums(dh, ds, length, self_complementary, na, mg, dntps, dna_conc)
+    tm[invalid] = np.nan
+    return tm
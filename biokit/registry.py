@@ -0,0 +1,218 @@
+"""
+Tool Registry
+
+One entry per BioKit analysis that can run on a single sequence without user
+interaction, keyed by its command-line name. Each entry names the pure-logic
+function (called as function(sequence, **params)) and the parameters exposed
+to the CLI, so the command-line interface, the batch runner and Python
+pipelines share one definition and never import the Streamlit components.
+
+The Mutation Hotspot Detector is not registered: its mutation positions
+belong to a single sequence rather than to each record of a file.
+
+SCANS lists the genome-scale sliding-window scans of biokit.streaming, which
+read a whole file (FASTA, or VCF/BED for hotspots) block by block in constant
+memory instead of running once per record.
+"""
+import os
+from typing import Any, Callable, Iterable, Iterator, NamedTuple, Optional, Union
+
+from biokit.batch import result_rows, run_batch
+from biokit.fasta_reader import Source, iter_records
+from biokit.streaming import (DEFAULT_BLOCK_SIZE, DEFAULT_MAX_REPEAT_LENGTH, stream_entropy_profile, stream_gc_profile,
+                              stream_hotspots, stream_microsatellites)
+from biokit1.tools.calculate_codon_frequency import calculate_codon_frequency
+from biokit1.tools.calculate_gc_content import gc_content
+from biokit1.tools.complement import complement_sequence
+from biokit1.tools.count_neucleotide import count_nucleotides
+from biokit1.tools.find_palindromes import find_palindromes
+from biokit1.tools.melting_temp import calculate_tm
+from biokit1.tools.molecular_wt import calculate_molecular_weight
+from biokit1.tools.reverse_complement import get_reverse_complement
+from biokit1.tools.transcription import transcribe_dna
+from biokit1.tools.translate_dna import translate_dna, translate_six_frames
+from biokit2.data.codon_usage import CODON_USAGE_TABLES
+from biokit2.data.genetic_code import NCBI_GENETIC_CODES
+from biokit2.data.pwm_data import EXAMPLE_MATRICES
+from biokit2.data.restriction_enzyme import restriction_enzymes
+from biokit2.tools.codon_optimization.codon_optimizer_logic import optimize_sequence
+from biokit2.tools.microsatellite_finder.microsatellite_logic import find_microsatellites
+from biokit2.tools.motif_finder.motif_logic import find_motif_sites
+from biokit2.tools.orf_finder.orf_logic import find_orfs
+from biokit2.tools.palindrome_inverted.palindrome_inverted import find_inverted_repeats, find_perfect_palindromes
+from biokit2.tools.primer_design.primer_design import design_primer_pairs
+from biokit2.tools.pwm_scanner.pwm_logic import parse_jaspar, scan_pwms
+from biokit2.tools.restriction_site.restriction_logic import find_restriction_sites
+from biokit2.tools.sequence_complexity.seq_complexity import estimate_sequence_complexity
+from biokit2.tools.splice_side_predictor.splice_logic import find_splice_sites
+
+
+class Param(NamedTuple):
+    """A tool keyword argument exposed on the command line as --<name with dashes>."""
+    name: str
+    type: Callable = str
+    default: Any = None
+    help: str = ""
+    multiple: bool = False
+    choices: Optional[tuple] = None
+
+
+class ToolSpec(NamedTuple):
+    title: str
+    function: Callable
+    params: tuple = ()
+    labels: Optional[tuple] = None  # group names for tools returning a tuple of lists
+
+
+def read_jaspar_file(path: str) -> list:
+    """Loads the matrices of a JASPAR file (used as the type of the PWM --matrices option)."""
+    with open(path, encoding="utf-8") as handle:
+        return parse_jaspar(handle.read())
+
+
+def read_genome_lengths(path: str) -> dict:
+    """Loads chromosome lengths from a .fai index or a two-column 'name<TAB>length' genome file."""
+    lengths = {}
+    with open(path, encoding="utf-8") as handle:
+        for line in handle:
+            fields = line.split()
+            if len(fields) >= 2 and not line.startswith("#"):
+                lengths[fields[0]] = int(fields[1])
+    return lengths
+
+
+TOOLS = {
+    "revcomp": ToolSpec("Reverse Complement", get_reverse_complement),
+    "complement": ToolSpec("Complement Sequence", complement_sequence),
+    "codon-frequency": ToolSpec("Codon Frequency", calculate_codon_frequency),
+    "gc": ToolSpec("GC Content", gc_content),
+    "transcribe": ToolSpec("Transcription (DNA → RNA)", transcribe_dna),
+    "translate": ToolSpec("Translation (DNA → Protein)", translate_dna, (
+        Param("table", int, 1, "NCBI translation table", choices=tuple(NCBI_GENETIC_CODES)),
+        Param("to_stop", bool, True, "stop at the first stop codon"))),
+    "six-frame": ToolSpec("Six-Frame Translation", translate_six_frames, (
+        Param("table", int, 1, "NCBI translation table", choices=tuple(NCBI_GENETIC_CODES)),
+        Param("to_stop", bool, False, "stop each frame at its first stop codon"))),
+    "count": ToolSpec("Nucleotide Count", count_nucleotides),
+    "palindromes": ToolSpec("Find Palindromes", find_palindromes, (
+        Param("length", int, 4, "palindrome length"),)),
+    "tm": ToolSpec("Melting Temperature", calculate_tm, (
+        Param("method", str, "nearest_neighbor", "Tm method", choices=("nearest_neighbor", "empirical")),
+        Param("na", float, 50.0, "Na+ concentration (mM)"),
+        Param("mg", float, 0.0, "Mg2+ concentration (mM)"),
+        Param("dna_conc", float, 250.0, "oligo concentration (nM)"))),
+    "mw": ToolSpec("Molecular Weight", calculate_molecular_weight),
+    "motifs": ToolSpec("Motif Finder", find_motif_sites, (
+        Param("motifs", str.upper, ["TATAAA"], "motif to search (IUPAC codes allowed); repeatable", multiple=True),
+        Param("both_strands", bool, True, "also search the reverse strand"))),
+    "pwm": ToolSpec("PWM Scanner", scan_pwms, (
+        Param("matrices", read_jaspar_file, parse_jaspar(EXAMPLE_MATRICES), "JASPAR matrix file (default: example matrices)"),
+        Param("pvalue", float, 1e-4, "p-value threshold"),
+        Param("both_strands", bool, True, "also scan the reverse strand"))),
+    "orfs": ToolSpec("ORF Finder", find_orfs, (
+        Param("min_length", int, 0, "minimum ORF length in nucleotides"),
+        Param("start_codons", str.upper, ["ATG"], "start codon; repeatable", multiple=True),
+        Param("both_strands", bool, True, "also scan the reverse strand"))),
+    "splice-sites": ToolSpec("Splice Site Predictor", find_splice_sites, labels=("donor", "acceptor")),
+    "codon-optimize": ToolSpec("Codon Optimization", optimize_sequence, (
+        Param("host", str, "E_coli", "host organism", choices=tuple(CODON_USAGE_TABLES)),
+        Param("strategy", str, "most_frequent", "codon choice strategy", choices=("most_frequent", "weighted_random", "harmonize")),
+        Param("seed", int, None, "random seed for weighted_random"))),
+    "microsatellites": ToolSpec("Microsatellite Finder", find_microsatellites, (
+        Param("min_unit_len", int, 2, "shortest repeat unit"),
+        Param("max_unit_len", int, 6, "longest repeat unit"),
+        Param("min_repeats", int, 5, "minimum number of copies"),
+        Param("max_mismatches", int, 0, "substitutions allowed per repeat"))),
+    "restriction-sites": ToolSpec("Restriction Site Mapper", find_restriction_sites, (
+        Param("selected_enzymes", str, list(restriction_enzymes)[:4], "enzyme name; repeatable", multiple=True,
+              choices=tuple(restriction_enzymes)),)),
+    "perfect-palindromes": ToolSpec("Perfect Palindromes", find_perfect_palindromes, (
+        Param("min_len", int, 4, "minimum palindrome length"),)),
+    "inverted-repeats": ToolSpec("Inverted Repeats", find_inverted_repeats, (
+        Param("min_len", int, 4, "minimum repeat length"),
+        Param("max_len", int, 12, "maximum repeat length"),
+        Param("max_spacer", int, 3, "maximum spacer length"),
+        Param("max_mismatches", int, 1, "mismatches allowed between the arms"))),
+    "complexity": ToolSpec("Sequence Complexity Estimator", estimate_sequence_complexity, (
+        Param("k", int, 3, "k-mer size for the diversity score"),)),
+    "primers": ToolSpec("Optimal Primer Designer", design_primer_pairs, (
+        Param("primer_length", int, 20, "primer length"),
+        Param("tm_tolerance", float, 2, "maximum Tm difference within a pair"),
+        Param("top_n", int, 5, "pairs reported per record"))),
+}
+
+_BLOCK_PARAM = Param("block_size", int, DEFAULT_BLOCK_SIZE, "bases per block (bounds memory use)")
+
+SCANS = {
+    "gc": ToolSpec("GC Content Profile", stream_gc_profile, (
+        Param("window_size", int, 1000, "window length"),
+        Param("step", int, 100, "distance between window starts"),
+        Param("include_skew", bool, True, "also report GC and AT skew"),
+        _BLOCK_PARAM)),
+    "entropy": ToolSpec("Entropy Profile", stream_entropy_profile, (
+        Param("window_size", int, 64, "window length"),
+        Param("step", int, 16, "distance between window starts"),
+        Param("k", int, 1, "entropy over k-mers"),
+        _BLOCK_PARAM)),
+    "microsatellites": ToolSpec("Microsatellite Scan", stream_microsatellites, (
+        Param("min_unit_len", int, 2, "shortest repeat unit"),
+        Param("max_unit_len", int, 6, "longest repeat unit"),
+        Param("min_repeats", int, 5, "minimum number of copies"),
+        Param("max_mismatches", int, 0, "substitutions allowed per repeat"),
+        Param("max_repeat_length", int, DEFAULT_MAX_REPEAT_LENGTH, "longest repeat reported exactly (block overlap)"),
+        _BLOCK_PARAM)),
+    "hotspots": ToolSpec("Mutation Hotspots (VCF/BED input)", stream_hotspots, (
+        Param("lengths", read_genome_lengths, None, ".fai or genome file with chromosome lengths (default: VCF ##contig lengths, else last variant)"),
+        Param("window_size", int, 1000, "window length"),
+        Param("step", int, 100, "distance between window starts"),
+        Param("alpha", float, 0.01, "family-wise significance level"),
+        _BLOCK_PARAM)),
+}
+
+
+def get_tool(command: str) -> ToolSpec:
+    if command not in TOOLS:
+        raise ValueError(f"Unknown tool '{command}'. Available: {', '.join(TOOLS)}.")
+    return TOOLS[command]
+
+
+def _with_defaults(spec: ToolSpec, params: Optional[dict]) -> dict:
+    merged = {param.name: param.default for param in spec.params if param.default is not None}
+    merged.update(params or {})
+    return merged
+
+
+def call_tool(command: str, sequence, **params) -> list[dict]:
+    """
+    Runs one registered tool on one sequence in-process.
+
+    Args:
+        command (str): Tool name from TOOLS (e.g. "orfs").
+        sequence (str | EncodedSequence): DNA sequence.
+        **params: Tool parameters; registry defaults fill the rest.
+
+    Returns:
+        list[dict]: The tool's result flattened into rows (see biokit.batch.result_rows).
+    """
+    spec = get_tool(command)
+    return result_rows(spec.function(sequence, **_with_defaults(spec, params)), spec.labels)
+
+
+def run_tool(command: str, source: Union[Source, Iterable], params: Optional[dict] = None, **batch_options) -> Iterator[dict]:
+    """
+    Runs one registered tool on every record of a FASTA/FASTQ file or record iterable.
+
+    Args:
+        command (str): Tool name from TOOLS.
+        source: Path or binary file object (streamed with iter_records), or an
+            iterable of SequenceRecord / (header, sequence) pairs.
+        params (dict, optional): Tool parameters; registry defaults fill the rest.
+        **batch_options: Passed to biokit.batch.run_batch (max_workers, chunk_size,
+            total, progress, should_cancel).
+
+    Yields:
+        dict: Result rows tagged with 'record_index' and 'record'.
+    """
+    spec = get_tool(command)
+    records = iter_records(source) if isinstance(source, (str, os.PathLike)) or hasattr(source, "read") else source
+    yield from run_batch(records, spec.function, _with_defaults(spec, params), spec.labels, **batch_options)
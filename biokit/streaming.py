@@ -0,0 +1,166 @@
+"""
+Streaming Sliding-Window Scans
+
+Runs the sliding-window tools over sequences of any size in constant memory.
+Each record is read in pieces (iter_sequence_chunks) and cut into blocks: a
+block owns a core interval of block_size bases and is given `left` and
+`right` bases of flanking context, sized so that every window or repeat that
+starts in the core lies entirely inside the block. The unchanged in-memory
+tool runs on each block, and only the results that start in the block's core
+are kept, shifted to record coordinates, so nothing is reported twice and no
+result is cut at a block boundary.
+
+Rows are yielded as soon as their block is done, in record and position
+order, so callers can write them out incrementally. Memory is bounded by the
+block size plus its context, independent of the chromosome length. Mutation
+hotspots need no sequence: their windows are counted from the sorted variant
+positions, block by block (see iter_hotspots).
+"""
+import os
+from itertools import groupby
+from typing import Iterable, Iterator, NamedTuple, Optional, Union
+
+from biokit.fasta_reader import Source, iter_sequence_chunks
+from biokit.variant_reader import read_contig_lengths, read_variant_positions
+from biokit1.tools.calculate_gc_content import sliding_base_profile
+from biokit2.tools.microsatellite_finder.microsatellite_logic import find_microsatellites
+from biokit2.tools.mutation_hotspot.mutation_hotspot import iter_hotspots
+from biokit2.tools.sequence_complexity.seq_complexity import sliding_entropy_profile
+
+DEFAULT_BLOCK_SIZE = 1 << 20
+DEFAULT_MAX_REPEAT_LENGTH = 10_000
+
+Chunks = Union[Source, Iterable[tuple[str, str]]]
+
+
+class Block(NamedTuple):
+    record: str
+    start: int   # first base of the core, in record coordinates
+    end: int     # end of the core (exclusive)
+    offset: int  # record coordinate of text[0]
+    text: str    # core plus the available flanking context
+
+
+def _chunks(source: Chunks, chunk_size: int) -> Iterator[tuple[str, str]]:
+    if isinstance(source, str) or hasattr(source, "read") or hasattr(source, "__fspath__"):
+        return iter_sequence_chunks(source, chunk_size)
+    return iter(source)
+
+
+def iter_blocks(source: Chunks, block_size: int = DEFAULT_BLOCK_SIZE, left: int = 0, right: int = 0) -> Iterator[Block]:
+    """
+    Cuts every record into consecutive cores of block_size bases with flanking context.
+
+    Args:
+        source: FASTA/FASTQ path or binary file object (read in pieces), or an
+            iterable of (header, chunk) pairs whose consecutive chunks with the
+            same header form one record, e.g. [("chr1", sequence)].
+        block_size (int): Core length; the cores tile each record.
+        left (int): Context bases before each core (fewer at the record start).
+        right (int): Context bases after each core (fewer at the record end).
+
+    Yields:
+        Block: Blocks in record and position order.
+    """
+    if block_size <= 0:
+        raise ValueError("block_size must be positive.")
+    for record, pieces in groupby(_chunks(source, block_size), key=lambda piece: piece[0]):
+        buffer, buffer_start, core = "", 0, 0
+        for _, piece in pieces:
+            buffer += piece
+            while buffer_start + len(buffer) >= core + block_size + right:
+                text_start = max(core - left, 0)
+                text = buffer[text_start - buffer_start:core + block_size + right - buffer_start]
+                yield Block(record, core, core + block_size, text_start, text)
+                core += block_size
+                drop = max(core - left, 0) - buffer_start
+                buffer, buffer_start = buffer[drop:], buffer_start + drop
+        end = buffer_start + len(buffer)
+        while core < end:
+            text_start = max(core - left, 0)
+            yield Block(record, core, min(core + block_size, end), text_start, buffer[text_start - buffer_start:])
+            core += block_size
+
+
+def _aligned(block_size: int, step: int) -> int:
+    """Rounds the block size up to a multiple of the step so window starts stay on the global grid."""
+    return -(-block_size // step) * step
+
+
+def stream_gc_profile(source: Chunks, window_size: int = 100, step: int = 1, include_skew: bool = True,
+                      block_size: int = DEFAULT_BLOCK_SIZE) -> Iterator[dict]:
+    """
+    GC content (and skews) of every window of every record, block by block.
+
+    Yields:
+        dict: record, position (0-based window start), gc and, when requested,
+              gc_skew and at_skew, exactly as sliding_base_profile on the whole record.
+    """
+    for block in iter_blocks(source, _aligned(block_size, step), right=window_size - 1):
+        profile = sliding_base_profile(block.text, window_size, step, include_skew=include_skew)
+        owned = profile["positions"] + block.offset < block.end
+        columns = [key for key in ("gc", "gc_skew", "at_skew") if key in profile]
+        values = [profile[key][owned].tolist() for key in columns]
+        for position, *row in zip((profile["positions"][owned] + block.offset).tolist(), *values):
+            yield {"record": block.record, "position": position, **dict(zip(columns, row))}
+
+
+def stream_entropy_profile(source: Chunks, window_size: int = 20, step: int = 5, k: int = 1,
+                           block_size: int = DEFAULT_BLOCK_SIZE) -> Iterator[dict]:
+    """
+    Shannon entropy of every window of every record, block by block.
+
+    Yields:
+        dict: record, position (window centre, as in sliding_entropy_profile) and entropy.
+    """
+    for block in iter_blocks(source, _aligned(block_size, step), right=window_size - 1):
+        positions, entropies = sliding_entropy_profile(block.text, window_size, step, k)
+        positions = positions + block.offset
+        owned = positions - window_size // 2 < block.end
+        for position, entropy in zip(positions[owned].tolist(), entropies[owned].tolist()):
+            yield {"record": block.record, "position": position, "entropy": entropy}
+
+
+def stream_microsatellites(source: Chunks, min_unit_len: int = 2, max_unit_len: int = 6, min_repeats: int = 5,
+                           max_mismatches: int = 0, max_repeat_length: int = DEFAULT_MAX_REPEAT_LENGTH,
+                           block_size: int = DEFAULT_BLOCK_SIZE) -> Iterator[dict]:
+    """
+    Microsatellites of every record, block by block.
+
+    Blocks overlap by max_repeat_length on both sides, so results match
+    find_microsatellites on the whole record for every repeat (and every chain
+    of mismatch-linked repeat seeds) up to that length; a longer repeat is
+    reported truncated at the end of its block's context.
+
+    Yields:
+        dict: record plus the find_microsatellites fields, with 1-based record coordinates.
+    """
+    for block in iter_blocks(source, block_size, left=max_repeat_length, right=max_repeat_length):
+        for repeat in find_microsatellites(block.text, min_unit_len, max_unit_len, min_repeats, max_mismatches):
+            start = repeat["start"] - 1 + block.offset
+            if block.start <= start < block.end:
+                yield {"record": block.record, **repeat, "start": start + 1, "end": repeat["end"] + block.offset}
+
+
+def stream_hotspots(variant_source: Source, lengths: Optional[dict] = None, window_size: int = 1000, step: int = 100,
+                    alpha: float = 0.01, block_size: int = DEFAULT_BLOCK_SIZE) -> Iterator[dict]:
+    """
+    Mutation hotspots of every chromosome of a VCF/BED file.
+
+    Args:
+        variant_source: VCF or BED path or binary file object (plain or gzipped).
+        lengths (dict, optional): Chromosome lengths; defaults to the ##contig
+            lengths of a VCF path. A chromosome missing from both is assumed to
+            end at its last variant.
+        window_size, step, alpha: As in find_hotspots.
+        block_size (int): Window starts evaluated per block.
+
+    Yields:
+        dict: record plus the find_hotspots fields (0-based start, exclusive end).
+    """
+    if lengths is None and isinstance(variant_source, (str, os.PathLike)):
+        lengths = read_contig_lengths(variant_source)
+    for chrom, positions in read_variant_positions(variant_source).items():
+        length = (lengths or {}).get(chrom, int(positions.max()) + 1 if positions.size else 0)
+        for hotspot in iter_hotspots(positions, length, window_size, step, alpha, block_size):
+            yield {"record": chrom, **hotspot}
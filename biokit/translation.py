@@ -0,0 +1,128 @@
+"""
+Translation Engine
+
+Codons are translated through 65-entry lookup arrays indexed by codon code
+(16*first + 4*second + third over A=0, C=1, G=2, T=3; 64 = a codon containing
+any other base, translated as 'X'). The sequence is encoded once, the codon
+code of every position is computed in one vectorised pass, and a reading
+frame is a strided slice of that array, so all six frames cost two passes
+(forward and reverse complement) plus one fancy-indexing lookup per frame.
+
+Genetic codes follow the NCBI numbering (1 = standard, 2 = vertebrate
+mitochondrial, 11 = bacterial, archaeal and plant plastid, ...), compiled
+once per table from NCBI_GENETIC_CODES.
+"""
+from functools import lru_cache
+from itertools import product
+from typing import Iterable, Union
+
+import numpy as np
+
+from biokit.encoded_sequence import ENCODE_TABLE, N_CODE, EncodedSequence, as_encoded
+from biokit2.data.genetic_code import NCBI_GENETIC_CODES
+
+INVALID_CODON = 64
+UNKNOWN_AMINO_ACID = "X"
+FRAMES = (1, 2, 3, -1, -2, -3)
+
+# Codon code of each codon in NCBI order (TTT, TTC, TTA, TTG, TCT, ...).
+_NCBI_ORDER = np.array([16 * ENCODE_TABLE[ord(a)] + 4 * ENCODE_TABLE[ord(b)] + ENCODE_TABLE[ord(c)]
+                        for a, b, c in product("TCAG", repeat=3)], dtype=np.int64)
+
+
+def _genetic_code(table: int) -> tuple:
+    if table not in NCBI_GENETIC_CODES:
+        raise ValueError(f"Unknown translation table {table}. Available: {', '.join(map(str, NCBI_GENETIC_CODES))}.")
+    return NCBI_GENETIC_CODES[table]
+
+
+@lru_cache(maxsize=None)
+def translation_table(table: int = 1) -> np.ndarray:
+    """Amino-acid letters (as uint8) indexed by codon code for an NCBI table."""
+    _, amino_acids, _ = _genetic_code(table)
+    lookup = np.full(INVALID_CODON + 1, ord(UNKNOWN_AMINO_ACID), dtype=np.uint8)
+    lookup[_NCBI_ORDER] = np.frombuffer(amino_acids.encode("ascii"), dtype=np.uint8)
+    return lookup
+
+
+def table_codons(table: int = 1, kind: str = "start") -> list[str]:
+    """
+    Start or stop codons of an NCBI table, e.g. as start_codons / stop_codons for find_orfs.
+
+    Args:
+        table (int): NCBI translation table id.
+        kind (str): "start" or "stop".
+
+    Returns:
+        list[str]: Codons in NCBI order.
+    """
+    _, amino_acids, starts = _genetic_code(table)
+    marks = starts if kind == "start" else amino_acids
+    symbol = "M" if kind == "start" else "*"
+    return ["".join(codon) for codon, mark in zip(product("TCAG", repeat=3), marks) if mark == symbol]
+
+
+def codon_codes(codes: np.ndarray, step: int = 1) -> np.ndarray:
+    """
+    Codon code of the triplet starting at every step-th position of an encoded sequence.
+
+    With step=1 there is one code per position (length n - 2); step=3 gives the
+    complete in-frame codons of frame 1. Codons with a non-ACGT base are INVALID_CODON.
+    """
+    n = len(codes)
+    if n < 3:
+        return np.zeros(0, dtype=np.int16)
+    first, second, third = codes[0:n - 2:step], codes[1:n - 1:step], codes[2:n:step]
+    codons = first.astype(np.int16) * 16 + second * 4 + third
+    codons[(first == N_CODE) | (second == N_CODE) | (third == N_CODE)] = INVALID_CODON
+    return codons
+
+
+def _translate_codons(codons: np.ndarray, lookup: np.ndarray, to_stop: bool) -> str:
+    protein = lookup[codons].tobytes()
+    if to_stop:
+        stop = protein.find(b"*")
+        if stop >= 0:
+            protein = protein[:stop]
+    return protein.decode("ascii")
+
+
+def translate(sequence: Union[str, EncodedSequence], table: int = 1, frame: int = 1, to_stop: bool = False) -> str:
+    """
+    Translates one reading frame of a DNA sequence.
+
+    Args:
+        sequence (str | EncodedSequence): DNA sequence; codons with non-ACGT bases become 'X'.
+        table (int): NCBI translation table id.
+        frame (int): 1, 2, 3 (forward) or -1, -2, -3 (reverse complement).
+        to_stop (bool): Stop before the first stop codon instead of translating through it as '*'.
+
+    Returns:
+        str: Protein sequence; a trailing partial codon is ignored.
+    """
+    return translate_frames(sequence, table, to_stop, (frame,))[frame]
+
+
+def translate_frames(sequence: Union[str, EncodedSequence], table: int = 1, to_stop: bool = False,
+                     frames: Iterable[int] = FRAMES) -> dict[int, str]:
+    """
+    Translates several reading frames at once (all six by default).
+
+    Args:
+        sequence (str | EncodedSequence): DNA sequence.
+        table (int): NCBI translation table id.
+        to_stop (bool): Stop each frame before its first stop codon.
+        frames (iterable of int): Frames among 1, 2, 3, -1, -2, -3.
+
+    Returns:
+        dict: frame -> protein sequence, in the requested order.
+    """
+    frames = tuple(frames)
+    if any(frame not in FRAMES for frame in frames):
+        raise ValueError(f"Frames must be among {FRAMES}.")
+    lookup = translation_table(table)
+    seq = as_encoded(sequence)
+    forward = codon_codes(seq.codes) if any(frame > 0 for frame in frames) else None
+    reverse = codon_codes(seq.reverse_complement().codes) if any(frame < 0 for frame in frames) else None
+    return {frame: _translate_codons((forward if frame > 0 else reverse)[abs(frame) - 1::3], lookup, to_stop)
+            for frame in frames}
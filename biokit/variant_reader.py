@@ -0,0 +1,96 @@
+"""
+Streaming VCF / BED Position Reader
+
+Reads variant or feature positions from VCF and BED files (plain or gzipped,
+paths or Streamlit uploads) into one NumPy array per chromosome. Lines are
+parsed one at a time and only the position column is kept, so files with
+millions of variants never build per-record Python objects; positions are
+collected in compact typed arrays and converted to NumPy once at the end.
+
+Positions are returned 0-based: VCF POS is 1-based and is shifted, BED start
+columns are already 0-based. Multi-base BED intervals and deletions are
+counted once, at their first base. Chromosome lengths declared in a VCF
+header (##contig=<ID=...,length=...>) are read by read_contig_lengths.
+"""
+import re
+from array import array
+from typing import Optional
+
+import numpy as np
+
+from biokit.fasta_reader import Source, open_sequence_file
+
+VARIANT_FORMATS = ("vcf", "bed")
+_BED_HEADERS = (b"#", b"track", b"browser")
+_CONTIG_FIELD = re.compile(rb"[<,](ID|length)=([^,>]+)")
+
+
+def _detect_format(line: bytes) -> str:
+    """Guesses the format of a header-less file from its first data line."""
+    fields = line.split(None, 3)
+    # BED: chrom, start, end (both integers); VCF: chrom, pos, id (usually '.' or rs...)
+    return "bed" if len(fields) >= 3 and fields[2].isdigit() else "vcf"
+
+
+def read_variant_positions(source: Source, fmt: Optional[str] = None) -> dict[str, np.ndarray]:
+    """
+    Reads the 0-based positions of every record of a VCF or BED file.
+
+    Args:
+        source: Path or binary file-like object (plain or gzip-compressed).
+        fmt (str, optional): "vcf" or "bed"; detected from the VCF header or the
+            columns of the first data line if omitted.
+
+    Returns:
+        dict: Chromosome name -> int64 array of 0-based positions, in file order,
+              with chromosomes in order of first appearance.
+
+    Raises:
+        ValueError: If fmt is unknown or a data line has no integer position.
+    """
+    if fmt is not None and fmt not in VARIANT_FORMATS:
+        raise ValueError(f"Unknown variant format '{fmt}'. Expected one of {', '.join(VARIANT_FORMATS)}.")
+    positions = {}
+    offset = None if fmt is None else (1 if fmt == "vcf" else 0)
+    current_chrom, current = None, None
+    with open_sequence_file(source) as stream:
+        for number, line in enumerate(stream, 1):
+            if offset is None and line.startswith((b"##fileformat=VCF", b"#CHROM")):
+                offset = 1
+            if line.startswith(_BED_HEADERS) or not line.strip():
+                continue
+            if offset is None:
+                offset = 1 if _detect_format(line) == "vcf" else 0
+            fields = line.split(None, 2)
+            try:
+                chrom, position = fields[0], int(fields[1]) - offset
+            except (IndexError, ValueError):
+                raise ValueError(f"Line {number}: expected a chromosome and an integer position.") from None
+            if chrom != current_chrom:
+                current_chrom = chrom
+                current = positions.setdefault(chrom, array("q"))
+            current.append(position)
+    return {chrom.decode("utf-8", errors="replace"): np.frombuffer(values, dtype=np.int64)
+            for chrom, values in positions.items()}
+
+
+def read_contig_lengths(source: Source) -> dict[str, int]:
+    """
+    Reads the chromosome lengths declared in a VCF header.
+
+    Only the ## meta lines are read; files without ##contig lengths (or BED
+    files) give an empty dict.
+
+    Returns:
+        dict: Chromosome name -> length in bases, in header order.
+    """
+    lengths = {}
+    with open_sequence_file(source) as stream:
+        for line in stream:
+            if not line.startswith(b"##"):
+                break
+            if line.startswith(b"##contig=<"):
+                fields = dict(_CONTIG_FIELD.findall(line))
+                if b"ID" in fields and fields.get(b"length", b"").strip().isdigit():
+                    lengths[fields[b"ID"].decode("utf-8", errors="replace")] = int(fields[b"length"])
+    return lengths
@@ -1,5 +1,7 @@
 # components/__init__.py
 # This file makes components a package.
-from .display import display_sequence
-from .input_box import dna_input_box
-from .plots import plot_nucleotide_composition
+from .display import display_sequence, display_translation_view
+from .sequence_viewer import render_sequence_viewer
+from .input_box import dna_input_box, fasta_upload_box, indexed_region_box
+from .plots import plot_nucleotide_composition, plot_codon_histogram, plot_gc_distribution
+from .batch_runner import render_batch_runner, BATCH_TOOLS
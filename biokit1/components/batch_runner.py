@@ -0,0 +1,99 @@
+import os
+import time
+
+import pandas as pd
+import streamlit as st
+
+from biokit.fasta_reader import iter_records, read_headers
+from biokit.registry import TOOLS, run_tool
+from biokit2.data.codon_usage import CODON_USAGE_TABLES
+from biokit2.data.pwm_data import EXAMPLE_MATRICES
+from biokit2.data.restriction_enzyme import restriction_enzymes
+from biokit2.tools.pwm_scanner.pwm_logic import parse_jaspar
+
+# Tool title -> registry command; every registered tool can run in batch mode.
+BATCH_TOOLS = {spec.title: command for command, spec in TOOLS.items()}
+
+TABLE_REFRESH_SECONDS = 0.5
+
+def _tool_params(tool: str, key: str) -> dict: #widgets for the parameters each tool needs
+    if tool == "Find Palindromes":
+        return {"length": st.number_input("Palindrome Length", 2, 12, 4, key=f"{key}_pal_len")}
+    if tool == "Melting Temperature":
+        return {"method": st.radio("Method", ["nearest_neighbor", "empirical"], horizontal=True, key=f"{key}_tm")}
+    if tool == "Motif Finder":
+        motifs = st.text_input("Motifs (comma-separated, IUPAC codes allowed)", "TATAAA", key=f"{key}_motifs")
+        return {"motifs": [m.strip().upper() for m in motifs.split(",") if m.strip()]}
+    if tool == "PWM Scanner":
+        matrices = parse_jaspar(EXAMPLE_MATRICES)
+        names = st.multiselect("Matrices", [m.name for m in matrices], default=[m.name for m in matrices], key=f"{key}_pwm")
+        exponent = st.slider("p-value threshold (10^-x)", 2, 8, 4, key=f"{key}_pvalue")
+        return {"matrices": [m for m in matrices if m.name in names], "pvalue": 10 ** -exponent}
+    if tool == "ORF Finder":
+        return {"min_length": st.number_input("Minimum ORF length (nt)", 6, 10000, 90, step=3, key=f"{key}_orf")}
+    if tool == "Codon Optimization":
+        return {"host": st.selectbox("Host Organism", list(CODON_USAGE_TABLES), key=f"{key}_host")}
+    if tool == "Microsatellite Finder":
+        return {"min_repeats": st.number_input("Min Repeats", 2, 100, 5, key=f"{key}_repeats")}
+    if tool == "Restriction Site Mapper":
+        enzymes = st.multiselect("Enzymes", list(restriction_enzymes), default=list(restriction_enzymes)[:4], key=f"{key}_enzymes")
+        return {"selected_enzymes": enzymes}
+    if tool == "Sequence Complexity Estimator":
+        return {"k": st.number_input("k-mer size", 1, 12, 3, key=f"{key}_k")}
+    if tool == "Optimal Primer Designer":
+        return {"primer_length": st.number_input("Primer Length", 15, 35, 20, key=f"{key}_primer")}
+    return {}
+
+def render_batch_runner(key="batch"): #runs one tool on every record of a multi-FASTA/FASTQ file
+    st.subheader("Batch Mode: Run a Tool on Every Record")
+    upload = st.file_uploader("Upload a multi-record FASTA/FASTQ file", type=["fasta", "fa", "fna", "fastq", "fq", "txt", "gz"], key=f"{key}_file")
+    tool = st.selectbox("Tool", list(BATCH_TOOLS), key=f"{key}_tool")
+    params = _tool_params(tool, key)
+
+    col1, col2 = st.columns(2)
+    workers = col1.number_input("Worker processes", 1, 64, os.cpu_count() or 1, key=f"{key}_workers")
+    chunk_size = col2.number_input("Records per task", 1, 10000, 64, key=f"{key}_chunk")
+
+    rows_key, status_key = f"{key}_rows", f"{key}_status"
+    run_col, cancel_col = st.columns([1, 5])
+    run = run_col.button("Run Batch", key=f"{key}_run", disabled=not upload)
+    cancel_col.button("Cancel", key=f"{key}_cancel") #any rerun interrupts the running batch
+
+    if run and upload:
+        try:
+            total = len(read_headers(upload)) #header scan only, records are streamed to the workers
+        except ValueError as err:
+            st.error(f"Could not read the uploaded file: {err}")
+            return
+        rows = st.session_state[rows_key] = []
+        st.session_state[status_key] = ("running", tool, 0, total)
+        bar = st.progress(0.0, text=f"0 / {total} records")
+        table = st.empty()
+
+        def report(done, total):
+            st.session_state[status_key] = ("running", tool, done, total)
+            bar.progress(done / total if total else 1.0, text=f"{done} / {total} records")
+
+        last_refresh = 0.0
+        for row in run_tool(BATCH_TOOLS[tool], iter_records(upload), params, max_workers=workers,
+                            chunk_size=chunk_size, total=total, progress=report):
+            rows.append(row)
+            if time.monotonic() - last_refresh > TABLE_REFRESH_SECONDS:
+                table.dataframe(pd.DataFrame(rows[-1000:]), use_container_width=True)
+                last_refresh = time.monotonic()
+        st.session_state[status_key] = ("complete", tool, total, total)
+        table.empty()
+
+    status = st.session_state.get(status_key)
+    if not status:
+        return
+    state, tool_name, done, total = status
+    rows = st.session_state.get(rows_key, [])
+    if state == "running": #the previous run was interrupted before it finished
+        st.warning(f"{tool_name}: batch cancelled after {done} of {total} records.")
+    else:
+        st.success(f"{tool_name}: processed {total} records, {len(rows)} result rows.")
+    if rows:
+        df = pd.DataFrame(rows).sort_values("record_index", kind="stable")
+        st.dataframe(df, use_container_width=True, hide_index=True)
+        st.download_button("Download CSV", df.to_csv(index=False), file_name="biokit_batch.csv", mime="text/csv", key=f"{key}_download")
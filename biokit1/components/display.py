@@ -1,12 +1,60 @@
 import streamlit as st
 
-def display_sequence(title: str, sequence: str):
+from .sequence_viewer import INLINE_LIMIT, render_sequence_viewer
+
+TRANSLATION_VIEW_CODONS = 200
+
+def display_sequence(title: str, sequence: str, key=None):
     """
     Displays a DNA or RNA sequence with a title.
 
+    Long sequences are shown page by page in the sequence viewer instead of
+    being sent to the browser whole.
+
     Args:
         title (str): Title above the sequence (e.g., "Original Sequence").
         sequence (str): The nucleotide sequence string.
+        key (str, optional): Widget key prefix; defaults to one derived from the title.
     """
     st.markdown(f"<h3 style='color:#000000; font-family: Courier New, monospace;'>{title}</h3>", unsafe_allow_html=True)
-    st.code(sequence, language="text")
+    if len(sequence) <= INLINE_LIMIT:
+        st.code(sequence, language="text")
+    else:
+        render_sequence_viewer(sequence, key=key or f"display_{title}")
+
+
+def display_translation_view(dna_seq, rna_seq, protein_seq, codons_per_page=TRANSLATION_VIEW_CODONS, key="translation_view"):
+    def chunk_string(s, chunk_size):
+        return [s[i:i+chunk_size] for i in range(0, len(s), chunk_size)]
+
+    # Only one page of codons is laid out, so long sequences do not flood the page
+    codons = max(len(dna_seq) // 3, 1)
+    if codons > codons_per_page:
+        first = st.number_input(f"First codon (of {codons:,})", min_value=1, max_value=codons, value=1,
+                                step=codons_per_page, key=f"{key}_codon") - 1
+        dna_seq = dna_seq[3 * first:3 * (first + codons_per_page)]
+        rna_seq = rna_seq[3 * first:3 * (first + codons_per_page)]
+        protein_seq = protein_seq[first:first + codons_per_page]
+
+    codons_dna = chunk_string(dna_seq, 3)
+    codons_rna = chunk_string(rna_seq, 3)
+    protein_chunks = list(protein_seq)
+
+    # Added dictionary for amino acid full names
+    amino_acid_names = {
+        'A': 'Alanine', 'R': 'Arginine', 'N': 'Asparagine', 'D': 'Aspartic Acid',
+        'C': 'Cysteine', 'Q': 'Glutamine', 'E': 'Glutamic Acid', 'G': 'Glycine',
+        'H': 'Histidine', 'I': 'Isoleucine', 'L': 'Leucine', 'K': 'Lysine',
+        'M': 'Methionine', 'F': 'Phenylalanine', 'P': 'Proline', 'S': 'Serine',
+        'T': 'Threonine', 'W': 'Tryptophan', 'Y': 'Tyrosine', 'V': 'Valine',
+        '*': 'Stop'
+    }
+
+    protein_names = [amino_acid_names.get(aa, '?') for aa in protein_chunks]
+
+    st.markdown("### Translation Viewer")
+    st.markdown("**DNA Codons:** `" + " ".join(codons_dna) + "`")
+    st.markdown("**RNA Codons:** `" + " ".join(codons_rna) + "`")
+    st.markdown("**Protein:** `" + " ".join(protein_chunks) + "`")
+    # Added full names display
+    st.markdown("**Full Names:** " + ", ".join(protein_names))
@@ -1,4 +1,9 @@
+import os
+
 import streamlit as st
+from biokit.fasta_reader import read_headers, read_record
+from biokit.faidx import IndexedFasta, parse_region, resolve_reference_path
+from .sequence_viewer import INLINE_LIMIT, render_sequence_viewer
 
 def dna_input_box(label="Enter DNA Sequence", key="dna_input_box", height=100, max_chars=1000, placeholder="e.g. ATGCGTACGTTAGC"): #input box for DNA sequence
     dna_input = st.text_area(label,key=key, height=height, max_chars=max_chars, placeholder=placeholder) #
@@ -9,3 +14,96 @@ def dna_input_box(label="Enter DNA Sequence", key="dna_input_box", height=100, m
         return None
     
     return seq_str if dna_input else None
+
+def fasta_upload_box(label="Upload a FASTA file", key="fasta_upload_box"): #upload box for FASTA/FASTQ files (plain or gzipped)
+    fasta_file = st.file_uploader(label, type=["fasta", "fa", "fna", "fastq", "fq", "txt", "gz"], key=key)
+
+    if not fasta_file:
+        st.info("Please upload a valid FASTA file.")
+        return ""
+
+    try:
+        headers = read_headers(fasta_file) #only headers are scanned, no sequence is built yet
+    except ValueError as err:
+        st.error(f"Could not read the uploaded file: {err}")
+        return ""
+
+    if not headers:
+        st.warning("No sequence records found in the uploaded file.")
+        return ""
+
+    if len(headers) == 1:
+        index = 0
+    else:
+        index = st.selectbox("Select a sequence", range(len(headers)), format_func=headers.__getitem__, key=f"{key}_record")
+
+    record = read_record(fasta_file, index) #builds only the selected record
+    st.success(f"Selected: {record.header}")
+    if len(record.sequence) <= INLINE_LIMIT:
+        st.code(record.sequence, language="text")
+    else:
+        render_sequence_viewer(record.sequence, key=f"{key}_viewer")
+    return record.sequence
+
+REFERENCE_DIR_ENV = "BIOKIT_REFERENCE_DIR"
+FASTA_SUFFIXES = (".fa", ".fasta", ".fna")
+
+@st.cache_resource(show_spinner="Indexing FASTA file...")
+def _open_indexed_fasta(path, mtime): #one memory-mapped handle per reference file (and version), shared across reruns
+    return IndexedFasta(path, write_index=False) #the web app never writes next to the references
+
+def _reference_files(root): #FASTA files under the configured reference directory, relative to it
+    found = []
+    for folder, _, files in os.walk(root):
+        found += [os.path.relpath(os.path.join(folder, name), root) for name in files if name.lower().endswith(FASTA_SUFFIXES)]
+    return sorted(name for name in found if _inside(name, root))
+
+def _inside(name, root): #symlinks pointing out of the reference directory are not offered
+    try:
+        resolve_reference_path(name, root)
+    except ValueError:
+        return False
+    return True
+
+def indexed_region_box(key="indexed_region_box", default_span=10000): #region selector over a large indexed reference FASTA
+    st.session_state.pop(f"{key}_location", None)
+    root = os.environ.get(REFERENCE_DIR_ENV)
+    if not root or not os.path.isdir(root):
+        st.info(f"Indexed regions are read from reference FASTA files on the server; set {REFERENCE_DIR_ENV} to the directory holding them.")
+        return ""
+    files = _reference_files(root)
+    if not files:
+        st.warning("No FASTA files (.fa, .fasta, .fna) found in the reference directory.")
+        return ""
+    choice = st.selectbox("Reference FASTA (uncompressed, indexed with .fai or indexed on first use)", files, key=f"{key}_path")
+
+    try:
+        path = resolve_reference_path(choice, root) #rejects anything resolving outside the reference directory
+        fasta = _open_indexed_fasta(path, os.path.getmtime(path))
+    except (OSError, ValueError) as err:
+        st.error(f"Could not open indexed FASTA: {err}")
+        return ""
+
+    if not fasta.names:
+        st.warning("No sequence records found in the FASTA file.")
+        return ""
+
+    first = fasta.names[0]
+    region = st.text_input("Region (name:start-end, 1-based)", value=f"{first}:1-{min(fasta.length(first), default_span)}", key=f"{key}_region")
+    st.caption("Available sequences: " + ", ".join(f"{name} ({fasta.length(name):,} bp)" for name in fasta.names[:20]) + (" ..." if len(fasta.names) > 20 else ""))
+
+    try:
+        name, start, end = parse_region(region, fasta.index)
+        seq = fasta.fetch(name, start, end) #only the requested region is read from the memory map
+    except (KeyError, ValueError) as err:
+        st.error(str(err))
+        return ""
+    #where the returned sequence lies, for tools taking chromosome coordinates (e.g. VCF/BED variants)
+    st.session_state[f"{key}_location"] = {"name": name, "start": start, "length": fasta.length(name)}
+
+    st.success(f"Selected: {region} ({len(seq):,} bp)")
+    if len(seq) <= INLINE_LIMIT:
+        st.code(seq, language="text")
+    else:
+        render_sequence_viewer(seq, key=f"{key}_viewer")
+    return seq
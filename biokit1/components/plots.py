@@ -1,12 +1,14 @@
 import matplotlib.pyplot as plt
-from collections import Counter
 import streamlit as st
+from biokit.encoded_sequence import as_encoded
+from biokit.cache import cached_call
+from biokit1.tools.calculate_gc_content import base_prefix_sums, sliding_base_profile, downsample_profile
 
-def plot_nucleotide_composition(sequence: str):
+def plot_nucleotide_composition(sequence):
     """
     Plots a compact nucleotide composition pie chart of the sequence.
     """
-    counts = Counter(sequence.upper())
+    counts = as_encoded(sequence).base_counts()
     labels = ['A', 'T', 'G', 'C']
     values = [counts.get(nuc, 0) for nuc in labels]
 
@@ -33,3 +35,49 @@ def plot_nucleotide_composition(sequence: str):
         col1, col2, col3 = st.columns([2, 1, 2])
         with col2:
             st.pyplot(fig)
+
+def plot_codon_histogram(codon_freq: dict):
+    """
+    Plot a histogram of codon frequencies using matplotlib and display in Streamlit.
+
+    Args:
+        codon_freq (dict): Dictionary with codon as key and frequency as value.
+    """
+    fig, ax = plt.subplots(figsize=(10, 4))  # Wide and short
+    ax.bar(codon_freq.keys(), codon_freq.values(), color='skyblue')
+    ax.set_xlabel('Codons')
+    ax.set_ylabel('Frequency')
+    ax.set_title('Codon Frequency Histogram')
+    plt.xticks(rotation=90)
+    plt.tight_layout()
+    st.pyplot(fig)
+
+def plot_gc_distribution(sequence):
+    window_size = st.slider("Window Size for GC Content", 5, 500, 100, step=10)
+    step = st.slider("Step Size", 1, 100, 1)
+    show_skew = st.checkbox("Show GC / AT skew", value=False)
+
+    prefix = cached_call(base_prefix_sums, sequence)  # reused when only the window or step changes
+    profile = sliding_base_profile(sequence, window_size, step, prefix=prefix, include_skew=show_skew)
+    positions, gc_values, gc_min, gc_max = downsample_profile(profile["positions"], profile["gc"])
+
+    fig, ax = plt.subplots(figsize=(10, 3))
+    if gc_min is not gc_values:
+        ax.fill_between(positions, gc_min, gc_max, color='green', alpha=0.2, linewidth=0)
+    ax.plot(positions, gc_values, color='green')
+    ax.set_xlabel("Position")
+    ax.set_ylabel("GC%")
+    ax.set_title(f'GC Content Distribution (window={window_size})')
+    st.pyplot(fig)
+
+    if show_skew:
+        fig, ax = plt.subplots(figsize=(10, 3))
+        for key, label, color in (("gc_skew", "GC skew", "royalblue"), ("at_skew", "AT skew", "darkorange")):
+            skew_positions, skew_values, _, _ = downsample_profile(profile["positions"], profile[key])
+            ax.plot(skew_positions, skew_values, color=color, label=label)
+        ax.axhline(0, color='gray', linewidth=0.5)
+        ax.set_xlabel("Position")
+        ax.set_ylabel("Skew")
+        ax.set_title(f'GC / AT Skew (window={window_size})')
+        ax.legend(loc="upper right")
+        st.pyplot(fig)
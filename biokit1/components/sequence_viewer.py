@@ -0,0 +1,68 @@
+import html
+
+import streamlit as st
+
+from biokit.annotation import label_runs, window_labels
+
+LINE_WIDTH = 60
+LINES_PER_PAGE = 20
+INLINE_LIMIT = 5000  # sequences up to this length are still shown whole
+
+
+def _page_html(text: str, labels, offset: int, colors: list, line_width: int) -> str:
+    """Builds the markup of one page: numbered lines with one span per run of equally annotated bases."""
+    width = len(f"{offset + len(text):,}")
+    lines = []
+    for line_start in range(0, len(text), line_width):
+        line_labels = labels[line_start:line_start + line_width]
+        pieces = [f"<span style='color:#888'>{offset + line_start + 1:>{width},}</span>  "]
+        for start, end, label in label_runs(line_labels):
+            chunk = html.escape(text[line_start + start:line_start + end])
+            if label:
+                pieces.append(f"<span style='background-color:{colors[label - 1]};font-weight:600'>{chunk}</span>")
+            else:
+                pieces.append(chunk)
+        lines.append("".join(pieces))
+    return ("<pre style='font-family:Courier New, monospace;background:#ffffff;color:#000000;"
+            "padding:0.6em;border-radius:6px;line-height:1.35'>" + "\n".join(lines) + "</pre>")
+
+
+def render_sequence_viewer(sequence, tracks=None, key="sequence_viewer", line_width=LINE_WIDTH, lines_per_page=LINES_PER_PAGE):
+    """
+    Paginated sequence viewer that only renders the visible page.
+
+    Args:
+        sequence (str | EncodedSequence): Sequence to show; only the current page is sliced out.
+        tracks (list, optional): (label, (starts, ends), color) per annotation track, with
+            interval arrays from biokit.annotation.merge_intervals; later tracks are drawn on top.
+        key (str): Unique widget key prefix.
+        line_width (int): Bases per line.
+        lines_per_page (int): Lines per page.
+    """
+    tracks = tracks or []
+    page_size = line_width * lines_per_page
+    pages = max(1, -(-len(sequence) // page_size))
+
+    if pages > 1:
+        col1, col2 = st.columns([1, 3])
+        with col1:
+            page = st.number_input(f"Page (of {pages:,})", min_value=1, max_value=pages, value=1, step=1, key=f"{key}_page")
+        with col2:
+            position = st.number_input("Go to position (1-based, overrides the page)", min_value=0, max_value=len(sequence),
+                                       value=0, step=page_size, key=f"{key}_position")
+        if position:
+            page = (position - 1) // page_size + 1
+    else:
+        page = 1
+
+    start = (page - 1) * page_size
+    end = min(start + page_size, len(sequence))
+    text = str(sequence[start:end])
+    labels = window_labels([intervals for _, intervals, _ in tracks], start, end)
+
+    if tracks:
+        st.markdown(" ".join(f"<span style='background-color:{color};padding:0 0.4em'>{html.escape(label)}</span>"
+                             for label, _, color in tracks), unsafe_allow_html=True)
+    st.markdown(_page_html(text, labels, start, [color for _, _, color in tracks], line_width), unsafe_allow_html=True)
+    if pages > 1:
+        st.caption(f"Showing bases {start + 1:,}–{end:,} of {len(sequence):,}.")
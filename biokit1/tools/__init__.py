@@ -1,12 +1,9 @@
 from .reverse_complement import get_reverse_complement
 from .complement import complement_sequence
 from .calculate_codon_frequency import calculate_codon_frequency 
-from .calculate_codon_frequency import plot_codon_histogram
-from .calculate_gc_content import gc_content_sliding_window
-from .calculate_gc_content import plot_gc_distribution
+from .calculate_gc_content import gc_content, gc_content_sliding_window
 from .transcription import transcribe_dna
-from .translate_dna import translate_dna
-from .translate_dna import display_translation_view
+from .translate_dna import translate_dna, translate_six_frames
 from .count_neucleotide import count_nucleotides
 from .find_palindromes import find_palindromes
 from .melting_temp import calculate_tm
@@ -1,33 +1,23 @@
-from collections import Counter
-import matplotlib.pyplot as plt
-import streamlit as st
+from biokit.kmers import count_kmers, kmer_counts_to_dict
 
-def calculate_codon_frequency(seq: str) -> dict:
+_RNA_TO_DNA = str.maketrans("Uu", "Tt")
+
+def calculate_codon_frequency(seq) -> dict:
     """
     Calculate the frequency of each codon (triplet) in a DNA/RNA sequence.
 
     Args:
-        seq (str): Input nucleotide sequence (should be divisible by 3 or trimmed).
+        seq (str | EncodedSequence): Input nucleotide sequence (should be divisible by 3 or trimmed).
+            RNA is counted with U read as T, and its codons are reported with U.
 
     Returns:
         dict: Dictionary with codon as key and frequency count as value.
     """
-    codons = [seq[i:i+3] for i in range(0, len(seq) - len(seq) % 3, 3)]
-    codon_counts = Counter(codons)
-    return dict(codon_counts)
-
-def plot_codon_histogram(codon_freq: dict):
-    """
-    Plot a histogram of codon frequencies using matplotlib and display in Streamlit.
-
-    Args:
-        codon_freq (dict): Dictionary with codon as key and frequency as value.
-    """
-    fig, ax = plt.subplots(figsize=(10, 4))  # Wide and short
-    ax.bar(codon_freq.keys(), codon_freq.values(), color='skyblue')
-    ax.set_xlabel('Codons')
-    ax.set_ylabel('Frequency')
-    ax.set_title('Codon Frequency Histogram')
-    plt.xticks(rotation=90)
-    plt.tight_layout()
-    st.pyplot(fig)
+    rna = isinstance(seq, str) and ("U" in seq or "u" in seq)
+    if rna:
+        seq = seq.translate(_RNA_TO_DNA)
+    # Codons are counted as 2-bit integer codes read in frame (step 3); codons with non-ACGU/T bases are skipped
+    counts = kmer_counts_to_dict(count_kmers(seq, 3, step=3), 3)
+    if rna:
+        return {codon.replace("T", "U"): count for codon, count in counts.items()}
+    return counts
@@ -1,23 +1,87 @@
-import streamlit as st
-import matplotlib.pyplot as plt
-def gc_content_sliding_window(sequence, window_size=100):
-    gc_values = []
-    positions = []
-    for i in range(0, len(sequence) - window_size + 1):
-        window = sequence[i:i+window_size]
-        gc_count = window.count('G') + window.count('C')
-        gc_percent = (gc_count / window_size) * 100
-        gc_values.append(gc_percent)
-        positions.append(i)
-    return positions, gc_values
-
-def plot_gc_distribution(sequence):
-    window_size = st.slider("Window Size for GC Content", 5, 500, 100, step=10)
-    positions, gc_values = gc_content_sliding_window(sequence, window_size)
-
-    fig, ax = plt.subplots(figsize=(10, 3))
-    ax.plot(positions, gc_values, color='green')
-    ax.set_xlabel("Position")
-    ax.set_ylabel("GC%")
-    ax.set_title(f'GC Content Distribution (window={window_size})')
-    st.pyplot(fig)
+import numpy as np
+from biokit.encoded_sequence import as_encoded
+
+PLOT_WIDTH_PX = 1000  # figsize=10in at matplotlib's default 100 dpi
+
+def gc_content(sequence) -> float:
+    """Returns the GC % of the whole sequence (other symbols count towards its length)."""
+    return round(as_encoded(sequence).gc_fraction() * 100, 2)
+
+def base_prefix_sums(sequence) -> dict:
+    """
+    Builds cumulative base counts so any window's composition is one subtraction.
+
+    Args:
+        sequence (str | EncodedSequence): DNA sequence (case-insensitive).
+
+    Returns:
+        dict: 'A', 'C', 'G', 'T' -> int32 arrays of length len(sequence) + 1,
+              where prefix[b][i] is the number of base b in sequence[:i].
+    """
+    codes = as_encoded(sequence).codes
+    prefix = {}
+    for code, base in enumerate("ACGT"):
+        counts = np.zeros(len(codes) + 1, dtype=np.int32)
+        np.cumsum(codes == code, out=counts[1:])
+        prefix[base] = counts
+    return prefix
+
+def _window_counts(prefix_counts, window_size, step, count):
+    """Per-window totals from a prefix array using strided views (no gather)."""
+    return prefix_counts[window_size::step][:count] - prefix_counts[::step][:count]
+
+def sliding_base_profile(sequence, window_size=100, step=1, prefix=None, include_skew=True) -> dict:
+    """
+    Computes GC content, GC skew and AT skew over sliding windows in O(n).
+
+    Args:
+        sequence (str | EncodedSequence): DNA sequence.
+        window_size (int): Window length in bases.
+        step (int): Distance between consecutive window starts.
+        prefix (dict, optional): Precomputed result of base_prefix_sums(sequence),
+            reusable when only the window or step changes.
+        include_skew (bool): Also compute the skew profiles.
+
+    Returns:
+        dict: NumPy arrays 'positions' (window starts), 'gc' (GC %) and, when
+              requested, 'gc_skew' ((G-C)/(G+C)) and 'at_skew' ((A-T)/(A+T));
+              skews are 0 for windows without the relevant bases.
+    """
+    if prefix is None:
+        prefix = base_prefix_sums(sequence)
+    n = len(prefix["A"]) - 1
+    starts = np.arange(0, max(n - window_size + 1, 0), step)
+    count = len(starts)
+
+    g = _window_counts(prefix["G"], window_size, step, count)
+    c = _window_counts(prefix["C"], window_size, step, count)
+    gc = g + c
+    profile = {"positions": starts, "gc": gc * (100.0 / window_size)}
+
+    if include_skew:
+        a = _window_counts(prefix["A"], window_size, step, count)
+        t = _window_counts(prefix["T"], window_size, step, count)
+        at = a + t
+        profile["gc_skew"] = np.divide(g - c, gc, out=np.zeros(count), where=gc > 0)
+        profile["at_skew"] = np.divide(a - t, at, out=np.zeros(count), where=at > 0)
+    return profile
+
+def gc_content_sliding_window(sequence, window_size=100, step=1):
+    """Returns (window start positions, GC % per window) as NumPy arrays."""
+    profile = sliding_base_profile(sequence, window_size, step, include_skew=False)
+    return profile["positions"], profile["gc"]
+
+def downsample_profile(positions, values, max_points=PLOT_WIDTH_PX):
+    """
+    Reduces a profile to at most max_points buckets for plotting.
+
+    Returns:
+        tuple: (bucket_positions, mean, minimum, maximum); the min/max envelope
+               keeps narrow peaks visible after downsampling.
+    """
+    if len(values) <= max_points:
+        return positions, values, values, values
+    bounds = np.linspace(0, len(values), max_points + 1).astype(np.int64)[:-1]
+    sizes = np.diff(np.append(bounds, len(values)))
+    mean = np.add.reduceat(values, bounds) / sizes
+    return positions[bounds], mean, np.minimum.reduceat(values, bounds), np.maximum.reduceat(values, bounds)
@@ -1,19 +1,15 @@
 # tools/complement.py
+from biokit.encoded_sequence import as_encoded
 
-def complement_sequence(seq: str) -> str:
+def complement_sequence(seq) -> str:
     """
     Return the complement of a DNA sequence.
     A <-> T, C <-> G
 
     Args:
-        seq (str): DNA sequence (A, T, G, C)
+        seq (str | EncodedSequence): DNA sequence (A, T, G, C)
 
     Returns:
-        str: Complement DNA sequence
+        str: Complement DNA sequence ('N' for unknown chars)
     """
-    complement_map = {'A': 'T', 'T': 'A', 'G': 'C', 'C': 'G'}
-
-    seq = seq.upper()
-    complement_seq = ''.join(complement_map.get(nuc, 'N') for nuc in seq)  # 'N' for unknown chars
-
-    return complement_seq
+    return str(as_encoded(seq).complement())
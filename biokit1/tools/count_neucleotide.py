@@ -1,18 +1,16 @@
 # tools/count_nucleotides.py
+from biokit.encoded_sequence import as_encoded
 
-from collections import Counter
-
-def count_nucleotides(seq: str) -> dict:
+def count_nucleotides(seq) -> dict:
     """
     Count occurrences of each nucleotide in a DNA sequence.
 
     Args:
-        seq (str): DNA sequence (A, T, G, C)
+        seq (str | EncodedSequence): DNA sequence (A, T, G, C)
 
     Returns:
         dict: Counts of each nucleotide {'A': int, 'T': int, 'G': int, 'C': int}
     """
-    seq = seq.upper()
-    counts = Counter(seq)
+    counts = as_encoded(seq).base_counts()  # cached on the EncodedSequence
     # Ensure all nucleotides are in the dictionary even if zero count
-    return {nuc: counts.get(nuc, 0) for nuc in ['A', 'T', 'G', 'C']}
+    return {nuc: counts[nuc] for nuc in ['A', 'T', 'G', 'C']}
@@ -1,22 +1,25 @@
 # tools/find_palindromes.py
+import numpy as np
+from biokit.encoded_sequence import as_encoded
 
-def find_palindromes(seq: str, length: int = 4) -> list:
+def find_palindromes(seq, length: int = 4) -> list:
     """
     Find all palindromic sequences of specified length in DNA.
 
     Args:
-        seq (str): DNA sequence (A, T, G, C)
+        seq (str | EncodedSequence): DNA sequence (A, T, G, C)
         length (int): Length of palindrome to search for (default 4)
 
     Returns:
         list: List of palindromic sequences found
     """
-    seq = seq.upper()
-    palindromes = []
+    seq = as_encoded(seq)
+    if length <= 0 or len(seq) < length:
+        return []
 
-    for i in range(len(seq) - length + 1):
-        segment = seq[i:i+length]
-        if segment == segment[::-1]:
-            palindromes.append(segment)
+    # Every window is compared with its mirror image in one vectorised step
+    windows = np.lib.stride_tricks.sliding_window_view(seq.codes, length)
+    half = length // 2
+    is_palindrome = np.all(windows[:, :half] == windows[:, ::-1][:, :half], axis=1)
 
-    return palindromes
+    return [str(seq[i:i + length]) for i in np.flatnonzero(is_palindrome)]
@@ -1,27 +1,37 @@
-def calculate_tm(seq: str) -> float:
+from biokit.encoded_sequence import as_encoded
+from biokit.melting import tm_nn
+
+def calculate_tm(seq, method: str = "nearest_neighbor", na: float = 50.0, mg: float = 0.0, dna_conc: float = 250.0) -> float:
     """
     Calculate melting temperature (Tm) of a DNA sequence.
 
-    For sequences shorter than 14 bases, uses Wallace Rule:
+    The default "nearest_neighbor" method uses SantaLucia (1998) stacking
+    parameters with salt and Mg2+ corrections (see biokit.melting). The
+    "empirical" method, also used when the sequence contains non-ACGT bases,
+    applies the Wallace rule below 14 bases:
         Tm = 2*(A+T) + 4*(G+C)
-    For longer sequences:
+    and for longer sequences:
         Tm = 64.9 + 41 * (G+C - 16.4) / length
 
     Args:
-        seq (str): DNA sequence (only A, T, G, C, uppercase recommended)
+        seq (str | EncodedSequence): DNA sequence (only A, T, G, C)
+        method (str): "nearest_neighbor" or "empirical"
+        na (float): Monovalent cation concentration (mM)
+        mg (float): Mg2+ concentration (mM)
+        dna_conc (float): Total strand concentration (nM)
 
     Returns:
         float: Estimated melting temperature in Celsius
     """
-    seq = seq.upper()
-    A = seq.count("A")
-    T = seq.count("T")
-    G = seq.count("G")
-    C = seq.count("C")
+    seq = as_encoded(seq)
+    counts = seq.base_counts()
+    A, T, G, C = counts["A"], counts["T"], counts["G"], counts["C"]
 
     length = len(seq)
 
-    if length < 14:
+    if method == "nearest_neighbor" and length >= 2 and counts["N"] == 0:
+        tm = tm_nn(seq, na=na, mg=mg, dna_conc=dna_conc)
+    elif length < 14:
         tm = 2 * (A + T) + 4 * (G + C)
     else:
         tm = 64.9 + 41 * (G + C - 16.4) / length
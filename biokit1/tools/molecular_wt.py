@@ -1,9 +1,11 @@
-def calculate_molecular_weight(seq: str) -> float:
+from biokit.encoded_sequence import as_encoded
+
+def calculate_molecular_weight(seq) -> float:
     """
     Calculate the approximate molecular weight of a DNA sequence.
 
     Parameters:
-        seq (str): DNA sequence consisting of A, T, G, C characters.
+        seq (str | EncodedSequence): DNA sequence consisting of A, T, G, C characters.
 
     Returns:
         float: Molecular weight in Daltons (g/mol).
@@ -16,14 +18,9 @@ def calculate_molecular_weight(seq: str) -> float:
         'C': 289.18
     }
 
-    # Convert sequence to uppercase for consistency
-    seq = seq.upper()
+    # Base counts are computed once (and cached) instead of looping over every nucleotide
+    counts = as_encoded(seq).base_counts()
 
-    total_weight = 0.0
+    total_weight = sum(weights[nucleotide] * counts[nucleotide] for nucleotide in weights)
 
-    # Sum up weights for each nucleotide in the sequence
-    for nucleotide in seq:
-        if nucleotide in weights:
-            total_weight += weights[nucleotide]
-        
     return total_weight
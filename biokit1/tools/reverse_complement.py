@@ -1,19 +1,14 @@
-from Bio.Seq import Seq
+from biokit.encoded_sequence import as_encoded
 
-def get_reverse_complement(dna_seq: str) -> str: #takes string and returns string
+def get_reverse_complement(dna_seq) -> str: #takes string or EncodedSequence and returns string
     """
     Returns the reverse complement of a DNA sequence.
     
     Parameters:
-    dna_seq (str): Input DNA sequence (should contain A, T, G, C only).
+    dna_seq (str | EncodedSequence): Input DNA sequence (should contain A, T, G, C only).
     
     Returns:
-    str: Reverse complement of the input sequence.
+    str: Reverse complement of the input sequence (non-ACGT characters become 'N').
     """
-    # Create a Seq object
-    seq = Seq(dna_seq.upper())
-    
-    # Get reverse complement and convert back to string
-    rev_comp = str(seq.reverse_complement())
-    
-    return rev_comp
+    # Reuses the cached reverse complement when an EncodedSequence is passed
+    return str(as_encoded(dna_seq).reverse_complement())
@@ -0,0 +1,31 @@
+"""
+Example Position Frequency Matrices
+
+A few illustrative count matrices in JASPAR format (rows A, C, G, T; one
+column per motif position) for common promoter elements. They are small,
+consensus-derived examples for trying the PWM scanner; load full JASPAR
+files for real analyses.
+"""
+
+EXAMPLE_MATRICES = """\
+>TATA_box TATA-binding site (TATAWAWR)
+A  [  5 90  2 88 55 85 50 45 ]
+C  [  8  3  2  3  2  3  5 10 ]
+G  [  7  2  1  2  3  2  5 35 ]
+T  [ 80  5 95  7 40 10 40 10 ]
+>GC_box SP1-like site (GGGGCGGGG)
+A  [ 10  5  2  1  2  1  3  8 15 ]
+C  [ 10  5  3  2 93  1  2  7 20 ]
+G  [ 70 85 93 95  3 96 92 80 50 ]
+T  [ 10  5  2  2  2  2  3  5 15 ]
+>CAAT_box NF-Y site (RRCCAATSR)
+A  [ 40 45  3  2 95 92  2 10 40 ]
+C  [ 10  8 92 95  2  3  3 45 15 ]
+G  [ 40 40  3  2  2  3  2 40 35 ]
+T  [ 10  7  2  1  1  2 93  5 10 ]
+>E_box bHLH site (CACGTG)
+A  [  2 94  3  2  2  2 ]
+C  [ 94  2 93  2  2  2 ]
+G  [  2  2  2 94  3 94 ]
+T  [  2  2  2  2 93  2 ]
+"""
@@ -1,13 +1,162 @@
+# Commercially available type II restriction enzymes in REBASE notation.
+# "^" marks the top-strand cut inside the site (palindromic sites cut the
+# bottom strand symmetrically); "(a/b)" gives top/bottom cut distances
+# downstream of the site for type IIS enzymes. IUPAC codes: R=A/G, Y=C/T,
+# S=G/C, W=A/T, K=G/T, M=A/C, B=not A, D=not C, H=not G, V=not T, N=any.
+RESTRICTION_ENZYME_SITES = {
+    "EcoRI": "G^AATTC",
+    "BamHI": "G^GATCC",
+    "HindIII": "A^AGCTT",
+    "NotI": "GC^GGCCGC",
+    "TaqI": "T^CGA",
+    "HaeIII": "GG^CC",
+    "PstI": "CTGCA^G",
+    "XhoI": "C^TCGAG",
+    "SmaI": "CCC^GGG",
+    "SalI": "G^TCGAC",
+    "AatII": "GACGT^C",
+    "Acc65I": "G^GTACC",
+    "AccI": "GT^MKAC",
+    "AclI": "AA^CGTT",
+    "AfeI": "AGC^GCT",
+    "AflII": "C^TTAAG",
+    "AgeI": "A^CCGGT",
+    "AhdI": "GACNNN^NNGTC",
+    "AluI": "AG^CT",
+    "ApaI": "GGGCC^C",
+    "ApaLI": "G^TGCAC",
+    "ApoI": "R^AATTY",
+    "AscI": "GG^CGCGCC",
+    "AseI": "AT^TAAT",
+    "AsiSI": "GCGAT^CGC",
+    "AvaI": "C^YCGRG",
+    "AvaII": "G^GWCC",
+    "AvrII": "C^CTAGG",
+    "BanI": "G^GYRCC",
+    "BanII": "GRGCY^C",
+    "BclI": "T^GATCA",
+    "BglI": "GCCNNNN^NGGC",
+    "BglII": "A^GATCT",
+    "BsaAI": "YAC^GTR",
+    "BsaHI": "GR^CGYC",
+    "BsiEI": "CGRY^CG",
+    "BsiHKAI": "GWGCW^C",
+    "BsiWI": "C^GTACG",
+    "Bsp1286I": "GDGCH^C",
+    "BspEI": "T^CCGGA",
+    "BspHI": "T^CATGA",
+    "BsrFI": "R^CCGGY",
+    "BsrGI": "T^GTACA",
+    "BssHII": "G^CGCGC",
+    "BstBI": "TT^CGAA",
+    "BstEII": "G^GTNACC",
+    "BstNI": "CC^WGG",
+    "BstXI": "CCANNNNN^NTGG",
+    "BstZ17I": "GTA^TAC",
+    "BtgI": "C^CRYGG",
+    "ClaI": "AT^CGAT",
+    "DraI": "TTT^AAA",
+    "DraIII": "CACNNN^GTG",
+    "EaeI": "Y^GGCCR",
+    "EagI": "C^GGCCG",
+    "EcoO109I": "RG^GNCCY",
+    "EcoRV": "GAT^ATC",
+    "FseI": "GGCCGG^CC",
+    "Fnu4HI": "GC^NGC",
+    "FspI": "TGC^GCA",
+    "HaeII": "RGCGC^Y",
+    "HhaI": "GCG^C",
+    "HincII": "GTY^RAC",
+    "HinfI": "G^ANTC",
+    "HpaI": "GTT^AAC",
+    "HpaII": "C^CGG",
+    "KasI": "G^GCGCC",
+    "KpnI": "GGTAC^C",
+    "MboI": "^GATC",
+    "MfeI": "C^AATTG",
+    "MluI": "A^CGCGT",
+    "MscI": "TGG^CCA",
+    "MseI": "T^TAA",
+    "MslI": "CAYNN^NNRTG",
+    "MspI": "C^CGG",
+    "NaeI": "GCC^GGC",
+    "NarI": "GG^CGCC",
+    "NcoI": "C^CATGG",
+    "NdeI": "CA^TATG",
+    "NheI": "G^CTAGC",
+    "NlaIII": "CATG^",
+    "NruI": "TCG^CGA",
+    "NsiI": "ATGCA^T",
+    "NspI": "RCATG^Y",
+    "PacI": "TTAAT^TAA",
+    "PciI": "A^CATGT",
+    "PmeI": "GTTT^AAAC",
+    "PmlI": "CAC^GTG",
+    "PpuMI": "RG^GWCCY",
+    "PsiI": "TTA^TAA",
+    "PspGI": "^CCWGG",
+    "PspOMI": "G^GGCCC",
+    "PvuI": "CGAT^CG",
+    "PvuII": "CAG^CTG",
+    "RsaI": "GT^AC",
+    "RsrII": "CG^GWCCG",
+    "SacI": "GAGCT^C",
+    "SacII": "CCGC^GG",
+    "SanDI": "GG^GWCCC",
+    "Sau3AI": "^GATC",
+    "Sau96I": "G^GNCC",
+    "SbfI": "CCTGCA^GG",
+    "ScaI": "AGT^ACT",
+    "ScrFI": "CC^NGG",
+    "SexAI": "A^CCWGGT",
+    "SfiI": "GGCCNNNN^NGGCC",
+    "SnaBI": "TAC^GTA",
+    "SpeI": "A^CTAGT",
+    "SphI": "GCATG^C",
+    "SrfI": "GCCC^GGGC",
+    "SspI": "AAT^ATT",
+    "StuI": "AGG^CCT",
+    "StyI": "C^CWWGG",
+    "SwaI": "ATTT^AAAT",
+    "TseI": "G^CWGC",
+    "Tsp45I": "^GTSAC",
+    "XbaI": "T^CTAGA",
+    "XmaI": "C^CCGGG",
+    "XmnI": "GAANN^NNTTC",
+    "ZraI": "GAC^GTC",
+    # Type IIS: cut outside an asymmetric site
+    "AciI": "CCGC(-3/-1)",
+    "AlwI": "GGATC(4/5)",
+    "BbsI": "GAAGAC(2/6)",
+    "BbvI": "GCAGC(8/12)",
+    "BccI": "CCATC(4/5)",
+    "BpmI": "CTGGAG(16/14)",
+    "BsaI": "GGTCTC(1/5)",
+    "BseRI": "GAGGAG(10/8)",
+    "BsmAI": "GTCTC(1/5)",
+    "BsmBI": "CGTCTC(1/5)",
+    "BsmFI": "GGGAC(10/14)",
+    "BsmI": "GAATGC(1/-1)",
+    "BspMI": "ACCTGC(4/8)",
+    "BsrDI": "GCAATG(2/0)",
+    "BsrI": "ACTGG(1/-1)",
+    "BssSI": "CACGAG(-5/-1)",
+    "BtsCI": "GGATG(2/0)",
+    "BtsI": "GCAGTG(2/0)",
+    "EarI": "CTCTTC(1/4)",
+    "FokI": "GGATG(9/13)",
+    "HgaI": "GACGC(5/10)",
+    "HphI": "GGTGA(8/7)",
+    "MboII": "GAAGA(8/7)",
+    "MlyI": "GAGTC(5/5)",
+    "MmeI": "TCCRAC(20/18)",
+    "PleI": "GAGTC(4/5)",
+    "SapI": "GCTCTTC(1/4)",
+    "SfaNI": "GCATC(5/9)",
+}
+
+# Recognition sites without cut annotation, keyed by enzyme name
 restriction_enzymes = {
-    "EcoRI": "GAATTC",
-    "BamHI": "GGATCC",
-    "HindIII": "AAGCTT",
-    "NotI": "GCGGCCGC",
-    "TaqI": "TCGA",
-    "HaeIII": "GGCC",
-    "PstI": "CTGCAG",
-    "XhoI": "CTCGAG",
-    "SmaI": "CCCGGG",
-    "SalI": "GTCGAC"
+    name: site.replace("^", "").split("(")[0] for name, site in RESTRICTION_ENZYME_SITES.items()
 }
 #standard data for enzymes restriction sites
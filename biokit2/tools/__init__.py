@@ -1,10 +1,13 @@
-from .motif_finder import render_motif_finder,highlight_motif,find_motif_positions,calculate_z_array
-from .orf_finder import find_orfs, highlight_orfs,render_orf_finder
-from .splice_side_predictor import find_splice_sites, render_splice_site_predictor
-from .codon_optimization import get_codon_frequency ,generate_codon_heatmap , render_codon_optimizer , optimize_sequence
-from .microsatellite_finder import find_microsatellites, render_microsatellite_finder
-from .restriction_site import find_restriction_sites,render_restriction_mapper
-from .palindrome_inverted import render_palindrome_inverted
-from .sequence_complexity import render_sequence_complexity_tool
-from .mutation_hotspot import render_mutation_hotspot_tool
-from .primer_design import render_optimal_primer_designer_tool
+# Logic only, so importing a tool never pulls in Streamlit or the plotting stack;
+# app.py imports the render_* functions from each tool's *_component module.
+from .motif_finder import highlight_motif,find_motif_positions,find_motifs,find_motif_sites,calculate_z_array
+from .orf_finder import find_orfs, highlight_orfs
+from .splice_side_predictor import find_splice_sites
+from .codon_optimization import get_codon_frequency, optimize_sequence, optimize_with_constraints, calculate_cai
+from .microsatellite_finder import find_microsatellites
+from .restriction_site import find_restriction_sites
+from .palindrome_inverted import find_perfect_palindromes, find_inverted_repeats
+from .sequence_complexity import estimate_sequence_complexity, sliding_entropy_profile, dust_mask
+from .mutation_hotspot import find_hotspots
+from .primer_design import design_primer_pairs, design_optimal_primers
+from .pwm_scanner import parse_jaspar, scan_pwms
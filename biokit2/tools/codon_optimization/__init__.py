@@ -1,2 +1,2 @@
-from .codon_optimizer_component import get_codon_frequency, generate_codon_heatmap ,render_codon_optimizer
-from .codon_optimizer_logic import optimize_sequence
\ No newline at end of file
+from .codon_optimizer_logic import get_codon_frequency, optimize_sequence, calculate_cai, get_host_tables, harmonization_table, \
+    optimize_with_constraints, find_constraint_violations, forbidden_kmers
@@ -1,14 +1,12 @@
+import pandas as pd
 import streamlit as st
 import matplotlib.pyplot as plt
 import seaborn as sns
-from collections import Counter
+from biokit.cache import cached_call
 from biokit2.data.genetic_code import GENETIC_CODE
 from biokit2.data.codon_usage import CODON_USAGE_TABLES
-from biokit2.tools.codon_optimization.codon_optimizer_logic import optimize_sequence
-
-def get_codon_frequency(seq: str) -> dict:
-    codons = [seq[i:i+3] for i in range(0, len(seq) - 2, 3) if len(seq[i:i+3]) == 3]
-    return dict(Counter(codons))
+from biokit2.data.restriction_enzyme import restriction_enzymes
+from biokit2.tools.codon_optimization.codon_optimizer_logic import get_codon_frequency, optimize_sequence, calculate_cai, optimize_with_constraints, find_constraint_violations
 
 def generate_codon_heatmap(original_freq, optimized_freq):
     all_codons = sorted(set(original_freq.keys()) | set(optimized_freq.keys()))
@@ -40,17 +38,47 @@ def render_codon_optimizer(seq):
     st.header("🧬 Codon Optimization (Host-Specific)")
 
     host = st.selectbox("Select Host Organism", list(CODON_USAGE_TABLES.keys()))
-    
+    strategies = {"Most frequent codon": "most_frequent", "Weighted random (host usage)": "weighted_random",
+                  "Codon harmonization": "harmonize"}
+    strategy = strategies[st.radio("Strategy", list(strategies), horizontal=True)]
+    source_host = None
+    if strategy == "harmonize":
+        source = st.selectbox("Native organism", ["Input sequence usage"] + list(CODON_USAGE_TABLES.keys()))
+        source_host = None if source == "Input sequence usage" else source
+    seed = st.number_input("Random seed", 0, 10**6, 0) if strategy == "weighted_random" else None
+
+    with st.expander("🚫 Sequence Constraints"):
+        constrained = st.checkbox("Avoid restriction sites, homopolymers and GC extremes (uses host codon weights)")
+        avoid_enzymes = st.multiselect("Enzyme sites to avoid", restriction_enzymes, default=["EcoRI", "BamHI"])
+        col1, col2, col3 = st.columns(3)
+        gc_window = col1.number_input("GC Window", 10, 500, 50)
+        gc_range = col2.slider("GC Range (%)", 0, 100, (30, 70))
+        max_homopolymer = col3.number_input("Max Homopolymer", 2, 20, 6)
+    constraints = dict(avoid_enzymes=avoid_enzymes, gc_window=gc_window, gc_range=gc_range, max_homopolymer=max_homopolymer)
 
     if st.button("Optimize Codons"):
         if not seq:
             st.warning("Please enter a DNA sequence.")
             return
 
-        optimized_seq = optimize_sequence(seq, host)
+        if constrained:
+            optimized_seq = cached_call(optimize_with_constraints, seq, host, **constraints)
+        else:
+            optimized_seq = cached_call(optimize_sequence, seq, host, strategy, source_host, seed)
         st.subheader("🔁 Optimized Sequence")
         st.code(optimized_seq, language="text")
 
+        col1, col2 = st.columns(2)
+        col1.metric("CAI (original)", calculate_cai(seq, host))
+        col2.metric("CAI (optimized)", calculate_cai(optimized_seq, host))
+
+        violations = find_constraint_violations(optimized_seq, **constraints)
+        if violations:
+            st.warning(f"{len(violations)} constraint violation(s) in the optimized sequence.")
+            st.dataframe(pd.DataFrame(violations), use_container_width=True)
+        else:
+            st.success("The optimized sequence meets all sequence constraints.")
+
         original_freq = get_codon_frequency(seq)
         optimized_freq = get_codon_frequency(optimized_seq)
 
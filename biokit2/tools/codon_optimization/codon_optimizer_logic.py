@@ -1,58 +1,364 @@
 # codon_optimizer.py
+"""
+Codon Optimizer Logic
+
+Host tables are compiled once per host from CODON_USAGE_TABLES and
+GENETIC_CODE into 65-entry NumPy arrays indexed by codon code (4*4*first +
+4*second + third over A/C/G/T; 64 = a codon containing another character).
+A sequence is turned into one array of codon codes, every strategy maps that
+array through a table (or, for weighted-random, a table plus one random draw
+per codon), and the output is assembled from a 64 x 3 byte table in a single
+join.
+
+optimize_with_constraints adds a beam search over synonymous codons that
+also avoids restriction sites, homopolymer runs and out-of-range GC windows.
+Each beam state carries the last bases as a 2-bit integer, the GC bits of
+the current window as an integer bitmask and the current run length, so
+extending a state by one codon costs a few set lookups and a popcount
+instead of a rescan.
+"""
+import heapq
+import math
+from functools import lru_cache
+from itertools import product
+
+import numpy as np
+
+from biokit.encoded_sequence import N_CODE, as_encoded
+from biokit.iupac import IUPAC_BASES, reverse_complement_iupac
+from biokit.kmers import count_kmers, kmer_codes, kmer_counts_to_dict
+from biokit.translation import INVALID_CODON, codon_codes
 from biokit2.data.genetic_code import GENETIC_CODE
 from biokit2.data.codon_usage import CODON_USAGE_TABLES
+from biokit2.data.restriction_enzyme import RESTRICTION_ENZYME_SITES
+from biokit2.tools.restriction_site.restriction_logic import parse_rebase_site
+
+CODONS = ["".join(bases) for bases in product("ACGT", repeat=3)]
+CODON_BYTES = np.frombuffer("".join(CODONS).encode("ascii"), dtype=np.uint8).reshape(64, 3)
+CODON_INDEX = {codon: code for code, codon in enumerate(CODONS)}
+AMINO_ACID = {codon: aa for aa, codons in GENETIC_CODE.items() for codon in codons}
+CAI_EXCLUDED = ("M", "W", "*")  # single-codon amino acids and stops carry no codon-choice signal
+MAX_SYNONYMS = max(len(codons) for codons in GENETIC_CODE.values())
 
-def optimize_sequence(dna_sequence: str, host: str) -> str:
+@lru_cache(maxsize=None)
+def get_host_tables(host: str) -> dict:
     """
-    Optimize a given DNA sequence for a specific host organism based on codon usage bias.
+    Compiles a host's codon usage into lookup arrays indexed by codon code.
+
+    Returns:
+        dict: 'best' (most used synonymous codon), 'weight' (relative adaptiveness
+              w = usage / max synonymous usage), 'synonyms' (65 x 6 synonymous codon
+              codes, padded by repeating the last) and 'cumulative' (65 x 6 cumulative
+              usage probabilities over those synonyms); code 64 maps to itself.
+
+    Raises:
+        ValueError: If the specified host is not found in the codon usage table.
+    """
+    host_usage = CODON_USAGE_TABLES.get(host)
+    if not host_usage:
+        raise ValueError(f"Host '{host}' not found in codon usage table.")
+
+    best = np.arange(INVALID_CODON + 1)
+    weight = np.ones(INVALID_CODON + 1)
+    synonyms = np.full((INVALID_CODON + 1, MAX_SYNONYMS), INVALID_CODON)
+    cumulative = np.ones((INVALID_CODON + 1, MAX_SYNONYMS))
+    for codons in GENETIC_CODE.values():
+        codes = [CODON_INDEX[codon] for codon in codons]
+        usage = np.array([host_usage.get(codon, 0) for codon in codons], dtype=np.float64)
+        top = codes[int(usage.argmax())]
+        probabilities = usage / usage.sum() if usage.sum() else np.full(len(codes), 1 / len(codes))
+        padded = codes + [codes[-1]] * (MAX_SYNONYMS - len(codes))
+        for code, value in zip(codes, usage):
+            best[code] = top
+            weight[code] = value / usage.max() if usage.max() else 1.0
+            synonyms[code] = padded
+            cumulative[code, :len(codes)] = np.cumsum(probabilities)
+    return {"best": best, "weight": weight, "synonyms": synonyms, "cumulative": cumulative}
+
+def get_codon_frequency(seq) -> dict:
+    """In-frame codon counts of a sequence ({codon: count}, observed codons only)."""
+    return kmer_counts_to_dict(count_kmers(seq, 3, step=3), 3)
 
-    This function translates the DNA sequence into codons, identifies the amino acid
-    each codon encodes using the standard genetic code, and replaces each codon with
-    the most frequently used synonymous codon preferred by the specified host.
+def _in_frame_codons(dna_sequence) -> np.ndarray:
+    """Codon codes of the complete in-frame codons (INVALID_CODON for codons with non-ACGT characters)."""
+    return codon_codes(as_encoded(dna_sequence).codes, step=3).astype(np.int64)
+
+def _assemble(dna_sequence, original: np.ndarray, chosen: np.ndarray) -> str:
+    """Builds the output in one pass; codons that could not be mapped are copied from the input."""
+    out = CODON_BYTES[np.minimum(chosen, INVALID_CODON - 1)]
+    invalid = np.flatnonzero(chosen == INVALID_CODON)
+    if invalid.size:
+        raw = np.frombuffer(str(dna_sequence)[:3 * len(original)].encode("ascii", errors="replace"), dtype=np.uint8)
+        out[invalid] = raw.reshape(-1, 3)[invalid]
+    return out.tobytes().decode("ascii")
+
+def _usage_fractions(frequencies: dict) -> dict:
+    """Per-amino-acid usage fractions of codon counts or frequencies."""
+    fractions = {}
+    for codons in GENETIC_CODE.values():
+        total = sum(frequencies.get(codon, 0) for codon in codons)
+        for codon in codons:
+            fractions[codon] = frequencies.get(codon, 0) / total if total else 1 / len(codons)
+    return fractions
+
+def harmonization_table(host: str, source_usage: dict) -> np.ndarray:
+    """
+    Maps each codon to the synonymous host codon whose usage fraction is closest to the
+    codon's usage fraction in the source organism, so rare codons stay rare.
+    """
+    host_fraction = _usage_fractions(CODON_USAGE_TABLES[host])
+    source_fraction = _usage_fractions(source_usage)
+    mapping = np.arange(INVALID_CODON + 1)
+    for codons in GENETIC_CODE.values():
+        for codon in codons:
+            target = min(codons, key=lambda c: (abs(host_fraction[c] - source_fraction[codon]), -host_fraction[c]))
+            mapping[CODON_INDEX[codon]] = CODON_INDEX[target]
+    return mapping
+
+def optimize_sequence(dna_sequence: str, host: str, strategy: str = "most_frequent", source_host: str = None, seed: int = None) -> str:
+    """
+    Optimize a given DNA sequence for a specific host organism based on codon usage bias.
 
     Args:
         dna_sequence (str): A string representing a DNA sequence (must be a multiple of 3 if possible).
         host (str): The name of the host organism whose codon usage table should be used 
                     (e.g., 'E.coli', 'Yeast').
+        strategy (str): "most_frequent" (the host's most used synonymous codon),
+                        "weighted_random" (synonymous codons drawn in proportion to host usage)
+                        or "harmonize" (codons matched to the host by relative usage, see
+                        harmonization_table).
+        source_host (str, optional): Native organism for "harmonize"; by default the codon
+                        usage of the input sequence itself is used.
+        seed (int, optional): Random seed for "weighted_random".
 
     Returns:
         str: A host-optimized DNA sequence with synonymous codons preferred by the host.
 
     Raises:
-        ValueError: If the specified host is not found in the codon usage table.
+        ValueError: If the specified host or strategy is not known.
 
     Notes:
         - Incomplete codons (length < 3 at the end) are ignored.
         - Unknown or invalid codons are retained as-is in the output.
         - This function assumes the input DNA is valid and pre-cleaned.
     """
-    host_usage = CODON_USAGE_TABLES.get(host)
-    if not host_usage:
-        raise ValueError(f"Host '{host}' not found in codon usage table.")
-    
-    optimized_sequence = ""
-    for i in range(0, len(dna_sequence), 3):
-        codon = dna_sequence[i:i+3]
-        if len(codon) < 3:
-            break  # ignore incomplete codon
-        amino_acid = None
-        # Find which amino acid this codon maps to
-        for aa, codons in GENETIC_CODE.items():
-            if codon in codons:
-                amino_acid = aa
-                break
-        if not amino_acid:
-            optimized_sequence += codon  
-            continue
-        
-        # Get all codons that encode this amino acid
-        possible_codons = GENETIC_CODE[amino_acid]
-        
-        # Find the most preferred one for this host
-        best_codon = max(
-            possible_codons,
-            key=lambda c: host_usage.get(c, 0)
-        )
-        optimized_sequence += best_codon
-    
-    return optimized_sequence
+    tables = get_host_tables(host)
+    original = _in_frame_codons(dna_sequence)
+
+    if strategy == "most_frequent":
+        chosen = tables["best"][original]
+    elif strategy == "weighted_random":
+        draws = np.random.default_rng(seed).random(len(original))
+        picks = (draws[:, None] >= tables["cumulative"][original]).sum(axis=1)
+        chosen = tables["synonyms"][original, np.minimum(picks, MAX_SYNONYMS - 1)]
+        chosen[original == INVALID_CODON] = INVALID_CODON
+    elif strategy == "harmonize":
+        if source_host is not None:
+            source_usage = CODON_USAGE_TABLES.get(source_host)
+            if not source_usage:
+                raise ValueError(f"Host '{source_host}' not found in codon usage table.")
+        else:
+            counts = np.bincount(original, minlength=INVALID_CODON + 1)
+            source_usage = {codon: int(counts[code]) for code, codon in enumerate(CODONS)}
+        chosen = harmonization_table(host, source_usage)[original]
+    else:
+        raise ValueError(f"Unknown optimization strategy '{strategy}'.")
+    return _assemble(dna_sequence, original, chosen)
+
+def calculate_cai(dna_sequence: str, host: str) -> float:
+    """
+    Codon Adaptation Index of a coding sequence for a host (Sharp & Li, 1987): the geometric
+    mean of the relative adaptiveness w of its codons, excluding Met, Trp, stops and invalid
+    codons. Returns 0.0 when no codon qualifies.
+    """
+    weight = get_host_tables(host)["weight"]
+    counted = np.ones(INVALID_CODON + 1, dtype=bool)
+    counted[INVALID_CODON] = False
+    for aa in CAI_EXCLUDED:
+        for codon in GENETIC_CODE.get(aa, []):
+            counted[CODON_INDEX[codon]] = False
+
+    codes = _in_frame_codons(dna_sequence)
+    codes = codes[counted[codes]]
+    if not codes.size:
+        return 0.0
+    with np.errstate(divide="ignore"):
+        log_weight = np.log(weight)
+    return round(float(np.exp(log_weight[codes].mean())), 4)
+
+
+# Penalties of the constrained search, in units of log relative adaptiveness.
+SITE_PENALTY = 50.0          # per forbidden site created
+HOMOPOLYMER_PENALTY = 5.0    # per base beyond max_homopolymer
+GC_PENALTY = 1.0             # per base outside the GC range, per window
+MIN_WEIGHT = 1e-4            # floor for codons the host never uses
+MAX_SITE_VARIANTS = 4096
+
+def forbidden_kmers(avoid_enzymes=(), avoid_sites=()) -> dict:
+    """
+    Expands enzyme recognition sites and IUPAC motifs into the concrete k-mers to avoid.
+
+    Args:
+        avoid_enzymes (iterable of str): Enzyme names from RESTRICTION_ENZYME_SITES.
+        avoid_sites (iterable of str): Extra IUPAC motifs (e.g. "GGTCTC").
+
+    Returns:
+        dict: k-mer length -> {2-bit k-mer code: site label}, covering both strands.
+
+    Raises:
+        ValueError: For unknown enzymes, invalid motifs or motifs with too many variants.
+    """
+    labels = {}
+    for enzyme in avoid_enzymes:
+        if enzyme not in RESTRICTION_ENZYME_SITES:
+            raise ValueError(f"Enzyme '{enzyme}' not found in restriction enzyme table.")
+        labels[parse_rebase_site(RESTRICTION_ENZYME_SITES[enzyme])[0]] = enzyme
+    for site in avoid_sites:
+        labels.setdefault(site.upper(), site.upper())
+
+    kmers = {}
+    for site, label in labels.items():
+        if not site or set(site) - set(IUPAC_BASES):
+            raise ValueError(f"Invalid IUPAC motif '{site}'.")
+        if math.prod(len(IUPAC_BASES[code]) for code in site) > MAX_SITE_VARIANTS:
+            raise ValueError(f"Site '{site}' expands to more than {MAX_SITE_VARIANTS} k-mers.")
+        table = kmers.setdefault(len(site), {})
+        for strand_site in {site, reverse_complement_iupac(site)}:
+            for bases in product(*(IUPAC_BASES[code] for code in strand_site)):
+                code = 0
+                for base in bases:
+                    code = code << 2 | "ACGT".index(base)
+                table.setdefault(code, label)
+    return kmers
+
+def _gc_bounds(gc_window: int, gc_range: tuple) -> tuple[int, int]:
+    """Allowed GC base counts per window for a (min %, max %) range."""
+    return math.ceil(gc_range[0] * gc_window / 100 - 1e-9), math.floor(gc_range[1] * gc_window / 100 + 1e-9)
+
+def optimize_with_constraints(dna_sequence: str, host: str, avoid_enzymes=("EcoRI", "BamHI"), avoid_sites=(),
+                              gc_window: int = 50, gc_range: tuple = (30, 70), max_homopolymer: int = 6,
+                              beam_width: int = 16) -> str:
+    """
+    Optimizes codon usage for a host while avoiding restriction sites, homopolymers and GC extremes.
+
+    A beam search walks the sequence codon by codon, extending every kept state
+    with each synonymous codon. A state's score is the sum of log relative
+    adaptiveness of its codons (so without constraints the result equals the
+    "most_frequent" strategy) minus penalties for every forbidden site, every
+    base beyond max_homopolymer and every base a GC window lies outside the
+    range. States ending in the same bases with the same window GC count are
+    merged, keeping the best, and the beam_width best states survive each codon. Constraints that cannot be met
+    (e.g. a window whose amino acids force high GC) are minimized, not refused.
+
+    Args:
+        dna_sequence (str): Coding DNA sequence, read in frame from the first base.
+        host (str): Host organism from CODON_USAGE_TABLES.
+        avoid_enzymes (iterable of str): Enzymes whose sites must not appear on either strand.
+        avoid_sites (iterable of str): Extra IUPAC motifs to avoid.
+        gc_window (int): GC window length in bases (0 disables the GC constraint).
+        gc_range (tuple): Allowed (min %, max %) GC per window.
+        max_homopolymer (int): Longest allowed run of one base (0 disables the check).
+        beam_width (int): States kept per codon; larger is slower but searches more.
+
+    Returns:
+        str: The optimized sequence. Invalid codons are copied unchanged and
+             treated as N (they break runs and never form sites).
+    """
+    tables = get_host_tables(host)
+    original = _in_frame_codons(dna_sequence)
+    forbidden = [(length, (1 << 2 * length) - 1, set(table))
+                 for length, table in sorted(forbidden_kmers(avoid_enzymes, avoid_sites).items())]
+    max_site = max((length for length, _, _ in forbidden), default=1)
+    tail_mask = (1 << 2 * max(max_site - 1, 1)) - 1
+    gc_low, gc_high = _gc_bounds(gc_window, gc_range) if gc_window else (0, 0)
+    window_mask = (1 << gc_window) - 1
+    run_limit = max_homopolymer if max_homopolymer > 0 else math.inf
+
+    log_weight = np.log(np.maximum(tables["weight"], MIN_WEIGHT))
+    options = {INVALID_CODON: [(INVALID_CODON, 0.0)]}
+    for code in set(original.tolist()) - {INVALID_CODON}:
+        synonyms = dict.fromkeys(tables["synonyms"][code].tolist())
+        options[code] = sorted(((s, float(log_weight[s])) for s in synonyms), key=lambda item: -item[1])
+    codon_bases = [tuple("ACGT".index(b) for b in codon) for codon in CODONS] + [(N_CODE,) * 3]
+
+    # state: (score, tail, valid bases in tail, GC window bits, last base, run length)
+    beam = [(0.0, 0, 0, 0, N_CODE, 0)]
+    history = []
+    position = 0
+    for code in original.tolist():
+        candidates = {}
+        for parent, (score, tail, valid, gc, last, run) in enumerate(beam):
+            for choice, gain in options[code]:
+                s, t, v, g, b_last, r = score + gain, tail, valid, gc, last, run
+                for offset, base in enumerate(codon_bases[choice]):
+                    if base == N_CODE:
+                        t, v, g, b_last, r = 0, 0, g << 1 & window_mask, N_CODE, 0
+                    else:
+                        t = t << 2 | base
+                        v += 1
+                        g = (g << 1 | (base == 1 or base == 2)) & window_mask
+                        r = r + 1 if base == b_last else 1
+                        b_last = base
+                        if r > run_limit:
+                            s -= HOMOPOLYMER_PENALTY
+                        for length, mask, kmers in forbidden:
+                            if v >= length and t & mask in kmers:
+                                s -= SITE_PENALTY
+                        t &= tail_mask
+                    if gc_window and position + offset + 1 >= gc_window:
+                        count = g.bit_count()
+                        if count < gc_low:
+                            s -= GC_PENALTY * (gc_low - count)
+                        elif count > gc_high:
+                            s -= GC_PENALTY * (count - gc_high)
+                key = (t, min(v, max_site), b_last, min(r, run_limit + 1), g.bit_count())
+                if key not in candidates or s > candidates[key][0]:
+                    candidates[key] = (s, t, v, g, b_last, r, parent, choice)
+        survivors = heapq.nlargest(beam_width, candidates.values(), key=lambda state: state[0])
+        history.append([(state[6], state[7]) for state in survivors])
+        beam = [state[:6] for state in survivors]
+        position += 3
+
+    chosen = np.empty(len(original), dtype=np.int64)
+    index = 0
+    for step in range(len(history) - 1, -1, -1):
+        index, chosen[step] = history[step][index]
+    return _assemble(dna_sequence, original, chosen)
+
+def find_constraint_violations(dna_sequence, avoid_enzymes=("EcoRI", "BamHI"), avoid_sites=(),
+                               gc_window: int = 50, gc_range: tuple = (30, 70), max_homopolymer: int = 6) -> list[dict]:
+    """
+    Lists the constraint violations of a sequence with a full vectorized scan.
+
+    Returns:
+        list[dict]: Sorted by start; each has 'type' ("site", "gc" or "homopolymer"),
+                    0-based 'start', exclusive 'end' and 'detail' (enzyme/motif,
+                    GC % range of the merged windows, or the repeated base).
+    """
+    seq = as_encoded(dna_sequence)
+    codes = seq.codes
+    violations = []
+    for length, table in forbidden_kmers(avoid_enzymes, avoid_sites).items():
+        windows = kmer_codes(codes, length, keep_invalid=True)
+        lookup = np.fromiter(table, dtype=np.uint64, count=len(table))
+        for start in np.flatnonzero(np.isin(windows, lookup)).tolist():
+            violations.append({"type": "site", "start": start, "end": start + length, "detail": table[int(windows[start])]})
+
+    if gc_window and len(codes) >= gc_window:
+        gc_low, gc_high = _gc_bounds(gc_window, gc_range)
+        prefix = np.concatenate(([0], np.cumsum((codes == 1) | (codes == 2))))
+        counts = prefix[gc_window:] - prefix[:-gc_window]
+        edges = np.flatnonzero(np.diff(np.concatenate(([0], (counts < gc_low) | (counts > gc_high), [0])).astype(np.int8)))
+        for first, last in zip(edges[::2].tolist(), edges[1::2].tolist()):
+            window_gc = counts[first:last] * 100 / gc_window
+            violations.append({"type": "gc", "start": first, "end": last - 1 + gc_window,
+                               "detail": f"{window_gc.min():.0f}-{window_gc.max():.0f}% GC"})
+
+    if max_homopolymer > 0 and len(codes):
+        boundaries = np.flatnonzero(np.diff(codes)) + 1
+        starts = np.concatenate(([0], boundaries))
+        ends = np.concatenate((boundaries, [len(codes)]))
+        for start, end in zip(starts.tolist(), ends.tolist()):
+            if end - start > max_homopolymer and codes[start] != N_CODE:
+                violations.append({"type": "homopolymer", "start": start, "end": end, "detail": f"{'ACGT'[codes[start]]} x {end - start}"})
+    return sorted(violations, key=lambda v: (v["start"], v["end"]))
@@ -1,2 +1 @@
-from .microsatellite_component import render_microsatellite_finder
-from .microsatellite_logic import find_microsatellites
\ No newline at end of file
+from .microsatellite_logic import find_microsatellites
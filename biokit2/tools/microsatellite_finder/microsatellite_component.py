@@ -11,19 +11,21 @@ def render_microsatellite_finder(sequence):
         These are important in **genome annotation**, **forensics**, and **genetic diversity studies**.
         """)
 
-    col1, col2, col3 = st.columns(3)
+    col1, col2, col3, col4 = st.columns(4)
     with col1:
         min_unit_len = st.number_input("Min Unit Length", 1, 10, 2)
     with col2:
         max_unit_len = st.number_input("Max Unit Length", min_unit_len, 12, 6)
     with col3:
         min_repeats = st.number_input("Min Repeats", 2, 100, 5)
+    with col4:
+        max_mismatches = st.number_input("Max Mismatches", 0, 10, 0)
 
     if st.button("Find Microsatellites"):
         if not sequence:
             st.warning("Please enter a DNA sequence.")
         else:
-            results = find_microsatellites(sequence.upper(), min_unit_len, max_unit_len, min_repeats)
+            results = find_microsatellites(sequence.upper(), min_unit_len, max_unit_len, min_repeats, max_mismatches)
 
             if not results:
                 st.info("No microsatellites found with the given criteria.")
@@ -31,8 +33,8 @@ def render_microsatellite_finder(sequence):
                 df = pd.DataFrame(results)
                 df["Length"] = df["end"] - df["start"] + 1
                 df["Position"] = df["start"].astype(str) + "–" + df["end"].astype(str)
-                df_display = df[["motif", "repeats", "Length", "Position"]]
-                df_display.columns = ["Motif", "Repeats", "Length", "Position"]
+                df_display = df[["motif", "repeats", "Length", "mismatches", "Position"]]
+                df_display.columns = ["Motif", "Repeats", "Length", "Mismatches", "Position"]
 
                 st.success(f"✅ Found {len(df)} microsatellites!")
 
@@ -54,9 +56,9 @@ def render_microsatellite_finder(sequence):
                 </style>
                 """, unsafe_allow_html=True)
 
-                html_table = "<table class='custom-table'><tr><th>Motif</th><th>Repeats</th><th>Length</th><th>Position</th></tr>"
+                html_table = "<table class='custom-table'><tr><th>Motif</th><th>Repeats</th><th>Length</th><th>Mismatches</th><th>Position</th></tr>"
                 for _, row in df_display.iterrows():
-                    html_table += f"<tr><td>{row['Motif']}</td><td>{row['Repeats']}</td><td>{row['Length']}</td><td>{row['Position']}</td></tr>"
+                    html_table += f"<tr><td>{row['Motif']}</td><td>{row['Repeats']}</td><td>{row['Length']}</td><td>{row['Mismatches']}</td><td>{row['Position']}</td></tr>"
                 html_table += "</table>"
 
                 st.markdown(html_table, unsafe_allow_html=True)
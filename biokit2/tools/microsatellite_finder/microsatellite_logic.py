@@ -1,52 +1,154 @@
 from typing import List, Dict
 
-def find_microsatellites(sequence: str, min_unit_len: int = 2, max_unit_len: int = 6, min_repeats: int = 5) -> List[Dict]:
+import numpy as np
+
+from biokit.encoded_sequence import N_CODE, as_encoded
+
+def _runs(mask: np.ndarray):
+    """(starts, ends) of the runs of True in a boolean array, ends exclusive."""
+    edges = np.flatnonzero(np.diff(np.concatenate(([False], mask, [False])).astype(np.int8)))
+    return edges[::2], edges[1::2]
+
+def _is_primitive(motif: str) -> bool:
+    """False for motifs that are themselves repeats of a shorter unit (e.g. ATAT)."""
+    return (motif + motif).find(motif, 1) == len(motif)
+
+def _period_repeats(codes: np.ndarray, period: int, min_repeats: int, max_mismatches: int):
+    """
+    Yields (start, end) of maximal tandem repeats of one period (0-based, end exclusive,
+    whole copies only). Positions where base i equals base i + period form runs; runs
+    spanning at least one copy are seeds, and neighbouring seeds are merged while the
+    failed comparisons between them stay within two per allowed mismatch (a substitution
+    breaks the comparison with both the copy before and the copy after it). Each merged
+    repeat is then checked against its consensus unit and split if it disagrees in more
+    than max_mismatches bases.
+    """
+    n = len(codes)
+    if n < period * min_repeats:
+        return
+    same = (codes[:-period] == codes[period:]) & (codes[:-period] != N_CODE)
+    starts, ends = _runs(same)
+    seeds = ends - starts >= period
+    starts, ends = starts[seeds].tolist(), ends[seeds].tolist()
+    if not starts:
+        return
+
+    min_run = (min_repeats - 1) * period  # comparisons spanned by min_repeats copies
+    if max_mismatches == 0:
+        for start, end in zip(starts, ends):
+            if end - start >= min_run:
+                yield start, start + (end + period - start) // period * period
+        return
+
+    # Seeds linked by gaps within the budget form groups; only groups long enough to
+    # hold min_repeats copies are merged greedily, seed by seed.
+    failed = np.concatenate(([0], np.cumsum(~same)))
+    budget = 2 * max_mismatches
+    seed_starts, seed_ends = np.array(starts), np.array(ends)
+    linked = failed[seed_starts[1:]] - failed[seed_ends[:-1]] <= budget
+    bounds = np.flatnonzero(~linked) + 1
+    firsts = np.concatenate(([0], bounds))
+    lasts = np.concatenate((bounds, [len(starts)]))
+    long_enough = seed_ends[lasts - 1] - seed_starts[firsts] >= min_run
+    for first, last in zip(firsts[long_enough].tolist(), lasts[long_enough].tolist()):
+        cluster_first, cluster_end, spent = first, ends[first], 0
+        for index in range(first + 1, last + 1):
+            if index < last:
+                gap = int(failed[starts[index]] - failed[cluster_end])
+                if spent + gap <= budget:
+                    cluster_end, spent = ends[index], spent + gap
+                    continue
+            yield from _within_budget(codes, starts, ends, failed, cluster_first, index - 1,
+                                      period, min_run, max_mismatches)
+            if index < last:
+                cluster_first, cluster_end, spent = index, ends[index], 0
+
+def _unit_mismatches(codes: np.ndarray, period: int) -> int:
+    """Bases of a whole-copy repeat disagreeing with the majority base of their column."""
+    units = codes.reshape(-1, period)
+    return sum(len(column) - int(np.bincount(column, minlength=N_CODE + 1).max()) for column in units.T)
+
+def _within_budget(codes: np.ndarray, starts, ends, failed: np.ndarray, first: int, last: int,
+                   period: int, min_run: int, max_mismatches: int):
+    """
+    Yields the repeat spanned by seeds first..last (inclusive) if its consensus has at most
+    max_mismatches disagreeing bases; otherwise splits it at the widest gap between seeds
+    and checks both sides, so linked repeats of different units are not reported as one.
+    """
+    start, end = starts[first], ends[last]
+    if end - start < min_run:
+        return
+    stop = start + (end + period - start) // period * period
+    if first == last or _unit_mismatches(codes[start:stop], period) <= max_mismatches:
+        yield start, stop
+        return
+    gaps = failed[np.array(starts[first + 1:last + 1])] - failed[np.array(ends[first:last])]
+    split = first + int(gaps.argmax())
+    yield from _within_budget(codes, starts, ends, failed, first, split, period, min_run, max_mismatches)
+    yield from _within_budget(codes, starts, ends, failed, split + 1, last, period, min_run, max_mismatches)
+
+def _consensus(text: str, start: int, end: int, period: int):
+    """Majority unit of a repeat (phase-aligned to its start) and the bases disagreeing with it."""
+    units = np.frombuffer(text[start:end].encode("ascii"), dtype=np.uint8).reshape(-1, period)
+    motif, mismatches = [], 0
+    for column in units.T:
+        values, counts = np.unique(column, return_counts=True)
+        motif.append(chr(values[counts.argmax()]))
+        mismatches += len(column) - int(counts.max())
+    return "".join(motif), mismatches
+
+def find_microsatellites(sequence: str, min_unit_len: int = 2, max_unit_len: int = 6, min_repeats: int = 5,
+                         max_mismatches: int = 0) -> List[Dict]:
     """
     Finds microsatellites (short tandem repeats) in a DNA sequence.
-    
+
+    Each period is scanned once with a vectorised comparison of every base with the
+    base one period downstream; runs of agreement are merged into maximal repeats.
+    Repeats of all periods are then pooled and a repeat lying entirely inside a longer
+    (or equally long, shorter-period) one is dropped, so a long-period repeat is no
+    longer hidden by a short one that happens to start at the same base.
+
     Args:
         sequence (str): Validated, uppercase DNA sequence.
         min_unit_len (int): Minimum motif size (e.g., 2 for dinucleotide).
         max_unit_len (int): Maximum motif size (default 6).
         min_repeats (int): Minimum number of consecutive repeats to qualify.
+        max_mismatches (int): Substitutions tolerated inside a repeat (0 = perfect repeats only).
 
     Returns:
-        List[Dict]: List of STR info with motif, start/end, repeats, strand.
+        List[Dict]: List of STR info with motif (consensus unit), start/end (1-based,
+                    inclusive), repeats, strand, length, mismatches and perfect.
     """
-    results = []
-    n = len(sequence)
-    i = 0
-
-    while i < n:
-        found = False
-        for unit_len in range(min_unit_len, max_unit_len + 1):
-            if i + unit_len * min_repeats > n:
-                continue
-
-            motif = sequence[i:i + unit_len]
-            if 'N' in motif:
-                continue
-
-            repeat_count = 1
-            j = i + unit_len
-
-            while j + unit_len <= n and sequence[j:j + unit_len] == motif:
-                repeat_count += 1
-                j += unit_len
-
-            if repeat_count >= min_repeats:
-                results.append({
-                    'motif': motif,
-                    'start': i + 1,
-                    'end': j,
-                    'repeats': repeat_count,
-                    'strand': '+'
-                })
-                i = j  
-                found = True
-                break  
-
-        if not found:
-            i += 1
+    seq = as_encoded(sequence)
+    text = str(seq)
+
+    candidates = []
+    for period in range(min_unit_len, max_unit_len + 1):
+        for start, end in _period_repeats(seq.codes, period, min_repeats, max_mismatches):
+            motif, mismatches = _consensus(text, start, end, period)
+            if _is_primitive(motif):
+                candidates.append((start, end, period, motif, mismatches))
 
+    # Sweep by start (longest, then shortest period, first): a repeat is dropped
+    # when an earlier-starting one already reaches its end.
+    kept = []
+    reach = -1
+    for start, end, period, motif, mismatches in sorted(candidates, key=lambda c: (c[0], c[0] - c[1], c[2])):
+        if end <= reach:
+            continue
+        kept.append((start, end, period, motif, mismatches))
+        reach = end
+
+    results = []
+    for start, end, period, motif, mismatches in sorted(kept):
+        results.append({
+            'motif': motif,
+            'start': start + 1,
+            'end': end,
+            'repeats': (end - start) // period,
+            'strand': '+',
+            'length': end - start,
+            'mismatches': mismatches,
+            'perfect': mismatches == 0
+        })
     return results
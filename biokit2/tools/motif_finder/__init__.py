@@ -1,2 +1 @@
-from .motif_component import render_motif_finder
-from .motif_logic import highlight_motif, calculate_z_array , find_motif_positions
+from .motif_logic import highlight_motif, calculate_z_array , find_motif_positions, find_motifs, find_motif_sites, find_approximate_motif, build_motif_index
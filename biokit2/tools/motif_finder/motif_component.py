@@ -1,4 +1,7 @@
-from .motif_logic import find_motif_positions, highlight_motif
+from biokit.annotation import merge_intervals
+from biokit.cache import cached_call
+from biokit1.components.sequence_viewer import render_sequence_viewer
+from .motif_logic import build_motif_index, find_approximate_motif, find_motif_sites
 from biokit2.data.motif_data import COMMON_MOTIFS
 import streamlit as st
 
@@ -7,18 +10,46 @@ def render_motif_finder(sequence: str):
     use_predefined = st.checkbox("Use predefined motifs", value=True)
 
     if use_predefined:
-        motif_name = st.selectbox("Select a motif", list(COMMON_MOTIFS.keys()))
-        motif = COMMON_MOTIFS[motif_name]
+        motif_names = st.multiselect("Select motifs", list(COMMON_MOTIFS.keys()), default=list(COMMON_MOTIFS.keys())[:1])
+        motifs = {COMMON_MOTIFS[name].upper(): name for name in motif_names}
     else:
-        motif = st.text_input("Enter custom motif")
+        custom = st.text_area("Enter custom motifs (one per line or comma-separated; IUPAC codes allowed)")
+        motifs = {motif.upper(): motif.upper() for motif in custom.replace(",", "\n").split() if motif}
+    both_strands = st.checkbox("Search both strands", value=True)
+    search_mode = st.radio("Matching", ["Exact", "Mismatches", "Edit distance"], horizontal=True)
+    max_errors = st.slider("Maximum errors", 1, 3, 1) if search_mode != "Exact" else 0
 
-    if motif:
-        positions = find_motif_positions(sequence, motif)
-        st.markdown(f"**Motif found at positions:** {positions}")
+    if motifs:
+        try:
+            if search_mode == "Exact":
+                index = cached_call(build_motif_index, sequence)
+                results = find_motif_sites(sequence, motifs, both_strands, index=index)
+            else:
+                mode = "mismatch" if search_mode == "Mismatches" else "edit"
+                results = {motif: find_approximate_motif(sequence, motif, max_errors, mode, both_strands) for motif in motifs}
+        except ValueError as e:
+            st.error(str(e))
+            return
+        st.dataframe([{"Motif": name, "Pattern": motif,
+                       "Forward": sum(hit["strand"] == "+" for hit in results[motif]),
+                       "Reverse": sum(hit["strand"] == "-" for hit in results[motif]),
+                       "Positions": ", ".join(f"{hit['start']}{hit['strand']}" for hit in results[motif][:50])}
+                      for motif, name in motifs.items()])
 
-        
-        if positions:
-            highlighted = highlight_motif(sequence, positions, len(motif))
-            st.code(highlighted, language="text")
-        else:
+        motif = st.selectbox("Highlight motif", list(motifs), format_func=lambda m: motifs[m])
+        positions = sorted({hit["start"] for hit in results[motif]})
+        st.markdown(f"**Motif found at {len(positions):,} position(s)**")
+
+        if search_mode != "Exact" and results[motif]:
+            with st.expander("Alignments"):
+                for hit in results[motif][:20]:
+                    motif_row, match_row, site_row = hit["alignment"]
+                    st.code(f"{hit['start']}{hit['strand']}  errors={hit['errors']}\n"
+                            f"motif {motif_row}\n      {match_row}\nsite  {site_row}", language="text")
+
+        if not positions:
             st.info("No matches found.")
+        else:
+            render_sequence_viewer(sequence, [
+                (motifs[motif], merge_intervals((hit["start"], hit["end"]) for hit in results[motif]), "#fff59d")
+            ], key="motif_viewer")
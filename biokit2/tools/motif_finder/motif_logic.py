@@ -1,13 +1,34 @@
 """
 Motif Finder Logic
 
-This module provides core logic for finding all occurrences of a given motif in a DNA sequence
-using the Z-Algorithm for efficient exact pattern matching.
+This module provides core logic for finding all occurrences of motifs in a DNA sequence.
+Exact matches are answered from a suffix array built once per sequence (callers such as
+the component cache it with biokit.cache and pass it back in), so every further motif
+costs a binary search plus its hits instead of a full pass over the sequence. Motifs with IUPAC degenerate codes (e.g. "SSRCGCC") are matched with the
+bitmask engine in biokit.iupac, which scans any number of motifs in one pass. The
+Z-Algorithm is kept for one-off matching of a single pattern.
+
+Approximate matches are found either with up to k mismatches (a vectorised per-position
+mask test over the encoded sequence) or within edit distance k (Myers' bit-vector
+algorithm, one pass of a few word operations per base), and are reported with their
+error count and alignment.
 
 Biological Significance:
 Motif discovery helps identify regulatory elements, binding sites, or conserved regions
 across sequences critical for gene expression and function.
 """
+from typing import Optional
+
+import numpy as np
+
+from biokit.annotation import mark_intervals
+from biokit.encoded_sequence import as_encoded
+from biokit.iupac import IUPAC_MASKS, find_iupac_motifs, is_degenerate, reverse_complement_iupac
+from biokit.suffix_array import SuffixArrayIndex
+
+def build_motif_index(sequence: str) -> SuffixArrayIndex:
+    """Builds the suffix-array index that exact motif lookups on a sequence share."""
+    return SuffixArrayIndex(sequence)
 
 def calculate_z_array(s: str) -> list[int]:
     """
@@ -32,27 +53,215 @@ def calculate_z_array(s: str) -> list[int]:
             l, r = i, i + Z[i] - 1
     return Z
 
-def find_motif_positions(sequence: str, motif: str) -> list[int]:
+def find_motif_positions(sequence: str, motif: str, index: Optional[SuffixArrayIndex] = None) -> list[int]:
     """
-    Finds all positions where the motif occurs exactly in the sequence.
+    Finds all positions where the motif occurs in the sequence (forward strand).
 
     Args:
         sequence (str): DNA sequence
-        motif (str): Motif to search for
+        motif (str): Motif to search for; IUPAC degenerate codes are allowed
+        index (SuffixArrayIndex, optional): Precomputed build_motif_index(sequence)
 
     Returns:
         list[int]: Starting indices (0-based) of motif occurrences in the sequence
     """
-    combined = motif + "$" + sequence
-    Z = calculate_z_array(combined)
-    positions = []
+    motif = motif.upper()
+    if is_degenerate(motif):
+        return [hit["start"] for hit in find_iupac_motifs(sequence, [motif], both_strands=False)[motif]]
+    return (build_motif_index(sequence) if index is None else index).find(motif)
+
+def find_motifs(sequence: str, motifs, index: Optional[SuffixArrayIndex] = None) -> dict[str, list[int]]:
+    """
+    Finds a batch of motifs against the same sequence index.
+
+    Args:
+        sequence (str): DNA sequence
+        motifs (iterable of str): Motifs to search for
+        index (SuffixArrayIndex, optional): Precomputed build_motif_index(sequence)
+
+    Returns:
+        dict: motif -> starting indices (0-based) of its exact occurrences
+    """
+    return (build_motif_index(sequence) if index is None else index).find_many(motif.upper() for motif in motifs)
+
+def find_motif_sites(sequence: str, motifs, both_strands: bool = True,
+                     index: Optional[SuffixArrayIndex] = None) -> dict[str, list[dict]]:
+    """
+    Finds literal and IUPAC degenerate motifs on one or both strands.
+
+    Literal motifs (and their reverse complements) are looked up in the
+    suffix-array index, built here unless one is passed in; degenerate motifs are scanned together in one pass.
+
+    Args:
+        sequence (str): DNA sequence
+        motifs (iterable of str): Motifs, optionally with IUPAC codes
+        both_strands (bool): Also report matches on the reverse strand
+        index (SuffixArrayIndex, optional): Precomputed build_motif_index(sequence)
+
+    Returns:
+        dict: motif (uppercase) -> list of {"start", "end", "strand", "match"} ordered by
+              start, with 0-based forward-strand coordinates and the match read 5'->3'
+              on its own strand
+    """
+    motifs = list(dict.fromkeys(motif.upper() for motif in motifs))
+    degenerate = [motif for motif in motifs if is_degenerate(motif)]
+    sites = find_iupac_motifs(sequence, degenerate, both_strands) if degenerate else {}
+
+    for motif in motifs:
+        if motif in sites:
+            continue
+        if index is None:
+            index = build_motif_index(sequence)
+        hits = [{"start": start, "end": start + len(motif), "strand": "+", "match": motif}
+                for start in index.find(motif)]
+        rc_motif = reverse_complement_iupac(motif)
+        if both_strands and rc_motif != motif:
+            hits += [{"start": start, "end": start + len(motif), "strand": "-", "match": motif}
+                     for start in index.find(rc_motif)]
+            hits.sort(key=lambda hit: (hit["start"], hit["strand"]))
+        sites[motif] = hits
+    return {motif: sites[motif] for motif in motifs}
+
+_CODE_BITS = np.array([1, 2, 4, 8, 0], dtype=np.uint8)  # base code -> IUPAC bit (N matches nothing)
+
+def _pattern_masks(motif: str) -> list[int]:
+    try:
+        return [IUPAC_MASKS[code] for code in motif]
+    except KeyError as e:
+        raise ValueError(f"Invalid IUPAC motif '{motif}'.") from e
+
+def _mismatch_hits(codes: np.ndarray, masks: list[int], max_errors: int):
+    """Yields (start, end, mismatches) for every window within max_errors mismatches."""
+    m = len(masks)
+    count = len(codes) - m + 1
+    if count <= 0:
+        return
+    bits = _CODE_BITS[codes]
+    mismatches = np.zeros(count, dtype=np.int32)
+    for j, mask in enumerate(masks):
+        mismatches += (bits[j:j + count] & mask) == 0
+    starts = np.flatnonzero(mismatches <= max_errors)
+    for start, errors in zip(starts.tolist(), mismatches[starts].tolist()):
+        yield start, start + m, errors
+
+def _myers_end_positions(codes: np.ndarray, masks: list[int], max_errors: int) -> list[tuple[int, int]]:
+    """
+    Myers' bit-vector scan: (end index, edit distance) for every text position where
+    the pattern ends with at most max_errors edits, keeping the best end of each run.
+    """
+    m = len(masks)
+    full = (1 << m) - 1
+    high = 1 << (m - 1)
+    peq = [sum(1 << j for j, mask in enumerate(masks) if mask & bit) for bit in (1, 2, 4, 8)] + [0]
+    pv, mv, score = full, 0, m
+
+    ends = []
+    last = -2  # last end position within max_errors; consecutive ones form a run
+    for j, code in enumerate(codes.tolist()):
+        eq = peq[code]
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | (~(xh | pv) & full)
+        mh = pv & xh
+        if ph & high:
+            score += 1
+        elif mh & high:
+            score -= 1
+        ph = (ph << 1) & full
+        mh = (mh << 1) & full
+        pv = mh | (~(xv | ph) & full)
+        mv = ph & xv
+        if score <= max_errors:
+            if last != j - 1:
+                ends.append((j, score))
+            elif score < ends[-1][1]:
+                ends[-1] = (j, score)
+            last = j
+    return ends
+
+def _align_to_end(text: str, window_start: int, motif: str, masks: list[int]):
+    """
+    Semi-global alignment of the whole motif against a suffix of text (which
+    ends at the hit's last base). Returns (start, motif row, match row, site row).
+    """
+    bits = _CODE_BITS[as_encoded(text).codes].tolist()
+    m, w = len(masks), len(text)
+    dist = [[0] * (w + 1)] + [[i] + [0] * w for i in range(1, m + 1)]
+    for i in range(1, m + 1):
+        row, above, mask = dist[i], dist[i - 1], masks[i - 1]
+        for j in range(1, w + 1):
+            row[j] = min(above[j - 1] + (0 if bits[j - 1] & mask else 1), above[j] + 1, row[j - 1] + 1)
+
+    motif_row, match_row, site_row = [], [], []
+    i, j = m, w
+    while i > 0:
+        if j > 0 and dist[i][j] == dist[i - 1][j - 1] + (0 if bits[j - 1] & masks[i - 1] else 1):
+            same = bool(bits[j - 1] & masks[i - 1])
+            motif_row.append(motif[i - 1]); site_row.append(text[j - 1]); match_row.append("|" if same else ".")
+            i, j = i - 1, j - 1
+        elif dist[i][j] == dist[i - 1][j] + 1:
+            motif_row.append(motif[i - 1]); site_row.append("-"); match_row.append(" ")
+            i -= 1
+        else:
+            motif_row.append("-"); site_row.append(text[j - 1]); match_row.append(" ")
+            j -= 1
+    return window_start + j, "".join(reversed(motif_row)), "".join(reversed(match_row)), "".join(reversed(site_row))
+
+def find_approximate_motif(sequence, motif: str, max_errors: int = 1, mode: str = "mismatch", both_strands: bool = True) -> list[dict]:
+    """
+    Finds occurrences of a motif allowing mismatches or edits.
+
+    Args:
+        sequence (str | EncodedSequence): DNA sequence
+        motif (str): Motif; IUPAC degenerate codes are allowed
+        max_errors (int): Maximum number of mismatches ("mismatch") or edits ("edit")
+        mode (str): "mismatch" (Hamming distance, substitutions only) or
+                    "edit" (Levenshtein distance, Myers' bit-vector algorithm)
+        both_strands (bool): Also search the reverse complement of the motif
+
+    Returns:
+        list[dict]: Hits ordered by start, each with start, end (0-based forward-strand
+                    coordinates, end exclusive), strand, errors, match (site read on
+                    its strand) and alignment (motif row, match row, site row, all read
+                    on the motif's strand)
+    """
+    motif = motif.upper()
+    if not 0 <= max_errors < len(motif):
+        raise ValueError("Allowed errors must be at least 0 and smaller than the motif length.")
+    if mode not in ("mismatch", "edit"):
+        raise ValueError(f"Unknown search mode '{mode}'.")
+    seq = as_encoded(sequence)
+    text = str(seq)
+
+    patterns = [("+", motif)]
+    if both_strands and reverse_complement_iupac(motif) != motif:
+        patterns.append(("-", reverse_complement_iupac(motif)))
 
-    motif_len = len(motif)
-    for i in range(len(motif) + 1, len(Z)):
-        if Z[i] == motif_len:
-            positions.append(i - motif_len - 1)
+    hits = []
+    for strand, pattern in patterns:
+        masks = _pattern_masks(pattern)
+        if mode == "mismatch":
+            found = []
+            for start, end, errors in _mismatch_hits(seq.codes, masks, max_errors):
+                site = text[start:end]
+                match_row = "".join("|" if _CODE_BITS[seq.codes[start + j]] & mask else "." for j, mask in enumerate(masks))
+                found.append((start, end, errors, pattern, match_row, site))
+        else:
+            found = []
+            for end, errors in _myers_end_positions(seq.codes, masks, max_errors):
+                window_start = max(0, end + 1 - len(pattern) - max_errors)
+                start, motif_row, match_row, site_row = _align_to_end(text[window_start:end + 1], window_start, pattern, masks)
+                found.append((start, end + 1, errors, motif_row, match_row, site_row))
 
-    return positions
+        for start, end, errors, motif_row, match_row, site_row in found:
+            if strand == "-":
+                motif_row = reverse_complement_iupac(motif_row)
+                site_row = reverse_complement_iupac(site_row)
+                match_row = match_row[::-1]
+            hits.append({"start": start, "end": end, "strand": strand, "errors": errors,
+                         "match": site_row.replace("-", ""), "alignment": (motif_row, match_row, site_row)})
+    hits.sort(key=lambda hit: (hit["start"], hit["strand"]))
+    return hits
 
 def highlight_motif(sequence: str, positions: list[int], motif_len: int) -> str:
     """
@@ -66,11 +275,4 @@ def highlight_motif(sequence: str, positions: list[int], motif_len: int) -> str:
     Returns:
         str: Sequence string with matches highlighted
     """
-    marked = []
-    last = 0
-    for pos in positions:
-        marked.append(sequence[last:pos])
-        marked.append("[" + sequence[pos:pos + motif_len] + "]")
-        last = pos + motif_len
-    marked.append(sequence[last:])
-    return "".join(marked)
+    return mark_intervals(sequence, ((pos, pos + motif_len) for pos in positions))
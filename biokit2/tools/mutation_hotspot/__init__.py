@@ -1,2 +1 @@
-from .mutation_hotspot import find_hotspot_windows,compute_prefix_sums
-from .mutation_hotspot_component import render_mutation_hotspot_tool
\ No newline at end of file
+from .mutation_hotspot import find_hotspots,iter_hotspots,hotspot_threshold,compute_prefix_sums,mutation_density,window_counts,poisson_tail
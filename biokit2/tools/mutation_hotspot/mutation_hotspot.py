@@ -1,26 +1,180 @@
-def compute_prefix_sums(mutation_positions: list[int], length: int) -> list[int]:
-    prefix = [0] * (length + 1)
-    for pos in mutation_positions:
-        if 0 <= pos < length:
-            prefix[pos + 1] += 1
+"""
+Mutation Hotspot Detector Logic
 
-    for i in range(1, length + 1):
-        prefix[i] += prefix[i - 1]
+Mutation positions are binned once with np.bincount and turned into a prefix
+sum, so the count of any window is one subtraction and all windows are
+evaluated together. Instead of a fixed count cut-off, a window is called hot
+when its count is significantly above the uniform background: under a
+Poisson model with the expected count of a window of that size, the upper
+tail P(X >= c) is Bonferroni-corrected over the number of non-overlapping
+windows that fit in the sequence. Overlapping or touching hot windows are
+merged into maximal hotspot intervals, trimmed to their outermost mutations.
+"""
+import math
 
+import numpy as np
+
+
+def mutation_density(mutation_positions, length: int) -> np.ndarray:
+    """Returns the number of mutations at each 0-based position (positions outside [0, length) are ignored)."""
+    positions = np.asarray(mutation_positions, dtype=np.int64)
+    positions = positions[(positions >= 0) & (positions < length)]
+    return np.bincount(positions, minlength=length)
+
+
+def compute_prefix_sums(mutation_positions, length: int) -> np.ndarray:
+    """Returns prefix[i] = number of mutations in [0, i), an int64 array of length + 1."""
+    prefix = np.zeros(length + 1, dtype=np.int64)
+    np.cumsum(mutation_density(mutation_positions, length), out=prefix[1:])
     return prefix
 
 
-def find_hotspot_windows(mutation_positions: list[int], sequence_length: int, window_size: int, threshold: int) -> list[tuple[int, int, int]]:
+def window_counts(prefix: np.ndarray, window_size: int, step: int = 1) -> np.ndarray:
+    """Mutation count of every window [start, start + window_size) for starts 0, step, 2*step, ..."""
+    count = (len(prefix) - 1 - window_size) // step + 1
+    if count <= 0:
+        return np.zeros(0, dtype=np.int64)
+    return prefix[window_size::step][:count] - prefix[::step][:count]
+
+
+def poisson_tail(max_count: int, expected: float) -> np.ndarray:
+    """
+    Upper tail P(X >= c) of a Poisson(expected) variable for c = 0..max_count.
+
+    The tail is summed from the largest terms down instead of taken as
+    1 - CDF, so very small p-values keep their precision.
+    """
+    if expected <= 0:
+        return (np.arange(max_count + 1) == 0).astype(np.float64)
+    upper = int(max(max_count, expected + 12 * math.sqrt(expected) + 30))
+    counts = np.arange(upper + 1)
+    log_factorial = np.concatenate(([0.0], np.cumsum(np.log(counts[1:]))))
+    pmf = np.exp(counts * math.log(expected) - expected - log_factorial)
+    tail = np.cumsum(pmf[::-1])[::-1]
+    return np.minimum(tail[:max_count + 1], 1.0)
+
+
+def _background(total: int, sequence_length: int, window_size: int) -> tuple[float, int]:
+    """Expected mutations per window and the number of tests for the Bonferroni correction."""
+    expected = total * window_size / sequence_length if sequence_length else 0.0
+    return expected, max(1, math.ceil(sequence_length / window_size))
+
+
+def hotspot_threshold(total: int, sequence_length: int, window_size: int, alpha: float = 0.01) -> int:
+    """
+    Smallest window count that is significant at level alpha.
+
+    Args:
+        total (int): Number of mutations inside the sequence.
+        sequence_length (int): Sequence length in bases.
+        window_size (int): Window length in bases.
+        alpha (float): Family-wise significance level.
+
+    Returns:
+        int: Minimum mutations per window (at least 1).
+    """
+    expected, tests = _background(total, sequence_length, window_size)
+    max_count = max(total, 1)
+    significant = np.flatnonzero(poisson_tail(max_count, expected) * tests <= alpha)
+    return int(significant[0]) if significant.size else max_count + 1
+
+
+def find_hotspots(mutation_positions, sequence_length: int, window_size: int = 20, step: int = 1,
+                  alpha: float = 0.01, prefix=None) -> list[dict]:
+    """
+    Finds maximal intervals of significantly mutation-dense windows.
+
+    Args:
+        mutation_positions (array-like of int): 0-based mutation positions.
+        sequence_length (int): Sequence length; positions outside it are ignored.
+        window_size (int): Window length in bases.
+        step (int): Distance between window starts.
+        alpha (float): Family-wise significance level (Bonferroni over the
+            sequence_length / window_size non-overlapping windows).
+        prefix (np.ndarray, optional): Precomputed compute_prefix_sums(mutation_positions, sequence_length).
+
+    Returns:
+        list[dict]: One entry per merged hotspot, in position order: start (0-based,
+            first mutation), end (exclusive, after the last mutation), mutations,
+            expected (under the uniform background), fold_enrichment, peak_count
+            (densest window) and pvalue (corrected, of the densest window).
     """
-    Returns list of (start, end, mutation_count) for windows that have mutation count >= threshold
+    if prefix is None:
+        prefix = compute_prefix_sums(mutation_positions, sequence_length)
+    total = int(prefix[-1])
+    counts = window_counts(prefix, window_size, step)
+    threshold = hotspot_threshold(total, sequence_length, window_size, alpha)
+    hot = np.flatnonzero(counts >= threshold)
+    if not hot.size:
+        return []
+
+    starts = hot * step
+    breaks = np.flatnonzero(starts[1:] > starts[:-1] + window_size) + 1
+    first = np.concatenate(([0], breaks))
+    last = np.concatenate((breaks, [len(hot)])) - 1
+    # Trim each union of hot windows to its outermost mutations.
+    begin = np.searchsorted(prefix, prefix[starts[first]] + 1) - 1
+    end = np.searchsorted(prefix, prefix[starts[last] + window_size])
+    mutations = prefix[end] - prefix[begin]
+    peaks = np.maximum.reduceat(counts[hot], first)
+
+    window_expected, tests = _background(total, sequence_length, window_size)
+    pvalues = np.minimum(poisson_tail(int(peaks.max()), window_expected)[peaks] * tests, 1.0)
+    expected = total * (end - begin) / sequence_length
+    return [{
+        "start": int(b),
+        "end": int(e),
+        "mutations": int(m),
+        "expected": round(float(x), 3),
+        "fold_enrichment": round(float(m / x), 2) if x else float("inf"),
+        "peak_count": int(p),
+        "pvalue": float(pv),
+    } for b, e, m, x, p, pv in zip(begin, end, mutations, expected, peaks, pvalues)]
+
+
+def iter_hotspots(mutation_positions, sequence_length: int, window_size: int = 20, step: int = 1,
+                  alpha: float = 0.01, block_size: int = 1 << 20):
+    """
+    Yields the same hotspots as find_hotspots, scanning block_size bases of windows at a time.
+
+    Window counts are taken from the sorted positions by binary search, so
+    memory depends on the number of mutations and the block size, not on the
+    sequence length. Runs of hot windows are carried across block boundaries.
     """
-    prefix = compute_prefix_sums(mutation_positions, sequence_length)
-    hotspots = []
+    positions = np.sort(np.asarray(mutation_positions, dtype=np.int64))
+    positions = positions[(positions >= 0) & (positions < sequence_length)]
+    total = len(positions)
+    threshold = hotspot_threshold(total, sequence_length, window_size, alpha)
+    window_expected, tests = _background(total, sequence_length, window_size)
 
-    for start in range(0, sequence_length - window_size + 1):
-        end = start + window_size
-        mutation_count = prefix[end] - prefix[start]
-        if mutation_count >= threshold:
-            hotspots.append((start, end, mutation_count))
+    def hotspot(first_start, last_start, peak):
+        begin = int(positions[np.searchsorted(positions, first_start)])
+        end = int(positions[np.searchsorted(positions, last_start + window_size) - 1]) + 1
+        mutations = int(np.searchsorted(positions, end) - np.searchsorted(positions, begin))
+        expected = total * (end - begin) / sequence_length
+        return {
+            "start": begin,
+            "end": end,
+            "mutations": mutations,
+            "expected": round(expected, 3),
+            "fold_enrichment": round(mutations / expected, 2) if expected else float("inf"),
+            "peak_count": peak,
+            "pvalue": float(min(poisson_tail(peak, window_expected)[peak] * tests, 1.0)),
+        }
 
-    return hotspots
+    block_size = -(-block_size // step) * step
+    last_window = sequence_length - window_size  # last valid window start
+    run = None  # [first_start, last_start, peak] of the open run of hot windows
+    for block_start in range(0, max(last_window + 1, 0), block_size):
+        starts = np.arange(block_start, min(block_start + block_size, last_window + 1), step)
+        counts = np.searchsorted(positions, starts + window_size) - np.searchsorted(positions, starts)
+        hot = np.flatnonzero(counts >= threshold)
+        for start, count in zip(starts[hot].tolist(), counts[hot].tolist()):
+            if run is not None and start <= run[1] + window_size:
+                run[1], run[2] = start, max(run[2], count)
+                continue
+            if run is not None:
+                yield hotspot(*run)
+            run = [start, start, count]
+    if run is not None:
+        yield hotspot(*run)
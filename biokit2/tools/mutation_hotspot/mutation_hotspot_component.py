@@ -1,65 +1,139 @@
+import io
+
 import streamlit as st
 import plotly.express as px
 import numpy as np
 
-from biokit2.tools.mutation_hotspot.mutation_hotspot import find_hotspot_windows
+from biokit.variant_reader import read_contig_lengths, read_variant_positions
+from biokit1.tools.calculate_gc_content import PLOT_WIDTH_PX
+from biokit2.tools.mutation_hotspot.mutation_hotspot import hotspot_threshold, iter_hotspots
+
+
+MAX_PLOTTED_WINDOWS = 2_000_000
+
+
+@st.cache_data(show_spinner="Reading variants...", max_entries=4)
+def _load_variants(data: bytes, name: str):
+    fmt = "bed" if name.lower().removesuffix(".gz").endswith(".bed") else None
+    return read_variant_positions(io.BytesIO(data), fmt), read_contig_lengths(io.BytesIO(data))
+
+
+def _mutation_positions(sequence, location):
+    """
+    Returns (positions, scanned length, offset): 0-based positions relative to the
+    scanned stretch, which starts at `offset` in the coordinates the user works in.
+    """
+    none = np.zeros(0, dtype=np.int64), len(sequence), 0
+    source = st.radio("Mutation source", ["Enter positions", "Upload VCF/BED file"], horizontal=True)
+    if source == "Enter positions":
+        mutation_input = st.text_area("Enter known mutation positions (0-based, comma-separated)", placeholder="e.g. 5,12,30,31,32,78")
+        positions = np.array([int(pos.strip()) for pos in mutation_input.split(",") if pos.strip().isdigit()], dtype=np.int64)
+        return positions, len(sequence), 0
+
+    upload = st.file_uploader("VCF or BED file (plain or gzipped)", type=["vcf", "bed", "gz", "txt"])
+    if not upload:
+        return none
+    try:
+        by_chrom, contig_lengths = _load_variants(upload.getvalue(), upload.name)
+    except ValueError as err:
+        st.error(f"Could not read the variant file: {err}")
+        return none
+    if not by_chrom:
+        st.warning("The file contains no variant records.")
+        return none
+    chroms = list(by_chrom)
+    default = chroms.index(location["name"]) if location and location["name"] in by_chrom else 0
+    chrom = st.selectbox("Chromosome / contig", chroms, index=default,
+                         format_func=lambda c: f"{c} ({len(by_chrom[c]):,} records)")
+    positions = by_chrom[chrom]
+
+    # Variant files use chromosome coordinates: shift them onto the selected region...
+    if location and location["name"] == chrom:
+        start = location["start"]
+        st.caption(f"Scanning the selected region {chrom}:{start + 1:,}-{start + len(sequence):,}; "
+                   "positions below are 0-based chromosome coordinates.")
+        return positions - start, len(sequence), start
+
+    # ...or scan the whole chromosome, whose length comes from the reference or the VCF header.
+    known = contig_lengths.get(chrom)
+    if known:
+        st.caption(f"Scanning all of {chrom} ({known:,} bp); positions below are 0-based chromosome coordinates.")
+        return positions, known, 0
+    length = st.number_input(f"Length of {chrom} (bp; the file declares no ##contig length)", min_value=1,
+                             value=int(positions.max()) + 1 if positions.size else 1, step=1000)
+    return positions, int(length), 0
 
 
-def render_mutation_hotspot_tool(sequence: str):
+def _window_heatmap(positions: np.ndarray, sequence_length: int, window_size: int, step: int):
+    """Window counts by binary search over the sorted positions, sampled when there are too many windows."""
+    n_windows = (sequence_length - window_size) // step + 1
+    stride = step * max(1, -(-n_windows // MAX_PLOTTED_WINDOWS))
+    starts = np.arange(0, max(sequence_length - window_size + 1, 0), stride)
+    counts = np.searchsorted(positions, starts + window_size) - np.searchsorted(positions, starts)
+    return counts, stride
+
+
+def _binned_max(values: np.ndarray, max_points: int = PLOT_WIDTH_PX):
+    """Keeps the densest window of each pixel-wide bin so narrow hotspots stay visible."""
+    bin_size = max(1, -(-len(values) // max_points))
+    padded = np.pad(values, (0, -len(values) % bin_size))
+    return padded.reshape(-1, bin_size).max(axis=1), bin_size
+
+
+def render_mutation_hotspot_tool(sequence: str, location=None):
+    """
+    Args:
+        sequence (str): Sequence being analysed.
+        location (dict, optional): {"name", "start", "length"} of the sequence within its
+            chromosome when it is a region of a reference (see indexed_region_box).
+    """
     st.subheader(" Mutation Hotspot Detector")
 
-    mutation_input = st.text_area("Enter known mutation positions (comma-separated)", placeholder="e.g. 5,12,30,31,32,78")
-
-    if mutation_input:
-        try:
-            mutation_positions = [int(pos.strip()) for pos in mutation_input.split(",") if pos.strip().isdigit()]
-        except ValueError:
-            st.error("Invalid mutation position input. Please enter only comma-separated integers.")
-            return
-
-        window_size = st.slider("Sliding Window Size", min_value=5, max_value=100, value=20, step=5)
-        step = st.slider("Step Size", min_value=1, max_value=20, value=5, step=1)
-        threshold = st.slider("Mutation Count Threshold", min_value=1, max_value=10, value=3, step=1)
-
-        
-        sequence_length = len(sequence)
-        full_windows = []
-        density_array = []
-
-        
-        prefix = [0] * (sequence_length + 1)
-        for pos in mutation_positions:
-            if 0 <= pos < sequence_length:
-                prefix[pos + 1] += 1
-        for i in range(1, sequence_length + 1):
-            prefix[i] += prefix[i - 1]
-
-        for start in range(0, sequence_length - window_size + 1, step):
-            end = start + window_size
-            mutation_count = prefix[end] - prefix[start]
-            density_array.append(mutation_count)
-            full_windows.append(f"{start}-{end}")
-
-        st.markdown("###  Mutation Density Heatmap")
-        heatmap_fig = px.imshow(
-            np.array([density_array]),
-            labels=dict(x="Window Position", color="Mutation Count"),
-            x=full_windows,
-            y=["Density"],
-            aspect="auto",
-            color_continuous_scale="Reds"
+    mutation_positions, sequence_length, offset = _mutation_positions(sequence, location)
+    if not mutation_positions.size:
+        return
+
+    window_size = st.slider("Sliding Window Size", min_value=5, max_value=1000, value=20, step=5)
+    step = st.slider("Step Size", min_value=1, max_value=100, value=5, step=1)
+    alpha = st.select_slider("Significance level (family-wise)", options=[0.1, 0.05, 0.01, 0.001, 0.0001], value=0.01)
+
+    # Sorted positions inside the scanned stretch; memory follows the variants, not the chromosome length.
+    positions = np.sort(mutation_positions[(mutation_positions >= 0) & (mutation_positions < sequence_length)])
+    total = len(positions)
+    if total < len(mutation_positions):
+        st.warning(f"{len(mutation_positions) - total:,} position(s) fall outside the {sequence_length:,} bp scanned and were ignored.")
+
+    counts, stride = _window_heatmap(positions, sequence_length, window_size, step)
+    density, bin_size = _binned_max(counts)
+    st.markdown("###  Mutation Density Heatmap")
+    heatmap_fig = px.imshow(
+        density[None, :],
+        labels=dict(x="Window Start (0-based)", color="Mutation Count"),
+        x=offset + np.arange(len(density)) * bin_size * stride,
+        y=["Density"],
+        aspect="auto",
+        color_continuous_scale="Reds"
+    )
+    heatmap_fig.update_layout(height=200, margin=dict(l=30, r=30, t=30, b=30))
+    st.plotly_chart(heatmap_fig, use_container_width=True)
+    if bin_size > 1 or stride > step:
+        st.caption(f"Each column shows the densest of {bin_size} windows"
+                   + (f" sampled every {stride:,} bp." if stride > step else "."))
+
+    threshold = hotspot_threshold(total, sequence_length, window_size, alpha)
+    hotspots = list(iter_hotspots(positions, sequence_length, window_size, step, alpha))
+    expected = total * window_size / sequence_length
+
+    st.markdown(f"###  {len(hotspots)} Hotspot(s)")
+    st.caption(f"{total:,} mutations, {expected:.2f} expected per window: windows with at least {threshold} "
+               f"are significant (Poisson, Bonferroni-corrected, α = {alpha}). Overlapping windows are merged.")
+    if hotspots:
+        st.dataframe(
+            [{"Start (0-based)": h["start"] + offset, "End (exclusive)": h["end"] + offset, "Mutations": h["mutations"],
+              "Expected": h["expected"], "Fold Enrichment": h["fold_enrichment"], "Peak Window Count": h["peak_count"],
+              "p-value": h["pvalue"]}
+             for h in hotspots],
+            use_container_width=True
         )
-        heatmap_fig.update_layout(height=200, margin=dict(l=30, r=30, t=30, b=30))
-        st.plotly_chart(heatmap_fig, use_container_width=True)
-
-        # Show windows that qualify as hotspots
-        hotspots = find_hotspot_windows(mutation_positions, sequence_length, window_size, threshold)
-
-        st.markdown(f"###  {len(hotspots)} Hotspot(s) Above Threshold")
-        if hotspots:
-            st.dataframe(
-                [{"Start": s, "End": e, "Mutation Count": c} for s, e, c in hotspots],
-                use_container_width=True
-            )
-        else:
-            st.info("No hotspots exceed the selected mutation threshold.")
+    else:
+        st.info("No window is significantly mutation-dense at the selected level.")
@@ -1,2 +1 @@
-from .orf_component import render_orf_finder
 from .orf_logic import highlight_orfs, find_orfs
@@ -1,15 +1,40 @@
-from .orf_logic import find_orfs, highlight_orfs
+from biokit.cache import cached_call
+from biokit.annotation import merge_intervals
+from biokit.translation import table_codons
+from biokit1.components.sequence_viewer import render_sequence_viewer
+from biokit2.data.genetic_code import NCBI_GENETIC_CODES
+from .orf_logic import find_orfs
 import streamlit as st
+import pandas as pd
 
 def render_orf_finder(sequence: str):
     st.subheader("ORF Finder")
     st.markdown("""
-    **What this tool does:**  
-    Finds all Open Reading Frames (ORFs) in the forward strand of the input DNA sequence.  
-    An ORF starts with `ATG` and ends at the nearest downstream stop codon (`TAA`, `TAG`, or `TGA`) in-frame.
+    **What this tool does:**
+    Finds Open Reading Frames (ORFs) in all six reading frames (both strands) of the input DNA sequence.
+    An ORF starts at the first start codon after an in-frame stop and ends at the next stop codon of the selected genetic code.
     """)
 
-    orfs = find_orfs(sequence)
+    table = st.selectbox("Genetic code", list(NCBI_GENETIC_CODES), format_func=lambda t: f"{t}. {NCBI_GENETIC_CODES[t][0]}",
+                         key="orf_table")
+    stop_codons = table_codons(table, "stop")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        min_length = st.number_input("Minimum ORF length (nt)", min_value=6, max_value=10000, value=30, step=3)
+    with col2:
+        start_codons = st.multiselect("Start codons", table_codons(table, "start"), default=["ATG"])
+    with col3:
+        both_strands = st.checkbox("Scan reverse strand", value=True)
+
+    if not start_codons:
+        st.warning("Please select at least one start codon.")
+        return
+    if not stop_codons:
+        st.warning("This genetic code has no unambiguous stop codons, so ORFs cannot be delimited.")
+        return
+
+    orfs = cached_call(find_orfs, sequence, min_length=min_length, start_codons=start_codons,
+                       stop_codons=stop_codons, both_strands=both_strands)
 
     if not orfs:
         st.warning("No ORFs found.")
@@ -17,11 +42,17 @@ def render_orf_finder(sequence: str):
 
     st.success(f"Found {len(orfs)} ORF(s)")
 
-    for i, (start, end, orf_seq) in enumerate(orfs, 1):
-        st.markdown(f"**ORF {i}:** Position `{start}–{end}`, Length: `{end - start}`")
-        st.code(orf_seq, language="text")
+    df = pd.DataFrame(orfs).sort_values(by="length", ascending=False)
+    st.dataframe(df[["start", "end", "strand", "frame", "length"]], use_container_width=True)
+
+    with st.expander("ORF sequences (longest 20)"):
+        for i, orf in enumerate(df.head(20).to_dict("records"), 1):
+            st.markdown(f"**ORF {i}:** Position `{orf['start']}–{orf['end']}` ({orf['strand']}{abs(orf['frame'])}), Length: `{orf['length']}`")
+            st.code(orf["sequence"], language="text")
 
-    # Highlight all ORFs visually in the original sequence
-    highlighted = highlight_orfs(sequence, [(start, end) for start, end, _ in orfs])
+    # Highlight all ORFs visually in the original sequence, one page at a time
     st.markdown("### Highlighted ORFs in Sequence")
-    st.code(highlighted, language="text")
+    render_sequence_viewer(sequence, [
+        ("Forward-strand ORF", merge_intervals((orf["start"], orf["end"]) for orf in orfs if orf["strand"] == "+"), "#a5d6a7"),
+        ("Reverse-strand ORF", merge_intervals((orf["start"], orf["end"]) for orf in orfs if orf["strand"] == "-"), "#ffcc80"),
+    ], key="orf_viewer")
@@ -1,35 +1,101 @@
-def find_orfs(sequence: str) -> list[tuple[int, int, str]]:
+from typing import Iterator
+
+import numpy as np
+
+from biokit.annotation import mark_intervals
+from biokit.encoded_sequence import ENCODE_TABLE, N_CODE, as_encoded
+from biokit.translation import INVALID_CODON, codon_codes
+
+
+def _codon_table(codons) -> np.ndarray:
+    """Boolean lookup over the 65 codon codes (64 = contains a non-ACGT base)."""
+    table = np.zeros(INVALID_CODON + 1, dtype=bool)
+    for codon in codons:
+        a, b, c = (int(ENCODE_TABLE[ord(base)]) for base in codon)
+        if max(a, b, c) < N_CODE:
+            table[a * 16 + b * 4 + c] = True
+    return table
+
+
+def _frame_orfs(codons: np.ndarray, frame: int, starts: np.ndarray, stops: np.ndarray, min_codons: int):
+    """
+    Yields (start, end) for every complete ORF in one frame of one strand.
+
+    Each stop codon closes at most one ORF, beginning at the first start codon
+    after the previous in-frame stop, so the scan is a single linear pass.
+    """
+    frame_codons = codons[frame::3]
+    is_start = starts[frame_codons]
+    is_stop = stops[frame_codons]
+    count = len(frame_codons)
+
+    stop_idx = np.flatnonzero(is_stop)
+    if not stop_idx.size:
+        return
+
+    # next_start[j] = index of the first start codon at or after j (count if none)
+    next_start = np.where(is_start, np.arange(count), count)
+    next_start = np.minimum.accumulate(next_start[::-1])[::-1]
+    next_start = np.append(next_start, count)
+
+    prev_stop = np.concatenate(([-1], stop_idx[:-1]))
+    orf_start = next_start[prev_stop + 1]
+    keep = (orf_start < stop_idx) & (stop_idx - orf_start + 1 >= min_codons)
+
+    for first, last in zip(orf_start[keep].tolist(), stop_idx[keep].tolist()):
+        yield frame + first * 3, frame + last * 3 + 3
+
+
+def find_orfs(sequence, min_length: int = 0, start_codons=("ATG",), stop_codons=("TAA", "TAG", "TGA"), both_strands: bool = True) -> Iterator[dict]:
     """
-    Identifies all Open Reading Frames (ORFs) in a DNA sequence on the forward strand.
+    Identifies Open Reading Frames (ORFs) in all six reading frames of a DNA sequence.
+
+    Each frame is scanned once for stop codons; every stop closes the longest
+    ORF that begins at the first start codon after the preceding in-frame
+    stop, so nested start codons do not produce duplicate ORFs. The whole scan
+    is vectorised with NumPy over an array of codon codes.
 
     Parameters:
-        sequence (str): A valid, uppercase DNA sequence (A, T, C, G).
+        sequence (str | EncodedSequence): A valid DNA sequence (A, T, C, G; other characters never match).
+        min_length (int): Minimum ORF length in nucleotides, stop codon included.
+        start_codons (iterable of str): Codons that may start an ORF (e.g. "ATG", "GTG", "TTG").
+        stop_codons (iterable of str): Codons that terminate an ORF.
+        both_strands (bool): Also scan the three reverse-complement frames.
 
-    Returns:
-        list of tuples: Each tuple contains:
-            - start index of ORF (0-based)
-            - end index (exclusive)
-            - ORF sequence string
+    Yields:
+        dict: One per ORF, with keys:
+            - start: start index on the forward strand (0-based)
+            - end: end index on the forward strand (exclusive)
+            - strand: "+" or "-"
+            - frame: 1, 2, 3 (forward) or -1, -2, -3 (reverse)
+            - length: ORF length in nucleotides
+            - sequence: ORF sequence read 5'->3' on its own strand
     """
-    start_codon = "ATG"
-    stop_codons = {"TAA", "TAG", "TGA"}
-    orfs = []
+    seq = as_encoded(sequence)
+    n = len(seq)
+    if n < 3:
+        return
+
+    starts = _codon_table(start_codons)
+    stops = _codon_table(stop_codons)
+    min_codons = max(2, -(-min_length // 3))
 
+    codons = codon_codes(seq.codes)
     for frame in range(3):
-        i = frame
-        while i < len(sequence) - 2:
-            codon = sequence[i:i+3]
-            if codon == start_codon:
-                j = i + 3
-                while j < len(sequence) - 2:
-                    next_codon = sequence[j:j+3]
-                    if next_codon in stop_codons:
-                        if (j - i) % 3 == 0:
-                            orfs.append((i, j + 3, sequence[i:j+3]))
-                            break
-                    j += 3
-            i += 3
-    return orfs
+        for start, end in _frame_orfs(codons, frame, starts, stops, min_codons):
+            yield {"start": start, "end": end, "strand": "+", "frame": frame + 1,
+                   "length": end - start, "sequence": str(seq)[start:end]}
+
+    if not both_strands:
+        return
+
+    rc = seq.reverse_complement()
+    rc_codons = codon_codes(rc.codes)
+    for frame in range(3):
+        for rc_start, rc_end in _frame_orfs(rc_codons, frame, starts, stops, min_codons):
+            yield {"start": n - rc_end, "end": n - rc_start, "strand": "-", "frame": -(frame + 1),
+                   "length": rc_end - rc_start, "sequence": str(rc)[rc_start:rc_end]}
+
 
 def highlight_orfs(sequence: str, orf_coords: list[tuple[int, int]]) -> str:
     """
@@ -42,11 +108,4 @@ def highlight_orfs(sequence: str, orf_coords: list[tuple[int, int]]) -> str:
     Returns:
         str: The original sequence with ORFs wrapped in square brackets.
     """
-    # Sort ORFs in reverse so insertions don't shift upcoming positions
-    orf_coords = sorted(orf_coords, key=lambda x: x[0], reverse=True)
-
-    for start, end in orf_coords:
-        sequence = sequence[:end] + ']' + sequence[end:]
-        sequence = sequence[:start] + '[' + sequence[start:]
-    return sequence
-
+    return mark_intervals(sequence, orf_coords)
@@ -1,2 +1 @@
 from .palindrome_inverted import reverse_complement, find_inverted_repeats ,is_perfect_palindrome,find_perfect_palindromes
-from .palindrome_inverted_component import render_palindrome_inverted
\ No newline at end of file
@@ -1,58 +1,136 @@
+"""
+Palindrome & Inverted Repeat Logic
+
+Both searches are centre expansions over the encoded sequence and its
+precomputed complement: an arm pair at distance t from a centre matches when
+base (e - 1 - t) equals the complement of base (e + spacer + t). Every centre
+is expanded at once with NumPy, and centres drop out of the active set as
+soon as they fail (a perfect palindrome) or exceed the mismatch budget (an
+inverted repeat), so the total work is proportional to the arm lengths found
+rather than to position x length x spacer.
+
+Only maximal hits are reported: one palindrome per centre, one inverted
+repeat per centre and spacer (the longest arms within the budget, starting
+and ending on a matched pair), and of the inverted repeats that span the same
+region, only the one with the shortest spacer.
+"""
+import numpy as np
+
+from biokit.encoded_sequence import COMPLEMENT_CODES, N_CODE, EncodedSequence, as_encoded
+
+_COMPLEMENT = str.maketrans("ATCG", "TAGC")
+
 def reverse_complement(seq):
-    complement = {'A': 'T', 'T': 'A', 'C': 'G', 'G': 'C'}
-    return ''.join(complement.get(base, base) for base in reversed(seq))
+    if isinstance(seq, EncodedSequence):
+        return str(seq.reverse_complement())  # cached on the encoded sequence
+    return seq.translate(_COMPLEMENT)[::-1]
 
 def is_perfect_palindrome(seq):
     return seq == reverse_complement(seq)
 
-def find_perfect_palindromes(seq, min_len=4, max_len=12):
-    n = len(seq)
-    results = []
+def _expand_arms(codes, complement, spacer, max_arm, max_mismatches):
+    """
+    For every inner left edge e (1 <= e < n - spacer): the longest arm length whose
+    first and last pairs match and which has at most max_mismatches mismatched pairs,
+    and that arm's mismatch count. Edges whose innermost pair mismatches get 0.
+    """
+    n = len(codes)
+    edges = np.arange(1, max(n - spacer, 1))
+    best_arm = np.zeros(len(edges), dtype=np.int64)
+    best_mismatches = np.zeros(len(edges), dtype=np.int64)
+
+    active = np.flatnonzero((codes[edges - 1] == complement[edges + spacer]) & (codes[edges - 1] != N_CODE))
+    best_arm[active] = 1
+    mismatches = np.zeros(len(active), dtype=np.int64)
+    t = 1
+    while active.size and t < max_arm:
+        left = edges[active] - 1 - t
+        right = edges[active] + spacer + t
+        inside = (left >= 0) & (right < n)
+        active, mismatches, left, right = active[inside], mismatches[inside], left[inside], right[inside]
+        matched = (codes[left] == complement[right]) & (codes[left] != N_CODE)
+        mismatches += ~matched
+        alive = mismatches <= max_mismatches
+        improved = matched & alive
+        best_arm[active[improved]] = t + 1
+        best_mismatches[active[improved]] = mismatches[improved]
+        active, mismatches = active[alive], mismatches[alive]
+        t += 1
+    return edges, best_arm, best_mismatches
+
+def find_perfect_palindromes(seq, min_len=4, max_len=None):
+    """
+    Finds maximal reverse-complement palindromes (one per centre).
 
-    for i in range(n):
-        for l in range(min_len, max_len + 1):
-            if i + l > n:
-                continue
-            subseq = seq[i:i + l]
-            if is_perfect_palindrome(subseq):
-                results.append({
-                    "type": "Perfect Palindrome",
-                    "sequence": subseq,
-                    "start": i + 1,
-                    "end": i + l,
-                    "length": l
-                })
+    Args:
+        seq (str | EncodedSequence): DNA sequence.
+        min_len (int): Minimum palindrome length.
+        max_len (int, optional): Longer palindromes are trimmed to this length around their centre.
+
+    Returns:
+        list[dict]: type, sequence, start (1-based), end and length, ordered by start.
+    """
+    encoded = as_encoded(seq)
+    if len(encoded) < 2:
+        return []
+    text = str(encoded)
+    max_arm = len(encoded) if max_len is None else max_len // 2
+    edges, arms, _ = _expand_arms(encoded.codes, COMPLEMENT_CODES[encoded.codes], 0, max_arm, 0)
+
+    results = []
+    keep = 2 * arms >= max(min_len, 2)
+    for edge, arm in sorted(zip((edges[keep] - arms[keep]).tolist(), arms[keep].tolist())):
+        results.append({
+            "type": "Perfect Palindrome",
+            "sequence": text[edge:edge + 2 * arm],
+            "start": edge + 1,
+            "end": edge + 2 * arm,
+            "length": 2 * arm
+        })
     return results
 
 def find_inverted_repeats(seq, min_len=4, max_len=12, max_spacer=3, max_mismatches=1):
-    n = len(seq)
-    results = []
+    """
+    Finds maximal inverted repeats: two arms that are reverse complements of each
+    other (up to max_mismatches mismatched pairs) separated by a spacer.
 
-    for i in range(n):
-        for l in range(min_len, max_len + 1):
-            for spacer in range(0, max_spacer + 1):
-                left_start = i
-                left_end = i + l
-                right_start = left_end + spacer
-                right_end = right_start + l
-
-                if right_end > n:
-                    continue
-
-                left = seq[left_start:left_end]
-                right = reverse_complement(seq[right_start:right_end])
-
-                mismatches = sum(1 for a, b in zip(left, right) if a != b)
-
-                if mismatches <= max_mismatches:
-                    results.append({
-                        "type": "Inverted Repeat",
-                        "left_arm": left,
-                        "right_arm": seq[right_start:right_end],
-                        "start": left_start + 1,
-                        "end": right_end,
-                        "length": l,
-                        "spacer": spacer,
-                        "mismatches": mismatches
-                    })
+    Args:
+        seq (str | EncodedSequence): DNA sequence.
+        min_len (int): Minimum arm length.
+        max_len (int): Maximum arm length examined.
+        max_spacer (int): Maximum spacer (loop) length.
+        max_mismatches (int): Mismatched base pairs allowed between the arms.
+
+    Returns:
+        list[dict]: type, left_arm, right_arm, start (1-based), end, length (arm),
+                    spacer and mismatches, ordered by start.
+    """
+    encoded = as_encoded(seq)
+    text = str(encoded)
+    codes = encoded.codes
+    complement = COMPLEMENT_CODES[codes]
+
+    regions = {}
+    for spacer in range(0, max_spacer + 1):
+        if len(codes) < spacer + 2:
+            break
+        edges, arms, mismatches = _expand_arms(codes, complement, spacer, max_len, max_mismatches)
+        keep = np.flatnonzero(arms >= min_len)
+        for edge, arm, count in zip(edges[keep].tolist(), arms[keep].tolist(), mismatches[keep].tolist()):
+            region = (edge - arm, edge + spacer + arm)
+            if region not in regions:  # a shorter spacer (longer arms) already covers this region
+                regions[region] = (arm, spacer, count)
+
+    results = []
+    for (start, end), (arm, spacer, count) in sorted(regions.items()):
+        results.append({
+            "type": "Inverted Repeat",
+            "left_arm": text[start:start + arm],
+            "right_arm": text[end - arm:end],
+            "start": start + 1,
+            "end": end,
+            "length": arm,
+            "spacer": spacer,
+            "mismatches": count
+        })
     return results
@@ -1,5 +1,6 @@
 import streamlit as st
 import pandas as pd
+from biokit.cache import cached_call
 from biokit2.tools.palindrome_inverted.palindrome_inverted import (
     find_perfect_palindromes, find_inverted_repeats
 )
@@ -14,6 +15,9 @@ def render_palindrome_inverted(sequence):
         - 🧬 **Inverted repeats**: left and right arms that are nearly reverse-complement with optional spacer/mismatches
         
         Such regions can form **hairpin loops** or **cruciform DNA**, impacting gene regulation and structure.
+
+        Only **maximal** hits are listed: the longest palindrome at each centre and the longest
+        arms for each inverted-repeat centre and spacer, rather than every sub-length.
         """)
 
     col1, col2 = st.columns(2)
@@ -30,7 +34,7 @@ def render_palindrome_inverted(sequence):
             return
 
         st.subheader("Perfect Palindromes")
-        palins = find_perfect_palindromes(sequence.upper(), min_len, max_len)
+        palins = cached_call(find_perfect_palindromes, sequence.upper(), min_len, max_len)
         if not palins:
             st.text("No perfect palindromes found.")
         else:
@@ -40,7 +44,7 @@ def render_palindrome_inverted(sequence):
             st.dataframe(df_palin[["sequence", "length", "Position"]], use_container_width=True)
 
         st.subheader("Inverted Repeats")
-        invr = find_inverted_repeats(sequence.upper(), min_len, max_len, max_spacer, max_mismatches)
+        invr = cached_call(find_inverted_repeats, sequence.upper(), min_len, max_len, max_spacer, max_mismatches)
         if not invr:
             st.text("No inverted repeats found.")
         else:
@@ -1,2 +1 @@
-from .primer_design import calculate_gc_content,design_optimal_primers,calculate_tm
-from .primer_design_component import render_optimal_primer_designer_tool
\ No newline at end of file
+from .primer_design import calculate_gc_content,design_optimal_primers,design_primer_pairs,primer_window_stats,calculate_tm
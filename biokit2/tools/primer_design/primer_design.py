@@ -1,39 +1,148 @@
-def calculate_tm(sequence: str) -> float:
-    """Calculate melting temperature (Tm) using Wallace Rule."""
-    a_count = sequence.count('A')
-    t_count = sequence.count('T')
-    g_count = sequence.count('G')
-    c_count = sequence.count('C')
-    return 2 * (a_count + t_count) + 4 * (g_count + c_count)
+import heapq
+from bisect import bisect_left, bisect_right
+
+import numpy as np
+
+from biokit.encoded_sequence import N_CODE, as_encoded
+from biokit.melting import tm_nn, window_tm
+
+
+def calculate_tm(sequence: str, na: float = 50.0, mg: float = 0.0) -> float:
+    """Calculate melting temperature (Tm) with the nearest-neighbor model, to 0.1 °C."""
+    return float(np.round(tm_nn(sequence, na=na, mg=mg), 1))
 
 def calculate_gc_content(sequence: str) -> float:
     gc_count = sequence.count('G') + sequence.count('C')
     return (gc_count / len(sequence)) * 100 if sequence else 0
 
-def design_optimal_primers(sequence: str, primer_length=20, tm_tolerance=2):
-    best_pair = None
-    best_tm_diff = float("inf")
-
-    for i in range(len(sequence) - primer_length * 2):
-        forward = sequence[i:i+primer_length]
-        for j in range(i + primer_length, len(sequence) - primer_length):
-            reverse = sequence[j:j+primer_length][::-1].translate(str.maketrans("ATGC", "TACG"))
-
-            tm_f = calculate_tm(forward)
-            tm_r = calculate_tm(reverse)
-            tm_diff = abs(tm_f - tm_r)
-
-            if tm_diff <= tm_tolerance and tm_diff < best_tm_diff:
-                best_tm_diff = tm_diff
-                best_pair = {
-                    "forward_primer": forward,
-                    "reverse_primer": reverse,
-                    "forward_tm": tm_f,
-                    "reverse_tm": tm_r,
-                    "forward_gc": calculate_gc_content(forward),
-                    "reverse_gc": calculate_gc_content(reverse),
-                    "forward_start": i,
-                    "reverse_start": j
-                }
-
-    return best_pair
+def primer_window_stats(sequence, primer_length: int, na: float = 50.0, mg: float = 0.0) -> dict:
+    """
+    Tm and GC% of every primer-length window of the template, from prefix sums.
+
+    Args:
+        sequence (str | EncodedSequence): Template DNA sequence.
+        primer_length (int): Primer length in bases.
+        na (float): Monovalent cation concentration (mM).
+        mg (float): Mg2+ concentration (mM).
+
+    Returns:
+        dict: NumPy arrays indexed by window start: 'tm' (nearest-neighbor, rounded
+              to 0.1 °C), 'gc' (GC %) and 'valid' (False for windows containing a
+              non-ACGT base).
+    """
+    seq = as_encoded(sequence)
+    codes = seq.codes
+    count = max(len(codes) - primer_length + 1, 0)
+    sums = {}
+    for name, mask in (("gc", (codes == 1) | (codes == 2)), ("n", codes == N_CODE)):
+        prefix = np.zeros(len(codes) + 1, dtype=np.int32)
+        np.cumsum(mask, out=prefix[1:])
+        sums[name] = prefix[primer_length:primer_length + count] - prefix[:count]
+
+    tm = window_tm(seq, primer_length, na=na, mg=mg) if count else np.zeros(0)
+    return {
+        "tm": np.round(tm, 1),
+        "gc": sums["gc"] * (100.0 / primer_length),
+        "valid": sums["n"] == 0,
+    }
+
+def design_primer_pairs(sequence, primer_length=20, tm_tolerance=2, top_n=5,
+                        gc_range=(0.0, 100.0), product_range=(None, None), na=50.0, mg=0.0, stats=None) -> list[dict]:
+    """
+    Finds the primer pairs with the closest melting temperatures.
+
+    Every window's nearest-neighbor Tm and GC% are computed once; windows outside gc_range are
+    dropped and the rest are grouped into Tm buckets holding sorted window
+    starts. Each forward candidate visits the buckets outward from its own Tm
+    until the difference exceeds the tolerance, and bisects each bucket for
+    reverse primers downstream of it within the product-size limits. A
+    bounded heap keeps the best top_n pairs and narrows the search as it fills.
+
+    Args:
+        sequence (str | EncodedSequence): Template DNA sequence.
+        primer_length (int): Length of both primers.
+        tm_tolerance (float): Maximum Tm difference between the primers (°C).
+        top_n (int): Number of pairs to return.
+        gc_range (tuple): Allowed primer GC% (inclusive).
+        product_range (tuple): (min, max) amplicon length; None leaves a side open.
+        na (float): Monovalent cation concentration for Tm (mM).
+        mg (float): Mg2+ concentration for Tm (mM).
+        stats (dict, optional): Precomputed primer_window_stats(sequence, primer_length, na, mg),
+            e.g. cached across changes of the tolerance, GC or product-size limits.
+
+    Returns:
+        list[dict]: Up to top_n pairs, ordered by Tm difference, then position.
+    """
+    seq = as_encoded(sequence)
+    n = len(seq)
+    if top_n <= 0 or n < 2 * primer_length:
+        return []
+
+    if stats is None:
+        stats = primer_window_stats(seq, primer_length, na, mg)
+    tm, gc = stats["tm"], stats["gc"]
+    candidates = np.flatnonzero(stats["valid"] & (gc >= gc_range[0]) & (gc <= gc_range[1]))
+    if not candidates.size:
+        return []
+
+    # Tm buckets: one ascending list of window starts per distinct Tm value.
+    order = np.argsort(tm[candidates], kind="stable")
+    bucket_tm, first = np.unique(tm[candidates][order], return_index=True)
+    bucket_pos = [chunk.tolist() for chunk in np.split(candidates[order], first[1:])]
+    bucket_tm = bucket_tm.tolist()
+    home = np.searchsorted(bucket_tm, tm[candidates]).tolist()
+
+    min_product, max_product = product_range
+    min_gap = primer_length if min_product is None else max(primer_length, min_product - primer_length)
+    max_gap = n if max_product is None else max_product - primer_length
+
+    worst = []  # max-heap of (-tm_diff, -forward, -reverse), size <= top_n
+    for forward, centre in zip(candidates.tolist(), home):
+        forward_tm = bucket_tm[centre]
+        left, right = centre - 1, centre
+        # Visit buckets in order of increasing Tm difference.
+        while left >= 0 or right < len(bucket_tm):
+            left_diff = forward_tm - bucket_tm[left] if left >= 0 else float("inf")
+            right_diff = bucket_tm[right] - forward_tm if right < len(bucket_tm) else float("inf")
+            if right_diff <= left_diff:
+                bucket, diff = right, right_diff
+                right += 1
+            else:
+                bucket, diff = left, left_diff
+                left -= 1
+            limit = -worst[0][0] if len(worst) == top_n else tm_tolerance
+            if diff > limit:
+                break
+            positions = bucket_pos[bucket]
+            lo = bisect_left(positions, forward + min_gap)
+            hi = bisect_right(positions, forward + max_gap, lo)
+            for reverse in positions[lo:min(hi, lo + top_n)]:
+                entry = (-diff, -forward, -reverse)
+                if len(worst) < top_n:
+                    heapq.heappush(worst, entry)
+                elif entry > worst[0]:
+                    heapq.heapreplace(worst, entry)
+                else:
+                    break
+
+    pairs = []
+    for _, forward, reverse in sorted(worst, reverse=True):
+        forward, reverse = -forward, -reverse
+        pairs.append({
+            "forward_primer": str(seq[forward:forward + primer_length]),
+            "reverse_primer": str(seq[reverse:reverse + primer_length].reverse_complement()),
+            "forward_tm": float(tm[forward]),
+            "reverse_tm": float(tm[reverse]),
+            "forward_gc": float(gc[forward]),
+            "reverse_gc": float(gc[reverse]),
+            "forward_start": forward,
+            "reverse_start": reverse,
+            "tm_diff": abs(float(tm[forward] - tm[reverse])),
+            "product_size": reverse + primer_length - forward,
+        })
+    return pairs
+
+def design_optimal_primers(sequence, primer_length=20, tm_tolerance=2, **constraints):
+    """Returns the single best pair from design_primer_pairs, or None."""
+    pairs = design_primer_pairs(sequence, primer_length, tm_tolerance, top_n=1, **constraints)
+    return pairs[0] if pairs else None
@@ -1,18 +1,13 @@
 import streamlit as st
 import matplotlib.pyplot as plt
-from .primer_design import design_optimal_primers
+from biokit.cache import cached_call
+from .primer_design import design_primer_pairs, primer_window_stats
 
 def plot_primer_binding_sites(sequence, forward_start, reverse_start, primer_length):
     fig, ax = plt.subplots(figsize=(10, 1))
-    colors = ['lightgray'] * len(sequence)
-
-    for i in range(forward_start, min(forward_start + primer_length, len(sequence))):
-        colors[i] = '#636EFA'  # Blue for forward
-
-    for i in range(reverse_start, min(reverse_start + primer_length, len(sequence))):
-        colors[i] = '#EF553B'  # Red for reverse
-
-    ax.bar(range(len(sequence)), [1]*len(sequence), color=colors, edgecolor='black', linewidth=0.2)
+    ax.axvspan(0, len(sequence), color='lightgray')
+    ax.axvspan(forward_start, forward_start + primer_length, color='#636EFA')  # Blue for forward
+    ax.axvspan(reverse_start, reverse_start + primer_length, color='#EF553B')  # Red for reverse
     ax.set_yticks([])
     ax.set_xlim(0, len(sequence))
     ax.set_xlabel("Nucleotide Position")
@@ -32,11 +27,32 @@ def render_optimal_primer_designer_tool(sequence: str):
 
     primer_len = st.slider("Primer length", min_value=16, max_value=30, value=20)
     tm_tol = st.slider("Tm difference tolerance (°C)", min_value=1, max_value=10, value=2)
+    gc_range = st.slider("Primer GC% range", min_value=0, max_value=100, value=(40, 60))
+    product_range = st.slider("Product size (bp)", min_value=2 * primer_len, max_value=max(len(sequence), 2 * primer_len + 1),
+                              value=(2 * primer_len, len(sequence)))
+    top_n = st.number_input("Number of primer pairs", min_value=1, max_value=50, value=5)
+    na_col, mg_col = st.columns(2)
+    na = na_col.number_input("Na⁺ (mM)", min_value=1.0, max_value=1000.0, value=50.0, key="primer_na")
+    mg = mg_col.number_input("Mg²⁺ (mM)", min_value=0.0, max_value=20.0, value=0.0, step=0.5, key="primer_mg")
+
+    # Per-window Tm/GC only depend on the length and salts; the other sliders reuse them.
+    stats = cached_call(primer_window_stats, sequence, primer_len, na, mg)
+    pairs = design_primer_pairs(sequence, primer_length=primer_len, tm_tolerance=tm_tol, top_n=int(top_n),
+                                gc_range=gc_range, product_range=product_range, na=na, mg=mg, stats=stats)
 
-    result = design_optimal_primers(sequence, primer_length=primer_len, tm_tolerance=tm_tol)
+    if pairs:
+        st.success(f"✅ {len(pairs)} primer pair(s) designed.")
+        st.dataframe([{
+            "Forward (5'→3')": pair["forward_primer"],
+            "Reverse (5'→3')": pair["reverse_primer"],
+            "Fwd Tm": pair["forward_tm"],
+            "Rev Tm": pair["reverse_tm"],
+            "ΔTm": pair["tm_diff"],
+            "Product (bp)": pair["product_size"],
+        } for pair in pairs])
 
-    if result:
-        st.success("✅ Primer pair successfully designed.")
+        choice = st.selectbox("Show primer pair", range(len(pairs)), format_func=lambda i: f"Pair {i + 1}")
+        result = pairs[choice]
         st.code(f"Forward Primer: 5' - {result['forward_primer']} - 3'\n"
                 f"Reverse Primer: 5' - {result['reverse_primer']} - 3'")
 
@@ -0,0 +1 @@
+from .pwm_logic import PositionWeightMatrix, parse_jaspar, scan_pwms, score_sequence
@@ -0,0 +1,56 @@
+import streamlit as st
+import pandas as pd
+from biokit.cache import cached_call
+from biokit2.data.pwm_data import EXAMPLE_MATRICES
+from biokit2.tools.pwm_scanner.pwm_logic import parse_jaspar, scan_pwms
+
+@st.cache_resource
+def _load_matrices(text: str):
+    return parse_jaspar(text)
+
+def render_pwm_scanner(sequence):
+    st.header("🧮 PWM Scanner")
+
+    with st.expander("About this tool"):
+        st.markdown("""
+        Scores **position weight matrices** (JASPAR format) at every position of both strands
+        and reports sites whose log-odds score passes a **p-value** threshold computed from
+        each matrix's exact score distribution under a uniform background.
+        """)
+
+    uploaded = st.file_uploader("Upload JASPAR matrices (optional)", type=["jaspar", "txt", "pfm"])
+    text = uploaded.getvalue().decode("utf-8", errors="replace") if uploaded else EXAMPLE_MATRICES
+    try:
+        matrices = _load_matrices(text)
+    except ValueError as e:
+        st.error(f"Could not read matrices: {e}")
+        return
+
+    names = [matrix.name for matrix in matrices]
+    selected = st.multiselect("Matrices", names, default=names)
+    col1, col2 = st.columns(2)
+    with col1:
+        exponent = st.slider("p-value threshold (10^-x)", 2, 8, 4)
+    with col2:
+        both_strands = st.checkbox("Scan both strands", value=True)
+
+    if not sequence:
+        st.warning("Please input a DNA sequence.")
+        return
+    chosen = [matrix for matrix in matrices if matrix.name in selected]
+    sites = cached_call(scan_pwms, sequence, chosen, pvalue=10 ** -exponent, both_strands=both_strands)
+
+    summary = pd.DataFrame([{"Matrix": m.name, "Length": len(m), "Consensus": m.consensus,
+                             "Max score": round(m.max_score, 2), "Threshold": round(m.threshold(10 ** -exponent), 2)}
+                            for m in chosen])
+    st.dataframe(summary, hide_index=True)
+
+    if not sites:
+        st.info("No sites pass the threshold.")
+        return
+    st.success(f"✅ Found {len(sites)} sites.")
+    df = pd.DataFrame(sites)
+    df["start"] += 1
+    df = df[["matrix", "start", "end", "strand", "score", "pvalue", "match"]]
+    df.columns = ["Matrix", "Start", "End", "Strand", "Score", "p-value", "Site"]
+    st.dataframe(df, hide_index=True)
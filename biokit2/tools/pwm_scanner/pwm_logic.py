@@ -0,0 +1,228 @@
+"""
+Position Weight Matrix Scanner Logic
+
+Scores JASPAR-style position frequency matrices at every position of a DNA
+sequence on both strands.
+
+Counts are converted to log2-odds against a background distribution. For
+scoring, the matrix is cut into blocks of up to four columns and each block
+is precomputed as a 256-entry table indexed by 4-mer code; the sequence's
+q-mer codes are computed once and shared by all matrices, so scoring a
+matrix of length L costs ceil(L / 4) NumPy gathers per strand.
+
+Score thresholds come from p-values: log-odds are rounded to 0.01 bits, and
+the exact score distribution of each matrix under the background is computed
+once by dynamic programming over those integer steps and cached on the matrix.
+
+Biological Significance:
+PWMs capture the base preferences of transcription factor binding sites,
+which consensus strings and IUPAC motifs can only approximate.
+"""
+import re
+
+import numpy as np
+
+from biokit.encoded_sequence import as_encoded
+from biokit.kmers import kmer_codes
+
+BLOCK = 4
+SCORE_RESOLUTION = 0.01  # bits per step of the discretised score distribution
+UNIFORM_BACKGROUND = (0.25, 0.25, 0.25, 0.25)
+
+_ROW = re.compile(r"^\s*([ACGT])?\s*\[?\s*([-\d.\s]+?)\s*\]?\s*$")
+
+
+def _block_tables(log_odds: np.ndarray) -> list[np.ndarray]:
+    """Per block of up to BLOCK columns: summed scores indexed by q-mer code (last entry = N)."""
+    tables = []
+    for first in range(0, log_odds.shape[1], BLOCK):
+        block = log_odds[:, first:first + BLOCK]
+        q = block.shape[1]
+        codes = np.arange(4 ** q)
+        table = np.zeros(4 ** q + 1, dtype=np.float64)
+        for t in range(q):
+            table[:-1] += block[(codes >> (2 * (q - 1 - t))) & 3, t]
+        table[-1] = block.min(axis=0).sum()  # a block containing N scores its column minima
+        tables.append(table.astype(np.float32))
+    return tables
+
+
+class PositionWeightMatrix:
+    """
+    A position weight matrix built from a 4 x L count (or frequency) matrix.
+
+    Args:
+        name (str): Matrix identifier.
+        counts (array-like): Rows A, C, G, T; one column per motif position.
+        background (tuple): Background base frequencies (A, C, G, T).
+        pseudocount (float): Total pseudocount added per column, split by background.
+        description (str): Free text from the matrix header.
+    """
+
+    def __init__(self, name: str, counts, background=UNIFORM_BACKGROUND, pseudocount: float = 1.0, description: str = ""):
+        counts = np.asarray(counts, dtype=np.float64)
+        if counts.ndim != 2 or counts.shape[0] != 4 or counts.shape[1] == 0:
+            raise ValueError(f"Matrix '{name}' must have 4 rows (A, C, G, T) and at least one column.")
+        self.name = name
+        self.description = description
+        self.counts = counts
+        self.background = np.asarray(background, dtype=np.float64)
+
+        prior = pseudocount * self.background[:, None]
+        frequencies = (counts + prior) / (counts.sum(axis=0) + pseudocount)
+        # Rounded to the distribution's resolution so reported p-values are exact for the scores used.
+        self.log_odds = np.rint(np.log2(frequencies / self.background[:, None]) / SCORE_RESOLUTION) * SCORE_RESOLUTION
+        self.rc_log_odds = self.log_odds[::-1, ::-1]  # complement rows (A<->T, C<->G), reverse columns
+        self.tables = {"+": _block_tables(self.log_odds), "-": _block_tables(self.rc_log_odds)}
+        self._survival = None
+
+    def __len__(self) -> int:
+        return self.log_odds.shape[1]
+
+    def __repr__(self) -> str:
+        return f"PositionWeightMatrix('{self.name}', length={len(self)})"
+
+    @property
+    def consensus(self) -> str:
+        return "".join("ACGT"[i] for i in self.log_odds.argmax(axis=0))
+
+    @property
+    def max_score(self) -> float:
+        return float(self.log_odds.max(axis=0).sum())
+
+    def _distribution(self):
+        """(offset, survival): survival[i] = P(score >= (i + offset) * resolution) under the background."""
+        if self._survival is None:
+            steps = np.rint(self.log_odds / SCORE_RESOLUTION).astype(np.int64)
+            lows = steps.min(axis=0)
+            density = np.ones(1)
+            for column in range(steps.shape[1]):
+                shifts = steps[:, column] - lows[column]
+                grown = np.zeros(len(density) + shifts.max())
+                for base in range(4):
+                    grown[shifts[base]:shifts[base] + len(density)] += self.background[base] * density
+                density = grown
+            self._survival = (int(lows.sum()), np.cumsum(density[::-1])[::-1])
+        return self._survival
+
+    def threshold(self, pvalue: float) -> float:
+        """Lowest score whose background p-value (P(score >= threshold)) is at most pvalue."""
+        offset, survival = self._distribution()
+        passing = np.flatnonzero(survival <= pvalue)
+        index = passing[0] if passing.size else len(survival)
+        return (index + offset) * SCORE_RESOLUTION
+
+    def pvalue(self, scores) -> np.ndarray:
+        """Background p-values of the given scores."""
+        offset, survival = self._distribution()
+        index = np.rint(np.asarray(scores, dtype=np.float64) / SCORE_RESOLUTION).astype(np.int64) - offset
+        padded = np.append(survival, 0.0)
+        return padded[np.clip(index, 0, len(survival))]
+
+
+def parse_jaspar(text: str, background=UNIFORM_BACKGROUND, pseudocount: float = 1.0) -> list[PositionWeightMatrix]:
+    """
+    Parses matrices in JASPAR format ('>ID name' header, then rows A, C, G, T,
+    with or without the base labels and brackets). A file with no header is
+    read as a single matrix.
+
+    Returns:
+        list[PositionWeightMatrix]: Matrices in file order.
+    """
+    matrices = []
+    header, rows = None, []
+
+    def flush():
+        if header is None and not rows:
+            return
+        if len(rows) != 4:
+            raise ValueError(f"Matrix '{header or 'unnamed'}' has {len(rows)} rows; expected 4 (A, C, G, T).")
+        if len({len(row) for row in rows}) != 1:
+            raise ValueError(f"Matrix '{header or 'unnamed'}' has rows of different lengths.")
+        name, _, description = (header or f"matrix_{len(matrices) + 1}").partition(" ")
+        matrices.append(PositionWeightMatrix(name, rows, background, pseudocount, description.strip()))
+
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        if line.startswith(">"):
+            flush()
+            header, rows = line[1:].strip(), []
+            continue
+        match = _ROW.match(line)
+        if not match:
+            raise ValueError(f"Cannot parse matrix row: '{line.strip()}'.")
+        rows.append([float(value) for value in match.group(2).split()])
+    flush()
+    return matrices
+
+
+def _qmer_codes(sequence) -> dict[int, np.ndarray]:
+    """q-mer codes (q = 1..BLOCK, N-containing windows = 4**q) shared by every matrix."""
+    codes = as_encoded(sequence).codes
+    return {q: kmer_codes(codes, q, keep_invalid=True).astype(np.int64) for q in range(1, BLOCK + 1)}
+
+
+def _score(qmers: dict, tables: list[np.ndarray], length: int, count: int) -> np.ndarray:
+    scores = np.zeros(count, dtype=np.float32)
+    for block, table in enumerate(tables):
+        first = block * BLOCK
+        q = min(BLOCK, length - first)
+        scores += table[qmers[q][first:first + count]]
+    return scores
+
+
+def score_sequence(sequence, matrix: PositionWeightMatrix, strand: str = "+") -> np.ndarray:
+    """
+    Log-odds score of the matrix at every window start of the sequence.
+
+    Args:
+        strand (str): "+" scores the matrix, "-" its reverse complement
+                      (a binding site on the reverse strand at the same window).
+    """
+    count = len(sequence) - len(matrix) + 1
+    if count <= 0:
+        return np.zeros(0, dtype=np.float32)
+    return _score(_qmer_codes(sequence), matrix.tables[strand], len(matrix), count)
+
+
+def scan_pwms(sequence, matrices, pvalue: float = 1e-4, both_strands: bool = True) -> list[dict]:
+    """
+    Scans a sequence with many matrices and reports sites passing a p-value threshold.
+
+    Args:
+        sequence (str | EncodedSequence): DNA sequence.
+        matrices (iterable of PositionWeightMatrix): Matrices to scan.
+        pvalue (float): Background p-value cutoff for reporting a site.
+        both_strands (bool): Also score the reverse strand.
+
+    Returns:
+        list[dict]: Sites ordered by start, each with matrix, start, end (0-based,
+            end exclusive), strand, score, pvalue and match (read on its strand).
+    """
+    seq = as_encoded(sequence)
+    text = str(seq)
+    qmers = _qmer_codes(seq)
+    strands = ("+", "-") if both_strands else ("+",)
+    complement = str.maketrans("ACGTN", "TGCAN")
+
+    sites = []
+    for matrix in matrices:
+        count = len(seq) - len(matrix) + 1
+        if count <= 0:
+            continue
+        cutoff = matrix.threshold(pvalue) - SCORE_RESOLUTION / 2
+        for strand in strands:
+            scores = _score(qmers, matrix.tables[strand], len(matrix), count)
+            starts = np.flatnonzero(scores >= cutoff)
+            if not starts.size:
+                continue
+            hit_scores = scores[starts].astype(np.float64)
+            for start, score, p in zip(starts.tolist(), hit_scores.tolist(), matrix.pvalue(hit_scores).tolist()):
+                match = text[start:start + len(matrix)]
+                if strand == "-":
+                    match = match.translate(complement)[::-1]
+                sites.append({"matrix": matrix.name, "start": start, "end": start + len(matrix), "strand": strand,
+                              "score": round(score, 3), "pvalue": p, "match": match})
+    sites.sort(key=lambda site: (site["start"], site["matrix"], site["strand"]))
+    return sites
@@ -1,2 +1 @@
-from .restriction_component import render_restriction_mapper
-from .restriction_logic import find_restriction_sites
\ No newline at end of file
+from .restriction_logic import find_restriction_sites
@@ -10,7 +10,9 @@ def render_restriction_mapper(sequence):
     with st.expander("About this tool"):
         st.markdown("""
         Identifies known **restriction enzyme sites** within the input DNA sequence.  
-        Useful for **cloning strategies**, **plasmid mapping**, and **genome analysis**.
+        Useful for **cloning strategies**, **plasmid mapping**, and **genome analysis**.  
+        Degenerate (IUPAC) sites and reverse-strand matches of asymmetric sites are included;
+        **Cuts After** is the top-strand base after which the enzyme cuts.
         """)
 
     selected_enzymes = st.multiselect("Select Enzymes", options=restriction_enzymes.keys(), default=list(restriction_enzymes.keys())[:4])
@@ -29,11 +31,13 @@ def render_restriction_mapper(sequence):
                 # Flatten data for table
                 table_data = []
                 for item in result:
-                    for pos in item["positions"]:
+                    for pos, cut, strand in zip(item["positions"], item["cut_positions"], item["strands"]):
                         table_data.append({
                             "Enzyme": item["enzyme"],
                             "Site": item["site"],
-                            "Position": pos
+                            "Position": pos,
+                            "Cuts After": cut,
+                            "Strand": strand
                         })
 
                 df = pd.DataFrame(table_data)
@@ -44,7 +48,7 @@ def render_restriction_mapper(sequence):
                 chart = alt.Chart(df).mark_circle(size=100).encode(
                     x=alt.X("Position:Q", title="Sequence Position"),
                     y=alt.Y("Enzyme:N", title="Enzyme"),
-                    tooltip=["Enzyme", "Site", "Position"]
+                    tooltip=["Enzyme", "Site", "Position", "Cuts After", "Strand"]
                 ).properties(
                     title="Restriction Site Positions",
                     height=300
@@ -1,24 +1,255 @@
-from biokit2.data.restriction_enzyme import restriction_enzymes
+"""
+Restriction Site Mapper Logic
 
-def find_restriction_sites(sequence, selected_enzymes):
-    results = []
+Sites are found by filter-and-verify over the encoded sequence. Each site
+contributes its most specific N-free stretch as an anchor, expanded to the
+concrete k-mers it stands for and stored as 2-bit codes (as in biokit.kmers).
+The sites are grouped by anchor length, so one vectorised pass per length and
+a lookup in that length's dense code table find every candidate, whatever
+the number of enzymes. Candidates are then verified
+against the full site with per-base IUPAC masks, all at once per group.
+Reverse-strand sites are found in the same pass by also indexing the anchors
+of each non-palindromic site's reverse complement.
 
-    for enzyme, site in restriction_enzymes.items():
-        if enzyme not in selected_enzymes:
-            continue
+The sequence is processed in blocks, so memory stays bounded on whole
+chromosomes, and the compiled anchor index is cached at module level, so it
+is built once per process and reused across Streamlit reruns.
+"""
+import re
+from functools import lru_cache
+from itertools import product
+
+import numpy as np
+
+from biokit.encoded_sequence import N_CODE, as_encoded
+from biokit.iupac import IUPAC_BASES, IUPAC_MASKS as _IUPAC_MASKS, reverse_complement_iupac
+from biokit2.data.restriction_enzyme import RESTRICTION_ENZYME_SITES, restriction_enzymes
+
+_CODE_BITS = np.array([1, 2, 4, 8, 0], dtype=np.uint8)  # base code -> IUPAC bit (N matches nothing)
+_MAX_ANCHOR_VARIANTS = 64
+_MAX_ANCHOR_LENGTH = 10  # anchor codes index dense tables of 4**length entries
+_BLOCK_SIZE = 1 << 22
+_REBASE_PATTERN = re.compile(r"^(?P<site>[A-Z^]+)(?:\((?P<top>-?\d+)/(?P<bottom>-?\d+)\))?$")
+
+
+def parse_rebase_site(notation: str) -> tuple[str, int, int]:
+    """
+    Parses REBASE cut notation into a site and its cut offsets.
+
+    Args:
+        notation (str): e.g. "G^AATTC" or "GGTCTC(1/5)".
+
+    Returns:
+        tuple: (site, top_cut, bottom_cut) where the cuts are offsets from the
+               first base of the site along the top strand.
+    """
+    match = _REBASE_PATTERN.match(notation.upper())
+    if not match:
+        raise ValueError(f"Invalid REBASE site notation '{notation}'.")
+    raw = match.group("site")
+    site = raw.replace("^", "")
+    if match.group("top") is not None:
+        return site, len(site) + int(match.group("top")), len(site) + int(match.group("bottom"))
+    top = raw.index("^") if "^" in raw else len(site)
+    return site, top, len(site) - top
+
+
+def _choose_anchor(site: str) -> tuple[int, int]:
+    """Picks the longest N-free window of the site whose expansion stays small."""
+    best = (0, 1, 0)  # (length, -variants, offset)
+    for start in range(len(site)):
+        variants = 1
+        for end in range(start, min(len(site), start + _MAX_ANCHOR_LENGTH)):
+            variants *= len(IUPAC_BASES[site[end]])
+            if site[end] == "N" or variants > _MAX_ANCHOR_VARIANTS:
+                break
+            best = max(best, (end - start + 1, -variants, start))
+    length, _, offset = best
+    if length == 0:
+        raise ValueError(f"Site '{site}' has no specific bases to anchor on.")
+    return offset, length
+
+
+def _kmer_code(kmer) -> int:
+    code = 0
+    for base in kmer:
+        code = code << 2 | "ACGT".index(base)
+    return code
+
+
+class RestrictionMatcher:
+    """
+    Anchor index over a set of restriction sites.
+
+    For every anchor length it keeps a dense table from anchor code to the
+    patterns with that anchor (CSR form, as several patterns can share one);
+    the full patterns are kept as a padded matrix of IUPAC masks (0 past a
+    pattern's end) for verification.
+    """
+
+    def __init__(self, enzyme_sites: dict[str, str]):
+        self.patterns = []  # (enzyme, site, strand, pattern matched on the top strand, cut offset)
+        for enzyme, notation in enzyme_sites.items():
+            site, top_cut, bottom_cut = parse_rebase_site(notation)
+            self.patterns.append((enzyme, site, "+", site, top_cut))
+            rc_site = reverse_complement_iupac(site)
+            if rc_site != site:
+                # The enzyme's top strand is our bottom strand, so its bottom-strand
+                # cut lands on our top strand mirrored across the site.
+                self.patterns.append((enzyme, site, "-", rc_site, len(site) - bottom_cut))
 
-        cut_positions = []
-        index = sequence.find(site)
-        while index != -1:
-            cut_positions.append(index + 1)  
-            index = sequence.find(site, index + 1)
+        anchors = {}  # anchor length -> {(code, pattern_id)}
+        self.offsets = np.zeros(len(self.patterns), dtype=np.int64)
+        for pattern_id, (_, _, _, pattern, _) in enumerate(self.patterns):
+            offset, length = _choose_anchor(pattern)
+            self.offsets[pattern_id] = offset
+            anchor = pattern[offset:offset + length]
+            anchors.setdefault(length, set()).update(
+                (_kmer_code(kmer), pattern_id) for kmer in product(*(IUPAC_BASES[code] for code in anchor)))
 
-        if cut_positions:
-            results.append({
-                "enzyme": enzyme,
-                "site": site,
-                "positions": cut_positions,
-                "count": len(cut_positions)
-            })
+        self.groups = {}  # anchor length -> (patterns per code, CSR bounds indexed by code, pattern ids)
+        for length, pairs in anchors.items():
+            codes, pattern_ids = np.array(sorted(pairs), dtype=np.int64).reshape(-1, 2).T
+            bounds = np.searchsorted(codes, np.arange(4 ** length + 1))
+            self.groups[length] = (np.diff(bounds).astype(np.uint16), bounds, pattern_ids)
 
+        self.lengths = np.array([len(entry[3]) for entry in self.patterns], dtype=np.int64)
+        self.cuts = np.array([entry[4] for entry in self.patterns], dtype=np.int64)
+        self.enzymes = [entry[0] for entry in self.patterns]
+        self.masks = np.zeros((len(self.patterns), int(self.lengths.max(initial=0))), dtype=np.uint8)
+        for pattern_id, entry in enumerate(self.patterns):
+            self.masks[pattern_id, :len(entry[3])] = [_IUPAC_MASKS[code] for code in entry[3]]
+
+    def _block_candidates(self, block: np.ndarray):
+        """
+        (window start, pattern id) for every anchor hit in a block of codes.
+
+        The 2-bit codes of all windows are extended one base at a time, so each
+        anchor length costs one shift-or and one table lookup per position;
+        windows containing N are dropped with a running count of N codes.
+        """
+        n_before = np.concatenate(([0], np.cumsum(block == N_CODE)))
+        bases = block & np.uint8(3)
+        windows = np.zeros(len(block), dtype=np.uint32)  # anchors are short enough for 32-bit codes
+        found_starts, found_ids = [], []
+        for length in range(1, max(self.groups, default=0) + 1):
+            count = len(block) - length + 1
+            if count <= 0:
+                break
+            windows = windows[:count]
+            windows <<= 2
+            windows |= bases[length - 1:]
+            if length not in self.groups:
+                continue
+            per_code, bounds, pattern_ids = self.groups[length]
+            positions = np.flatnonzero(per_code[windows])
+            positions = positions[n_before[positions + length] == n_before[positions]]
+            first, hits = bounds[windows[positions]], per_code[windows[positions]].astype(np.int64)
+            # Expand each hit window into the patterns sharing its anchor code.
+            first = np.repeat(first - np.cumsum(hits) + hits, hits)
+            found_starts.append(np.repeat(positions, hits))
+            found_ids.append(pattern_ids[first + np.arange(len(first))])
+        if not found_starts:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+        return np.concatenate(found_starts), np.concatenate(found_ids)
+
+    def matches(self, sequence, enzymes=None) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Every verified site as parallel arrays.
+
+        Args:
+            sequence (str | EncodedSequence): DNA sequence; bases other than A/C/G/T never match.
+            enzymes (set of str, optional): Restrict reporting to these enzymes.
+
+        Returns:
+            tuple: (site starts, pattern ids) ordered by start, then pattern;
+                   pattern ids index self.patterns.
+        """
+        codes = as_encoded(sequence).codes
+        n = len(codes)
+        wanted = np.array([enzymes is None or enzyme in enzymes for enzyme in self.enzymes], dtype=bool)
+        overlap = self.masks.shape[1] - 1
+        found_starts, found_ids = [], []
+        for block_start in range(0, n, _BLOCK_SIZE):
+            block_end = min(block_start + _BLOCK_SIZE, n)
+            block = codes[block_start:min(block_end + overlap, n)]
+            positions, ids = self._block_candidates(block)
+            starts = positions - self.offsets[ids]
+            keep = (wanted[ids] & (starts >= 0) & (starts < block_end - block_start)
+                    & (block_start + starts + self.lengths[ids] <= n))
+            starts, ids = starts[keep], ids[keep]
+            bits = np.concatenate((_CODE_BITS[block], np.zeros(overlap + 1, dtype=np.uint8)))
+            masks = self.masks[ids]
+            verified = np.ones(len(ids), dtype=bool)
+            for j in range(masks.shape[1]):
+                verified &= ((bits[starts + j] & masks[:, j]) != 0) | (masks[:, j] == 0)
+            found_starts.append(starts[verified] + block_start)
+            found_ids.append(ids[verified])
+        if not found_starts:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+        starts, ids = np.concatenate(found_starts), np.concatenate(found_ids)
+        order = np.lexsort((ids, starts))
+        return starts[order], ids[order]
+
+    def scan(self, sequence, enzymes=None):
+        """
+        Yields (enzyme, site, strand, site_start, cut) for every verified site.
+
+        Args:
+            sequence (str | EncodedSequence): DNA sequence; bases other than A/C/G/T never match.
+            enzymes (set of str, optional): Restrict reporting to these enzymes.
+
+        Yields:
+            tuple: Ordered by site_start (0-based); cut is the number of top-strand
+                   bases left of the top-strand cut (may fall outside the site).
+        """
+        starts, ids = self.matches(sequence, enzymes)
+        for start, pattern_id in zip(starts.tolist(), ids.tolist()):
+            enzyme, site, strand, _, cut = self.patterns[pattern_id]
+            yield enzyme, site, strand, start, start + cut
+
+
+@lru_cache(maxsize=None)
+def get_restriction_matcher() -> RestrictionMatcher:
+    """Builds the anchor index for the full enzyme table once per process."""
+    return RestrictionMatcher(RESTRICTION_ENZYME_SITES)
+
+
+def find_restriction_sites(sequence, selected_enzymes):
+    """
+    Maps restriction sites of the selected enzymes on both strands in one scan.
+
+    Args:
+        sequence (str): DNA sequence (uppercase recommended).
+        selected_enzymes (iterable of str): Enzyme names from restriction_enzymes.
+
+    Returns:
+        list[dict]: One entry per enzyme with at least one site, in table order:
+            enzyme, site, positions (1-based site starts), cut_positions (cut after
+            this many top-strand bases), strands ('+'/'-' per site) and count.
+    """
+    matcher = get_restriction_matcher()
+    starts, ids = matcher.matches(sequence, set(selected_enzymes))
+    table = list(restriction_enzymes)
+    table_order = {enzyme: rank for rank, enzyme in enumerate(table)}
+    ranks = np.array([table_order.get(entry[0], -1) for entry in matcher.patterns], dtype=np.int64)[ids]
+    cuts = starts + matcher.cuts[ids]
+    reverse = np.array([entry[2] == "-" for entry in matcher.patterns], dtype=bool)[ids]
+    order = np.lexsort((reverse, cuts, starts, ranks))
+    order = order[ranks[order] >= 0]
+    ranks, starts, cuts, reverse = ranks[order], starts[order], cuts[order], reverse[order]
+
+    results = []
+    bounds = np.flatnonzero(np.diff(ranks)) + 1
+    for first, last in zip(np.concatenate(([0], bounds)).tolist(), np.append(bounds, len(ranks)).tolist()):
+        if first == last:
+            continue
+        results.append({
+            "enzyme": table[ranks[first]],
+            "site": matcher.patterns[ids[order[first]]][1],
+            "positions": (starts[first:last] + 1).tolist(),
+            "cut_positions": cuts[first:last].tolist(),
+            "strands": np.where(reverse[first:last], "-", "+").tolist(),
+            "count": last - first,
+        })
     return results
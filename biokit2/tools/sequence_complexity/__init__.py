@@ -1,2 +1 @@
-from .seq_complexity_component import render_sequence_complexity_tool
-from .seq_complexity import calculate_kmer_diversity,calculate_shannon_entropy,estimate_sequence_complexity,sliding_entropy_profile
\ No newline at end of file
+from .seq_complexity import calculate_kmer_diversity,calculate_shannon_entropy,estimate_sequence_complexity,sliding_entropy_profile,dust_scores,dust_mask,soft_mask
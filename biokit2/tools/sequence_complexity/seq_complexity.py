@@ -1,5 +1,12 @@
-from collections import Counter
+from collections import Counter, defaultdict
 import math
+import numpy as np
+from biokit.encoded_sequence import as_encoded
+from biokit.kmers import count_kmers, kmer_codes
+
+DUST_WINDOW = 64
+DUST_THRESHOLD = 2.0  # dustmasker's default level 20, expressed per triplet pair
+BATCH_MAX_ALPHABET = 4 ** 3 + 1  # the batch path makes one pass per distinct symbol: up to 3-mers (plus N)
 
 def calculate_shannon_entropy(sequence: str) -> float:
     length = len(sequence)
@@ -9,28 +16,167 @@ def calculate_shannon_entropy(sequence: str) -> float:
     entropy = -sum((count / length) * math.log2(count / length) for count in freq.values())
     return round(entropy, 4)
 
-def calculate_kmer_diversity(sequence: str, k: int) -> float:
+def calculate_kmer_diversity(sequence, k: int, canonical: bool = False) -> float:
     if len(sequence) < k:
         return 0.0
-    kmer_counts = Counter(sequence[i:i+k] for i in range(len(sequence) - k + 1))
-    total_kmers = sum(kmer_counts.values())
-    diversity = len(kmer_counts) / total_kmers if total_kmers else 0
+    kmer_counts = count_kmers(sequence, k, canonical=canonical)  # dense array for k <= 12, dict above
+    if isinstance(kmer_counts, dict):
+        distinct, total_kmers = len(kmer_counts), sum(kmer_counts.values())
+    else:
+        distinct, total_kmers = int(np.count_nonzero(kmer_counts)), int(kmer_counts.sum())
+    diversity = distinct / total_kmers if total_kmers else 0
     return round(diversity, 4)
 
-def estimate_sequence_complexity(sequence: str, k: int = 3) -> dict:
+def estimate_sequence_complexity(sequence: str, k: int = 3, canonical: bool = False) -> dict:
     entropy = calculate_shannon_entropy(sequence)
-    diversity = calculate_kmer_diversity(sequence, k)
+    diversity = calculate_kmer_diversity(sequence, k, canonical)
     return {
         "shannon_entropy": entropy,
         "kmer_diversity": diversity,
     }
 
-def sliding_entropy_profile(sequence: str, window_size: int = 20, step: int = 5):
-    entropies = []
-    positions = []
-    for i in range(0, len(sequence) - window_size + 1, step):
-        window = sequence[i:i+window_size]
-        entropy = calculate_shannon_entropy(window)
-        entropies.append(entropy)
-        positions.append(i + window_size // 2)
-    return positions, entropies
+def _symbol_codes(sequence, k: int):
+    """Per-position symbol codes: bases (N = 4) for k=1, k-mer codes (N-containing = 4**k) otherwise."""
+    codes = as_encoded(sequence).codes
+    if k == 1:
+        return codes.astype(np.int64), 5
+    return kmer_codes(codes, k, keep_invalid=True).astype(np.int64), 4 ** k + 1
+
+def _windowed_sum(symbols, alphabet: int, span: int, step: int, table, method: str):
+    """
+    Returns sum(table[count of s]) over the symbols s of every window of `span`
+    symbols, for windows starting every `step` symbols.
+
+    "incremental" slides one window, updating per-symbol counts and the running
+    sum in O(1) per symbol entering or leaving; "batch" does all windows at once
+    with NumPy, one symbol at a time: a cumulative count of that symbol gives its
+    count in every window as one subtraction. Only one cumulative-count buffer is
+    held at a time; "auto" picks "batch" for alphabets up to BATCH_MAX_ALPHABET.
+    """
+    n_windows = (len(symbols) - span) // step + 1 if len(symbols) >= span else 0
+    if n_windows <= 0:
+        return np.zeros(0)
+    if method == "auto":
+        method = "batch" if alphabet <= BATCH_MAX_ALPHABET else "incremental"
+
+    if method == "batch":
+        totals = np.zeros(n_windows)
+        cumulative = np.zeros(len(symbols) + 1, dtype=np.int32)
+        starts = slice(0, (n_windows - 1) * step + 1, step)
+        ends = slice(span, span + (n_windows - 1) * step + 1, step)
+        for symbol in np.unique(symbols).tolist():
+            np.cumsum(symbols == symbol, dtype=np.int32, out=cumulative[1:])
+            totals += table[cumulative[ends] - cumulative[starts]]
+        return totals
+
+    table = table.tolist()
+    symbols = symbols.tolist()
+    counts = [0] * alphabet if alphabet <= 1 << 16 else defaultdict(int)
+    totals = np.empty(n_windows)
+    running = 0.0
+    prev_start = 0
+    for s in symbols[:span]:
+        c = counts[s]
+        running += table[c + 1] - table[c]
+        counts[s] = c + 1
+    totals[0] = running
+
+    for w in range(1, n_windows):
+        start = w * step
+        for s in symbols[prev_start:min(start, prev_start + span)]:  # leaving the window
+            c = counts[s]
+            running += table[c - 1] - table[c]
+            counts[s] = c - 1
+        for s in symbols[max(prev_start + span, start):start + span]:  # entering the window
+            c = counts[s]
+            running += table[c + 1] - table[c]
+            counts[s] = c + 1
+        totals[w] = running
+        prev_start = start
+    return totals
+
+def sliding_entropy_profile(sequence, window_size: int = 20, step: int = 5, k: int = 1, method: str = "auto"):
+    """
+    Shannon entropy (bits) of every sliding window, computed without re-counting windows.
+
+    With per-window symbol counts c and n symbols per window, entropy is
+    log2(n) - sum(c*log2(c)) / n; c*log2(c) comes from a precomputed table.
+
+    Args:
+        sequence (str | EncodedSequence): DNA sequence.
+        window_size (int): Window length in bases.
+        step (int): Distance between window starts in bases.
+        k (int): Entropy over overlapping k-mers instead of single bases.
+        method (str): "incremental", "batch" (NumPy) or "auto" (batch for small alphabets).
+
+    Returns:
+        tuple: (window centre positions, entropies) as NumPy arrays.
+    """
+    symbols, alphabet = _symbol_codes(sequence, k)
+    span = window_size - k + 1
+    if span <= 0 or len(symbols) < span:
+        return np.zeros(0, dtype=np.int64), np.zeros(0)
+
+    counts = np.arange(span + 1, dtype=np.float64)
+    plogp = np.zeros(span + 1)
+    plogp[1:] = counts[1:] * np.log2(counts[1:])
+
+    totals = _windowed_sum(symbols, alphabet, span, step, plogp, method)
+    entropies = np.maximum(math.log2(span) - totals / span, 0.0)
+    positions = np.arange(len(entropies)) * step + window_size // 2
+    return positions, np.round(entropies, 4)
+
+def dust_scores(sequence, window_size: int = DUST_WINDOW, step: int = 1, method: str = "auto"):
+    """
+    DUST low-complexity score of every window: sum over triplets of c*(c-1)/2,
+    divided by (number of triplets - 1). Repetitive windows score high.
+
+    Returns:
+        tuple: (window start positions, scores) as NumPy arrays.
+    """
+    symbols, alphabet = _symbol_codes(sequence, 3)
+    span = window_size - 2
+    if span <= 1 or len(symbols) < span:
+        return np.zeros(0, dtype=np.int64), np.zeros(0)
+
+    counts = np.arange(span + 1, dtype=np.float64)
+    pairs = counts * (counts - 1) / 2
+    scores = _windowed_sum(symbols, alphabet, span, step, pairs, method) / (span - 1)
+    return np.arange(len(scores)) * step, scores
+
+def dust_mask(sequence, window_size: int = DUST_WINDOW, threshold: float = DUST_THRESHOLD, scores=None) -> list[tuple[int, int]]:
+    """
+    Finds low-complexity regions with a windowed DUST filter.
+
+    Args:
+        sequence (str | EncodedSequence): DNA sequence.
+        window_size (int): DUST window length (64 as in dustmasker).
+        threshold (float): Windows scoring above this are masked.
+        scores (tuple, optional): Precomputed dust_scores(sequence, window_size), so
+            that changing the threshold does not rescore the windows.
+
+    Returns:
+        list[tuple[int, int]]: Merged (start, end) intervals, 0-based, end exclusive.
+    """
+    starts, scores = scores if scores is not None else dust_scores(sequence, window_size)
+    n = len(sequence)
+    cover = np.zeros(n + 1, dtype=np.int32)
+    hot = starts[scores > threshold]
+    np.add.at(cover, hot, 1)
+    np.add.at(cover, np.minimum(hot + window_size, n), -1)
+    masked = np.cumsum(cover[:n]) > 0
+
+    edges = np.flatnonzero(np.diff(np.concatenate(([False], masked, [False])).astype(np.int8)))
+    return [(int(a), int(b)) for a, b in zip(edges[::2], edges[1::2])]
+
+def soft_mask(sequence, intervals: list[tuple[int, int]]) -> str:
+    """Returns the sequence with the given intervals in lowercase."""
+    sequence = str(sequence)
+    parts = []
+    last = 0
+    for start, end in intervals:
+        parts.append(sequence[last:start])
+        parts.append(sequence[start:end].lower())
+        last = end
+    parts.append(sequence[last:])
+    return "".join(parts)
@@ -1,6 +1,12 @@
+from biokit.annotation import merge_intervals
+from biokit.cache import cached_call
+from biokit1.components.sequence_viewer import render_sequence_viewer
 from biokit2.tools.sequence_complexity.seq_complexity import (
     estimate_sequence_complexity,
-    sliding_entropy_profile
+    sliding_entropy_profile,
+    dust_scores,
+    dust_mask,
+    soft_mask
 )
 import streamlit as st
 import matplotlib.pyplot as plt
@@ -10,8 +16,9 @@ from collections import Counter
 def render_sequence_complexity_tool(sequence: str):
     st.subheader("🔍 Sequence Complexity Estimator")
 
-    k = st.slider("Select K-mer length (k)", min_value=2, max_value=6, value=3, step=1)
-    result = estimate_sequence_complexity(sequence, k)
+    k = st.slider("Select K-mer length (k)", min_value=2, max_value=12, value=3, step=1)
+    canonical = st.checkbox("Merge reverse-complement k-mers (canonical counting)", value=False)
+    result = cached_call(estimate_sequence_complexity, sequence, k, canonical)
 
     st.markdown("### 📊 Global Complexity Metrics")
     st.metric("Shannon Entropy", result["shannon_entropy"])
@@ -26,7 +33,8 @@ def render_sequence_complexity_tool(sequence: str):
     st.markdown("### 📈 Entropy Along Sequence (Sliding Window)")
     window_size = st.slider("Window size", min_value=10, max_value=100, value=30, step=5)
     step_size = st.slider("Step size", min_value=1, max_value=20, value=5, step=1)
-    positions, entropies = sliding_entropy_profile(sequence, window_size, step_size)
+    entropy_k = st.selectbox("Entropy over", [1, 2, 3], format_func=lambda v: "single bases" if v == 1 else f"{v}-mers")
+    positions, entropies = cached_call(sliding_entropy_profile, sequence, window_size, step_size, k=entropy_k)
 
     # Use Matplotlib for entropy plot
     fig, ax = plt.subplots(figsize=(6, 4))
@@ -37,6 +45,20 @@ def render_sequence_complexity_tool(sequence: str):
     ax.grid(True)
     st.pyplot(fig)
 
+    with st.expander("🧹 Low-Complexity Regions (DUST)"):
+        threshold = st.slider("DUST score threshold", min_value=1.0, max_value=5.0, value=2.0, step=0.5)
+        regions = dust_mask(sequence, threshold=threshold, scores=cached_call(dust_scores, sequence))
+        if regions:
+            masked = sum(end - start for start, end in regions)
+            st.write(f"{len(regions)} region(s), {masked} bp masked ({masked / len(sequence) * 100:.1f}%)")
+            st.dataframe([{"Start": start + 1, "End": end, "Length": end - start} for start, end in regions])
+            render_sequence_viewer(sequence, [("Low complexity (DUST)", merge_intervals(regions), "#ffcc80")], key="dust_viewer")
+            st.download_button("Download soft-masked sequence (low-complexity bases in lowercase)",
+                               cached_call(soft_mask, sequence, regions), file_name="soft_masked.txt",
+                               mime="text/plain", key="dust_download")
+        else:
+            st.write("No low-complexity regions found.")
+
     with st.expander("🔬 Base Composition"):
         base_counts = Counter(sequence)
         base_data = [base_counts.get(base, 0) for base in "ATGC"]
@@ -1,2 +1 @@
 from .splice_logic import find_splice_sites
-from .splice_component import render_splice_site_predictor
@@ -1,20 +1,26 @@
 import streamlit as st
+from biokit.annotation import sites_to_intervals
+from biokit.cache import cached_call
+from biokit1.components.sequence_viewer import render_sequence_viewer
 from .splice_logic import find_splice_sites
 
+MAX_LISTED_SITES = 5000
+
 def render_splice_site_predictor(seq):
-    donor_sites, acceptor_sites = find_splice_sites(seq)
+    donor_sites, acceptor_sites = cached_call(find_splice_sites, seq)
 
     st.subheader("🔍 Splice Site Prediction Results")
-    st.markdown(f"**Donor Sites (GT)**: {donor_sites}")
-    st.markdown(f"**Acceptor Sites (AG)**: {acceptor_sites}")
-    
-    highlighted_seq = list(seq.upper())
-    for i in donor_sites:
-        highlighted_seq[i] = f":green[{highlighted_seq[i]}]"
-        highlighted_seq[i+1] = f":green[{highlighted_seq[i+1]}]"
-    for i in acceptor_sites:
-        highlighted_seq[i] = f":blue[{highlighted_seq[i]}]"
-        highlighted_seq[i+1] = f":blue[{highlighted_seq[i+1]}]"
+    st.markdown(f"**Donor Sites (GT)**: {len(donor_sites):,}")
+    st.markdown(f"**Acceptor Sites (AG)**: {len(acceptor_sites):,}")
+    with st.expander("Site positions (0-based)"):
+        st.dataframe([{"Type": "Donor (GT)", "Position": i} for i in donor_sites[:MAX_LISTED_SITES]] +
+                     [{"Type": "Acceptor (AG)", "Position": i} for i in acceptor_sites[:MAX_LISTED_SITES]],
+                     use_container_width=True)
+        if max(len(donor_sites), len(acceptor_sites)) > MAX_LISTED_SITES:
+            st.caption(f"The first {MAX_LISTED_SITES:,} sites of each type are listed.")
 
+    # Sites become interval tracks; only the visible page is marked up
     st.markdown("**Highlighted Sequence**:")
-    st.write("".join(highlighted_seq))
+    render_sequence_viewer(seq, [("Donor (GT)", sites_to_intervals(donor_sites, 2), "#a5d6a7"),
+                                 ("Acceptor (AG)", sites_to_intervals(acceptor_sites, 2), "#90caf9")],
+                           key="splice_viewer")
@@ -0,0 +1,85 @@
+import numpy as np
+import pytest
+
+from biokit.cache import ResultCache, make_key
+from biokit.encoded_sequence import EncodedSequence
+
+
+def design(sequence, primer_length=20, gc_range=(40, 60), options=None):
+    return len(sequence), primer_length, gc_range, options
+
+
+class Matrix:
+    def __init__(self, values, name="pwm"):
+        self.values = values
+        self.name = name
+        self._lazy = None
+
+
+def test_arguments_are_bound_to_the_signature():
+    key = make_key(design, "ACGT")
+    assert make_key(design, "ACGT", 20) == key
+    assert make_key(design, "ACGT", primer_length=20) == key
+    assert make_key(design, "ACGT", gc_range=(40, 60), primer_length=20) == key
+    assert make_key(design, "ACGT", 21) != key
+
+
+def test_lists_and_tuples_share_a_key():
+    assert make_key(design, "ACGT", gc_range=[40, 60]) == make_key(design, "ACGT", gc_range=(40, 60))
+    assert make_key(design, "ACGT", options={"b": [1], "a": 2}) == make_key(design, "ACGT", options={"a": 2, "b": (1,)})
+    assert make_key(design, "ACGT", options={1, 2, 3}) == make_key(design, "ACGT", options={3, 2, 1})
+
+
+def test_numbers_keep_their_type():
+    assert make_key(design, "ACGT", np.int64(20)) == make_key(design, "ACGT", 20)
+    assert make_key(design, "ACGT", 20.0) != make_key(design, "ACGT", 20)
+    assert make_key(design, "ACGT", True) != make_key(design, "ACGT", 1.0)
+
+
+def test_arrays_are_keyed_by_content():
+    values = np.arange(12, dtype=np.float64).reshape(3, 4)
+    key = make_key(design, "ACGT", options=values)
+    assert make_key(design, "ACGT", options=values.copy()) == key
+    assert make_key(design, "ACGT", options=values.T.copy().T) == key
+    assert make_key(design, "ACGT", options=values.astype(np.float32)) != key
+    assert make_key(design, "ACGT", options=values.reshape(4, 3)) != key
+    changed = values.copy()
+    changed[2, 3] += 1
+    assert make_key(design, "ACGT", options=changed) != key
+
+
+def test_objects_are_keyed_by_public_state():
+    matrix = Matrix(np.ones((4, 6)))
+    key = make_key(design, "ACGT", options=matrix)
+    matrix._lazy = "filled cache"
+    assert make_key(design, "ACGT", options=matrix) == key
+    assert make_key(design, "ACGT", options=Matrix(np.ones((4, 6)))) == key
+    assert make_key(design, "ACGT", options=Matrix(np.ones((4, 6)), name="other")) != key
+
+
+def test_sequences_are_keyed_by_content():
+    key = make_key(design, "ACGT")
+    assert make_key(design, "ACGA") != key
+    assert make_key(design, "acgt") != key  # case matters to some tools
+    encoded = EncodedSequence("ACGTN")
+    assert make_key(design, encoded) == make_key(design, EncodedSequence("ACGTN"))
+    assert make_key(design, encoded) != make_key(design, EncodedSequence("ACGTA"))
+
+
+def test_unhashable_argument_raises():
+    with pytest.raises(TypeError):
+        make_key(design, "ACGT", options=lambda: None)
+
+
+def test_call_reuses_equivalent_calls():
+    calls = []
+
+    def tool(sequence, window=10, thresholds=(1, 2)):
+        calls.append(window)
+        return [len(sequence), window]
+
+    cache = ResultCache()
+    assert cache.call(tool, "ACGT") == cache.call(tool, "ACGT", window=10, thresholds=[1, 2]) == [4, 10]
+    assert cache.call(tool, "ACGT", 11) == [4, 11]
+    assert calls == [10, 11]
+    assert cache.hits == 1 and cache.misses == 2
@@ -0,0 +1,45 @@
+from collections import Counter
+from itertools import product
+
+import numpy as np
+import pytest
+
+from biokit.encoded_sequence import encode
+from biokit.kmers import MAX_K, decode_kmer, kmer_codes
+from biokit1.tools.calculate_codon_frequency import calculate_codon_frequency
+
+
+def _naive_codons(sequence):
+    codons = (sequence[i:i + 3] for i in range(0, len(sequence) - 2, 3))
+    return dict(Counter(codon for codon in codons if set(codon) <= set("ACGTU")))
+
+
+@pytest.mark.parametrize("sequence", ["ATGTTTAAA", "AUGUUUAAA", "AUGNNUUUUG", "ATGTT", ""])
+def test_codon_frequency_matches_naive(sequence):
+    assert calculate_codon_frequency(sequence) == _naive_codons(sequence)
+
+
+def test_codon_frequency_reads_lowercase_rna():
+    assert calculate_codon_frequency("auguuuaug") == {"AUG": 2, "UUU": 1}
+
+
+@pytest.mark.parametrize("k", [1, 3, 31])
+def test_kmer_codes_keep_invalid_sentinel(k):
+    sequence = "ACGT" * 10 + "N" + "TGCA" * 10
+    codes = kmer_codes(encode(sequence), k, keep_invalid=True)
+    assert len(codes) == len(sequence) - k + 1
+    for start, code in enumerate(codes.tolist()):
+        window = sequence[start:start + k]
+        assert code == (4 ** k if "N" in window else int("".join(str("ACGT".index(b)) for b in window), 4))
+
+
+def test_kmer_codes_keep_invalid_rejects_max_k():
+    with pytest.raises(ValueError):
+        kmer_codes(encode("A" * 40), MAX_K, keep_invalid=True)
+    assert decode_kmer(kmer_codes(encode("T" * MAX_K), MAX_K)[0], MAX_K) == "T" * MAX_K
+
+
+def test_decode_round_trip():
+    for kmer in map("".join, product("ACGT", repeat=3)):
+        assert decode_kmer(kmer_codes(encode(kmer), 3)[0], 3) == kmer
+    assert not len(kmer_codes(np.zeros(0, dtype=np.uint8), 3))
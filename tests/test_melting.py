@@ -0,0 +1,48 @@
+import math
+
+import numpy as np
+import pytest
+
+from biokit.melting import tm_nn, tm_nn_batch, window_tm
+
+
+def test_batch_matches_scalar():
+    oligos = ["ACGTACGTAA", "GCGCGC", "ATATATATATATAT", "CG"]
+    assert np.allclose(tm_nn_batch(oligos), [tm_nn(oligo) for oligo in oligos])
+
+
+@pytest.mark.parametrize("oligos", [
+    ["ACG", ""],
+    ["", "ACG"],
+    ["", ""],
+    ["A", "ACGTACGTAA", "", "T"],
+])
+def test_batch_short_oligos_are_nan(oligos):
+    tm = tm_nn_batch(oligos)
+    assert len(tm) == len(oligos)
+    for oligo, value in zip(oligos, tm):
+        if len(oligo) < 2:
+            assert math.isnan(value)
+        else:
+            assert value == pytest.approx(tm_nn(oligo))
+
+
+def test_batch_empty_input():
+    assert tm_nn_batch([]).shape == (0,)
+
+
+def test_batch_invalid_base_is_nan():
+    tm = tm_nn_batch(["ACGNT", "ACGTT"])
+    assert math.isnan(tm[0]) and not math.isnan(tm[1])
+
+
+def test_scalar_rejects_short_oligo():
+    with pytest.raises(ValueError):
+        tm_nn("A")
+
+
+def test_window_tm_matches_batch():
+    template = "ATGCGTACGTTAGCCGATAGGCTTACGATCG"
+    length = 12
+    windows = [template[i:i + length] for i in range(len(template) - length + 1)]
+    assert np.allclose(window_tm(template, length), tm_nn_batch(windows))
@@ -0,0 +1,76 @@
+import random
+
+import pytest
+
+from biokit2.tools.microsatellite_finder.microsatellite_logic import find_microsatellites
+
+
+def _is_primitive(motif):
+    return (motif + motif).find(motif, 1) == len(motif)
+
+
+def _naive_perfect_repeats(sequence, min_unit_len, max_unit_len, min_repeats):
+    """Maximal perfect repeats of every period, then the same containment sweep as the finder."""
+    candidates = []
+    for period in range(min_unit_len, max_unit_len + 1):
+        def same(i):
+            return sequence[i] == sequence[i + period] and sequence[i] != "N"
+
+        for start in range(len(sequence) - period):
+            if start > 0 and same(start - 1):
+                continue
+            end = start
+            while end + period < len(sequence) and same(end):
+                end += 1
+            copies = (end + period - start) // period
+            if end > start and copies >= min_repeats and _is_primitive(sequence[start:start + period]):
+                candidates.append((start, start + copies * period, period))
+    ordered = sorted(candidates, key=lambda c: (c[0], c[0] - c[1], c[2]))
+    kept = [c for i, c in enumerate(ordered) if not any(other[1] >= c[1] for other in ordered[:i])]
+    return sorted((start + 1, end, sequence[start:start + period]) for start, end, period in kept)
+
+
+def _random_sequence(rng):
+    alphabet = rng.choice(["ACGT", "AC", "AT", "ACGTN"])
+    parts = []
+    for _ in range(rng.randint(1, 6)):
+        if rng.random() < 0.5:
+            unit = "".join(rng.choice("ACGT") for _ in range(rng.randint(1, 6)))
+            parts.append(unit * rng.randint(2, 9))
+        else:
+            parts.append("".join(rng.choice(alphabet) for _ in range(rng.randint(0, 40))))
+    return "".join(parts)
+
+
+SETTINGS = [(2, 6, 5), (1, 4, 3), (2, 3, 2)]
+
+
+@pytest.mark.parametrize("seed", range(60))
+def test_perfect_repeats_match_naive(seed):
+    rng = random.Random(seed)
+    sequence = _random_sequence(rng)
+    settings = rng.choice(SETTINGS)
+    found = sorted((r["start"], r["end"], r["motif"]) for r in find_microsatellites(sequence, *settings))
+    assert found == _naive_perfect_repeats(sequence, *settings)
+
+
+@pytest.mark.parametrize("seed", range(60))
+@pytest.mark.parametrize("max_mismatches", [1, 2])
+def test_mismatches_stay_within_budget(seed, max_mismatches):
+    rng = random.Random(seed)
+    sequence = _random_sequence(rng)
+    min_unit_len, max_unit_len, min_repeats = rng.choice(SETTINGS)
+    for repeat in find_microsatellites(sequence, min_unit_len, max_unit_len, min_repeats, max_mismatches):
+        start, end, motif = repeat["start"] - 1, repeat["end"], repeat["motif"]
+        assert (end - start) % len(motif) == 0
+        assert repeat["repeats"] == (end - start) // len(motif) >= min_repeats
+        disagreeing = sum(base != motif[i % len(motif)] for i, base in enumerate(sequence[start:end]))
+        assert repeat["mismatches"] == disagreeing <= max_mismatches
+        assert repeat["perfect"] == (disagreeing == 0)
+
+
+def test_single_substitution_is_bridged():
+    sequence = "GC" + "CA" * 6 + "CT" + "CA" * 6 + "GG"
+    assert [(r["start"], r["end"]) for r in find_microsatellites(sequence)] == [(3, 14), (17, 28)]
+    (repeat,) = find_microsatellites(sequence, max_mismatches=1)
+    assert (repeat["motif"], repeat["start"], repeat["end"], repeat["mismatches"]) == ("CA", 3, 28, 1)
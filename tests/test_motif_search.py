@@ -0,0 +1,96 @@
+import random
+
+import pytest
+
+from biokit.iupac import IUPAC_BASES, reverse_complement_iupac
+from biokit2.tools.motif_finder.motif_logic import build_motif_index, find_approximate_motif, find_motif_sites
+
+
+def _matches(base, code):
+    return base in IUPAC_BASES[code]
+
+
+def _patterns(motif, both_strands):
+    patterns = [("+", motif)]
+    if both_strands and reverse_complement_iupac(motif) != motif:
+        patterns.append(("-", reverse_complement_iupac(motif)))
+    return patterns
+
+
+def _naive_mismatch_hits(sequence, motif, max_errors, both_strands):
+    hits = set()
+    for strand, pattern in _patterns(motif, both_strands):
+        for start in range(len(sequence) - len(pattern) + 1):
+            errors = sum(not _matches(base, code) for base, code in zip(sequence[start:], pattern))
+            if errors <= max_errors:
+                hits.add((start, start + len(pattern), strand, errors))
+    return hits
+
+
+def _edit_distance(text, pattern):
+    row = list(range(len(text) + 1))
+    for code in pattern:
+        previous, row = row, [row[0] + 1]
+        for j, base in enumerate(text, 1):
+            row.append(min(previous[j - 1] + (not _matches(base, code)), previous[j] + 1, row[j - 1] + 1))
+    return row[-1]
+
+
+def _best_end_distances(sequence, pattern):
+    """Semi-global distance of the pattern to a substring ending at every position."""
+    row = [0] * (len(sequence) + 1)
+    for i, code in enumerate(pattern, 1):
+        previous, row = row, [i]
+        for j, base in enumerate(sequence, 1):
+            row.append(min(previous[j - 1] + (not _matches(base, code)), previous[j] + 1, row[j - 1] + 1))
+    return row[1:]
+
+
+def _random_case(seed):
+    rng = random.Random(seed)
+    motif = "".join(rng.choice("ACGT" * 3 + "RYN") for _ in range(rng.randint(4, 8)))
+    sequence = "".join(rng.choice("ACGT" if seed % 4 else "ACGTN") for _ in range(rng.randint(30, 120)))
+    return sequence, motif, rng.randint(1, min(2, len(motif) - 1))
+
+
+@pytest.mark.parametrize("seed", range(40))
+@pytest.mark.parametrize("both_strands", [True, False])
+def test_mismatch_search_matches_naive(seed, both_strands):
+    sequence, motif, max_errors = _random_case(seed)
+    hits = find_approximate_motif(sequence, motif, max_errors, "mismatch", both_strands)
+    assert {(h["start"], h["end"], h["strand"], h["errors"]) for h in hits} == \
+        _naive_mismatch_hits(sequence, motif, max_errors, both_strands)
+    for hit in hits:
+        assert hit["match"] == (sequence[hit["start"]:hit["end"]] if hit["strand"] == "+"
+                                else reverse_complement_iupac(sequence[hit["start"]:hit["end"]]))
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_edit_search_matches_naive(seed):
+    sequence, motif, max_errors = _random_case(seed)
+    hits = find_approximate_motif(sequence, motif, max_errors, "edit", both_strands=False)
+    distances = _best_end_distances(sequence, motif)
+
+    # One hit per run of consecutive end positions within the budget, at the run's best end.
+    expected, run = [], None
+    for end, distance in enumerate(distances, 1):
+        if distance > max_errors:
+            run = None
+        elif run is None:
+            run = [end, distance]
+            expected.append(run)
+        elif distance < run[1]:
+            run[:] = [end, distance]
+    assert [(h["end"], h["errors"]) for h in hits] == [tuple(run) for run in expected]
+    for hit in hits:
+        assert _edit_distance(sequence[hit["start"]:hit["end"]], motif) == hit["errors"]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_exact_sites_match_naive(seed):
+    sequence, motif, _ = _random_case(seed)
+    motif = motif.replace("R", "A").replace("Y", "C").replace("N", "G")
+    index = build_motif_index(sequence)
+    sites = find_motif_sites(sequence, [motif], index=index)[motif]
+    assert {(s["start"], s["strand"]) for s in sites} == {
+        (start, strand) for start, _, strand, _ in _naive_mismatch_hits(sequence, motif, 0, True)}
@@ -0,0 +1,64 @@
+import math
+import random
+from collections import Counter
+
+import numpy as np
+import pytest
+
+from biokit2.tools.sequence_complexity.seq_complexity import dust_mask, dust_scores, sliding_entropy_profile
+
+
+def _symbols(window, k):
+    """Overlapping k-mers of a window, every k-mer with a non-ACGT base counted as one symbol."""
+    kmers = (window[i:i + k] for i in range(len(window) - k + 1))
+    return [kmer if set(kmer) <= set("ACGT") else None for kmer in kmers]
+
+
+def _naive_entropy(sequence, window_size, step, k):
+    entropies = []
+    for start in range(0, len(sequence) - window_size + 1, step):
+        counts = Counter(_symbols(sequence[start:start + window_size], k))
+        total = sum(counts.values())
+        entropies.append(-sum(c / total * math.log2(c / total) for c in counts.values()))
+    return np.array(entropies)
+
+
+def _random_sequence(seed, length=400):
+    rng = random.Random(seed)
+    bases = "".join(rng.choice("ACGTN" if seed % 3 == 0 else "ACGT") for _ in range(length))
+    return bases[:150] + "CA" * 40 + bases[150:]
+
+
+@pytest.mark.parametrize("method", ["batch", "incremental", "auto"])
+@pytest.mark.parametrize("k", [1, 2, 3])
+@pytest.mark.parametrize("window_size, step", [(10, 1), (30, 7), (64, 64)])
+def test_entropy_matches_naive(method, k, window_size, step):
+    sequence = _random_sequence(k * window_size + step)
+    positions, entropies = sliding_entropy_profile(sequence, window_size, step, k, method)
+    expected = _naive_entropy(sequence, window_size, step, k)
+    assert np.allclose(entropies, expected, atol=1e-4)
+    assert np.array_equal(positions, np.arange(len(expected)) * step + window_size // 2)
+
+
+def test_entropy_of_short_sequence_is_empty():
+    positions, entropies = sliding_entropy_profile("ACGT", window_size=10)
+    assert not len(positions) and not len(entropies)
+
+
+@pytest.mark.parametrize("method", ["batch", "incremental"])
+@pytest.mark.parametrize("seed", range(4))
+def test_dust_scores_match_naive(method, seed):
+    sequence = _random_sequence(seed)
+    starts, scores = dust_scores(sequence, window_size=64, step=3, method=method)
+    expected = []
+    for start in range(0, len(sequence) - 64 + 1, 3):
+        counts = Counter(_symbols(sequence[start:start + 64], 3))
+        expected.append(sum(c * (c - 1) / 2 for c in counts.values()) / (62 - 1))
+    assert np.allclose(scores, expected)
+    assert np.array_equal(starts, np.arange(len(expected)) * 3)
+
+
+def test_dust_masks_the_repeat():
+    sequence = _random_sequence(1)
+    ((start, end),) = [region for region in dust_mask(sequence) if region[1] - region[0] >= 80]
+    assert start <= 150 and end >= 230